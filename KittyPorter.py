@@ -1,11 +1,49 @@
-import pandas as pd
 import os
+import sys
 import json
-import xlsxwriter
-from xlsxwriter.utility import xl_rowcol_to_cell, xl_col_to_name
-import tkinter as tk
-from tkinter import filedialog
+import csv
+import html
+import re
+import glob
+import time
+import argparse
+import importlib
+import importlib.util
+import hashlib
+import base64
+import zlib
+import shutil
+import tempfile
+import contextlib
+import tracemalloc
+import sqlite3
+import select
+import signal
+import collections
+import threading
 from datetime import datetime
+from urllib.parse import urlsplit, parse_qs, quote
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+class LazyModule:
+    """Imports the module on first attribute access, so paths that never touch it don't pay for the import."""
+    def __init__(self, name):
+        self._name, self._module = name, None
+    def __getattr__(self, attr):
+        if self._module is None: self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+# Heavy dependencies (pandas alone is ~0.5 s) load on first use; tkinter only inside select_files_gui
+pd = LazyModule('pandas')
+np = LazyModule('numpy')
+xlsxwriter = LazyModule('xlsxwriter')
+xl_utility = LazyModule('xlsxwriter.utility')
+openpyxl = LazyModule('openpyxl')
+pa = LazyModule('pyarrow')
+pq = LazyModule('pyarrow.parquet')
+feather = LazyModule('pyarrow.feather')
 
 RISK_WEIGHTS = {'High': 50, 'Medium': 20, 'Low': 5, 'Passed': 0}
 CRITICAL_KEYWORDS = [
@@ -14,7 +52,48 @@ CRITICAL_KEYWORDS = [
 ]
 CRITICAL_BONUS = 50
 
+# Known HardeningKitty columns (report / finding list) and the dtypes they are loaded with.
+# Columns not listed here are never read. Repetitive columns are categoricals from the start.
+REPORT_SCHEMA = {
+    'ID': str, 'Category': 'category', 'Name': str, 'Description': str, 'Severity': 'category',
+    'Result': str, 'Recommended': str, 'TestResult': 'category', 'Method': 'category',
+}
+TEMPLATE_SCHEMA = {
+    'ID': str, 'Name': str, 'Description': str, 'Method': 'category', 'MethodArgument': str,
+    'RegistryPath': str, 'RegistryItem': str, 'RecommendedValue': str,
+}
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+DEFAULT_CACHE_DIR = os.environ.get('KITTYPORTER_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'kittyporter'))
+TEMPLATE_CACHE_VERSION = 1  # bump when the catalog layout changes
+OUTPUT_CACHE_VERSION = 1    # bump when the output cache entry layout changes
+# Fixed workbook creation date: outputs carry no build timestamp, identical inputs give identical bytes
+STABLE_CREATED = datetime(1980, 1, 1)
+
+DEFAULT_OPTIONS = {
+    'formula_mode': 'classic',  # 'lean' = bounded helper-key COUNTIFs in the Stats sheet
+    'streaming': False,         # chunked pipeline with constant-memory Excel / spooled HTML
+    'chunk_size': 50000,        # rows per chunk in streaming mode
+    'offline': False,           # inline the vendored JS/CSS into the HTML app instead of loading CDNs
+    'compress_html': False,     # dictionary-encoded, gzip + base64 findings payload in the HTML app
+    'output_cache': None,       # directory of previously generated outputs, reused when nothing changed
+    'writers': 'thread',        # run the Excel / HTML writers concurrently: 'thread', 'process' (fork) or 'serial'
+    'instrument': None,         # NDJSON log of per-stage wall / CPU time, rows and tracemalloc peak
+    'profile_dir': None,        # one cProfile dump per top-level stage and host
+    'store': None,              # SQLite findings store: every run is appended, the workbook gets a Trend sheet
+    'export': None,             # also write the enriched findings as 'parquet' or 'feather' (needs pyarrow)
+    'export_dir': None,         # ... into a host=<host>/date=<scan date> partitioned tree here instead of next to the report
+}
+
+# Pinned copies of the HTML app libraries, inlined in offline mode (see assets/README.md)
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+# FixedHeader / ColReorder aren't vendored yet, the offline page runs without them
+OFFLINE_CSS = ['jquery.dataTables.min.css']
+OFFLINE_JS = ['jquery.min.js', 'jquery.dataTables.min.js']
+
 def select_files_gui():
+    import tkinter as tk
+    from tkinter import filedialog
     root = tk.Tk()
     root.withdraw()
     print("Please select the Hardening Kitty REPORT CSV...")
@@ -25,271 +104,324 @@ def select_files_gui():
     templates = filedialog.askopenfilenames(title="2. Select TEMPLATE CSV(s)", filetypes=[("CSV", "*.csv")])
     return report, templates
 
-def calculate_risk(row):
-    if str(row.get('TestResult','')).lower() == 'passed': return 0
-    severity = row.get('Severity', 'Low')
-    score = RISK_WEIGHTS.get(severity, 5)
-    text = f"{row.get('Category','')} {row.get('Description','')} {row.get('Name','')}"
-    if any(k.lower() in text.lower() for k in CRITICAL_KEYWORDS): score += CRITICAL_BONUS
-    return min(score, 100)
-
-def generate_fix(row):
+def load_rules(path=None):
     """
-    Generates the PowerShell command.
-    CRITICAL: This MUST retain 'HKLM:' or 'HKCU:' (with colon).
+    Returns the scoring rules (weights, keywords, bonus), optionally overridden by a JSON rules file:
+    {"risk_weights": {"High": 50, ...}, "critical_keywords": ["LSA", ...], "critical_bonus": 50}
+    The keywords are compiled once into a single case-insensitive alternation regex.
     """
-    path = row.get('RegistryPath')
-    item = row.get('RegistryItem')
-    val = row.get('RecommendedValue')
-    if pd.isna(path) or pd.isna(item): return ""
-    
-    ps_path = str(path).replace('HKEY_LOCAL_MACHINE', 'HKLM:').replace('HKEY_CURRENT_USER', 'HKCU:')
-    clean_val = str(val).replace('"', '')
-    return f'Set-ItemProperty -Path "{ps_path}" -Name "{item}" -Value "{clean_val}" -Force'
+    rules = {'risk_weights': dict(RISK_WEIGHTS), 'critical_keywords': list(CRITICAL_KEYWORDS), 'critical_bonus': CRITICAL_BONUS}
+    if path:
+        with open(path, encoding='utf-8') as f: rules.update(json.load(f))
+    keywords = sorted({str(k) for k in rules['critical_keywords'] if str(k)}, key=len, reverse=True)
+    rules['keyword_pattern'] = re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE) if keywords else None
+    return rules
 
-def generate_excel(df, output_path, df_failed, df_passed):
-    writer = pd.ExcelWriter(output_path, engine='xlsxwriter')
-    wb = writer.book
-    
-    ws_dash = wb.add_worksheet('Dashboard')
+def calculate_risk(df, rules=None):
+    """Vectorized risk score: severity weight + keyword bonus, capped at 100 (0 for passed checks)."""
+    rules = rules or load_rules()
+    def text_col(name):
+        if name not in df.columns: return pd.Series('', index=df.index)
+        return df[name].astype(object).where(df[name].notna(), '').astype(str)
 
-    # --- עיצובים (Formats) ---
-    
-    # Passed: ירוק בהיר סטנדרטי (רקע בהיר, טקסט ירוק כהה)
-    fmt_green = wb.add_format({'bg_color': '#C6EFCE', 'font_color': '#006100'})
+    severity = df['Severity'] if 'Severity' in df.columns else pd.Series('Low', index=df.index)
+    score = severity.astype(object).map(rules['risk_weights']).fillna(5).astype(int)
     
-    # Fixed: אותו ירוק בהיר בדיוק, אבל עם טקסט מודגש (Bold) כדי לסמן שזה תוקן
-    fmt_fixed = wb.add_format({'bg_color': '#C6EFCE', 'font_color': '#006100', 'bold': True})
+    if rules['keyword_pattern'] is not None:
+        text = text_col('Category') + ' ' + text_col('Description') + ' ' + text_col('Name')
+        score += text.str.contains(rules['keyword_pattern'], regex=True).astype(int) * rules['critical_bonus']
     
-    fmt_yellow = wb.add_format({'bg_color': '#FFEB9C', 'font_color': '#9C5700'})
-    fmt_red = wb.add_format({'bg_color': '#FFC7CE', 'font_color': '#9C0006'})
-    fmt_grey = wb.add_format({'bg_color': '#D9D9D9', 'font_color': '#333333'})
+    score = score.clip(upper=100)
+    score[text_col('TestResult').str.lower() == 'passed'] = 0
+    return score
 
-    total_checks = len(df)
-    
-    preferred_order = [
-        'CIS', 'Category', 'Description', 'Method', 'MethodArgument', 
-        'RegistryPath', 'RegistryItem', 'Result', 'Recommended', 'Fix', 'Status', 'RiskScore'
-    ]
+REG_ROOTS = {
+    # alias -> (short, PowerShell drive, full hive name)
+    'HKEY_LOCAL_MACHINE': ('HKLM', 'HKLM:', 'HKEY_LOCAL_MACHINE'), 'HKLM': ('HKLM', 'HKLM:', 'HKEY_LOCAL_MACHINE'),
+    'HKEY_CURRENT_USER': ('HKCU', 'HKCU:', 'HKEY_CURRENT_USER'), 'HKCU': ('HKCU', 'HKCU:', 'HKEY_CURRENT_USER'),
+    'HKEY_CLASSES_ROOT': ('HKCR', 'Registry::HKEY_CLASSES_ROOT', 'HKEY_CLASSES_ROOT'), 'HKCR': ('HKCR', 'Registry::HKEY_CLASSES_ROOT', 'HKEY_CLASSES_ROOT'),
+    'HKEY_USERS': ('HKU', 'Registry::HKEY_USERS', 'HKEY_USERS'), 'HKU': ('HKU', 'Registry::HKEY_USERS', 'HKEY_USERS'),
+}
+REG_PATH_RE = r'^(?P<root>' + '|'.join(sorted(REG_ROOTS, key=len, reverse=True)) + r'):?(?P<rest>\\.*)?$'
+
+def normalize_registry(df):
+    """
+    Single registry normalization stage (runs once, right after the template merge).
+    Adds RegShortPath (HKLM\\...), RegPSPath (HKLM:\\...) and RegeditPath (Computer\\HKEY_...).
+    Work is done on the unique paths only and mapped back, since paths repeat heavily.
+    """
+    key = df['RegistryPath'].astype(str).str.strip() if 'RegistryPath' in df.columns else pd.Series(dtype=object)
+    if len(key): key = key.where(df['RegistryPath'].notna() & (key != ''))
+    uniq = pd.Series(key.dropna().unique(), dtype=object)
+    if uniq.empty:  # no registry checks at all (or no template matches)
+        for col in ['RegShortPath', 'RegPSPath', 'RegeditPath']: df[col] = pd.Series(pd.NA, index=df.index, dtype='str')
+        return df
+    parts = uniq.str.extract(REG_PATH_RE)
+    root, rest = parts['root'], parts['rest'].fillna('')
+    known = root.notna()
     
-    status_options = ['Fixed', 'Not Relevant', 'To Discuss', "Can't Fix/Exclude"]
+    table = pd.DataFrame({
+        'RegShortPath': (root.map({k: v[0] for k, v in REG_ROOTS.items()}) + rest).where(known, uniq),
+        'RegPSPath': (root.map({k: v[1] for k, v in REG_ROOTS.items()}) + rest).where(known, uniq),
+        'RegeditPath': ('Computer\\' + root.map({k: v[2] for k, v in REG_ROOTS.items()}) + rest).where(known, uniq),
+    })
+    table.index = uniq
+    for col in table.columns:
+        df[col] = key.map(table[col])
+    return df
 
-    def clean_reg_col(path):
-        if pd.isna(path): return path
-        return str(path).replace('HKLM:', 'HKLM').replace('HKCU:', 'HKCU')
+def generate_fix(df):
+    """
+    Generates the PowerShell command for every row (vectorized over the normalized RegPSPath).
+    CRITICAL: This MUST retain 'HKLM:' or 'HKCU:' (with colon).
+    """
+    if 'RegPSPath' not in df.columns or 'RegistryItem' not in df.columns or df['RegPSPath'].isna().all():
+        return pd.Series('', index=df.index)  # no registry checks matched: nothing to fix via the registry
+    val = df['RecommendedValue'] if 'RecommendedValue' in df.columns else pd.Series('', index=df.index)
+    clean_val = val.map(str, na_action='ignore').fillna('nan').str.replace('"', '', regex=False)
+    fix = 'Set-ItemProperty -Path "' + df['RegPSPath'] + '" -Name "' + df['RegistryItem'].map(str, na_action='ignore') \
+          + '" -Value "' + clean_val + '" -Force'
+    return fix.where(df['RegPSPath'].notna() & df['RegistryItem'].notna(), '')
 
-    # --- Action Items Sheet ---
-    avail_cols = [c for c in preferred_order if c in df_failed.columns or c == 'Status']
-    df_failed_export = df_failed[[c for c in avail_cols if c != 'Status']].copy()
-    
-    if 'RegistryPath' in df_failed_export.columns:
-        df_failed_export['RegistryPath'] = df_failed_export['RegistryPath'].apply(clean_reg_col)
+EXPORT_ORDER = [
+    'CIS', 'Category', 'Description', 'Method', 'MethodArgument', 
+    'RegistryPath', 'RegistryItem', 'Result', 'Recommended', 'Fix', 'Status', 'RiskScore'
+]
+STATUS_OPTIONS = ['Fixed', 'Not Relevant', 'To Discuss', "Can't Fix/Exclude"]
 
-    df_failed_export['Status'] = '' 
-    df_failed_export = df_failed_export[avail_cols] 
-    
-    df_failed_export.to_excel(writer, sheet_name='Action Items', index=False)
-    ws_fail = writer.sheets['Action Items']
-    ws_fail.set_tab_color('#C00000')
-    ws_fail.freeze_panes(1, 0)
-    
-    fail_cols = df_failed_export.columns.tolist()
-    status_idx_fail = fail_cols.index('Status')
-    status_char_fail = xl_col_to_name(status_idx_fail) 
-    cat_idx_fail = fail_cols.index('Category')
-    cat_char_fail = xl_col_to_name(cat_idx_fail)        
-
-    max_row_fail = len(df_failed_export) + 1
-    max_col_fail = len(fail_cols) - 1
-    last_col_char_fail = xl_col_to_name(max_col_fail)
-    
-    if len(df_failed_export) > 0:
-        ws_fail.add_table(0, 0, max_row_fail-1, max_col_fail, {
-            'columns': [{'header': c} for c in fail_cols],
-            'style': 'TableStyleMedium9'
-        })
+def stable_workbook(wb):
+    wb.set_properties({'created': STABLE_CREATED})
+    return wb
 
-    ws_fail.data_validation(1, status_idx_fail, max_row_fail-1, status_idx_fail, {'validate': 'list', 'source': status_options})
-    
-    full_rng_fail = f"A2:{last_col_char_fail}{max_row_fail}"
-    
-    # החלת העיצוב המתוקן (Fixed = ירוק בהיר מודגש)
-    ws_fail.conditional_format(full_rng_fail, {'type': 'formula', 'criteria': f'=${status_char_fail}2="Fixed"', 'format': fmt_fixed})
-    ws_fail.conditional_format(full_rng_fail, {'type': 'formula', 'criteria': f'=${status_char_fail}2="Not Relevant"', 'format': fmt_grey})
-    ws_fail.conditional_format(full_rng_fail, {'type': 'formula', 'criteria': f'=${status_char_fail}2="To Discuss"', 'format': fmt_yellow})
-    ws_fail.conditional_format(full_rng_fail, {'type': 'formula', 'criteria': f'=${status_char_fail}2="Can\'t Fix/Exclude"', 'format': fmt_red})
-
-    ws_fail.set_column(f'{status_char_fail}:{status_char_fail}', 18) 
-    ws_fail.set_column(f'{cat_char_fail}:{cat_char_fail}', 25) 
-    
-    # --- Passed Checks Sheet ---
-    df_passed_export = df_passed[[c for c in avail_cols if c != 'Status']].copy()
-    if 'RegistryPath' in df_passed_export.columns:
-        df_passed_export['RegistryPath'] = df_passed_export['RegistryPath'].apply(clean_reg_col)
-        
-    df_passed_export['Status'] = 'Passed'
-    df_passed_export = df_passed_export[avail_cols]
-    
-    df_passed_export.to_excel(writer, sheet_name='Passed Checks', index=False)
-    ws_pass = writer.sheets['Passed Checks']
-    ws_pass.set_tab_color('#00B050')
-    ws_pass.freeze_panes(1, 0)
-    
-    pass_cols = df_passed_export.columns.tolist()
-    status_idx_pass = pass_cols.index('Status')
-    status_char_pass = xl_col_to_name(status_idx_pass)
-    cat_idx_pass = pass_cols.index('Category')
-    cat_char_pass = xl_col_to_name(cat_idx_pass)
-    
-    max_row_pass = len(df_passed_export) + 1
-    max_col_pass = len(pass_cols) - 1
-    last_col_char_pass = xl_col_to_name(max_col_pass)
+def excel_formats(wb):
+    # --- עיצובים (Formats) --- created once per workbook and reused for every row
+    return {
+        # Passed: ירוק בהיר סטנדרטי (רקע בהיר, טקסט ירוק כהה)
+        'green': wb.add_format({'bg_color': '#C6EFCE', 'font_color': '#006100'}),
+        # Fixed: אותו ירוק בהיר בדיוק, אבל עם טקסט מודגש (Bold) כדי לסמן שזה תוקן
+        'fixed': wb.add_format({'bg_color': '#C6EFCE', 'font_color': '#006100', 'bold': True}),
+        'yellow': wb.add_format({'bg_color': '#FFEB9C', 'font_color': '#9C5700'}),
+        'red': wb.add_format({'bg_color': '#FFC7CE', 'font_color': '#9C0006'}),
+        'grey': wb.add_format({'bg_color': '#D9D9D9', 'font_color': '#333333'}),
+        'header': wb.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}),
+        'notes_head': wb.add_format({'bold': True, 'bg_color': '#4472C4', 'font_color': 'white'}),
+        'title': wb.add_format({'bold': True, 'font_size': 24, 'font_color': '#203764'}),
+        'kpi_head': wb.add_format({'bold': True, 'font_size': 12, 'color': 'white', 'bg_color': '#4472C4', 'align': 'center', 'border': 1}),
+        'kpi_val': wb.add_format({'bold': True, 'font_size': 22, 'align': 'center', 'valign': 'vcenter', 'bg_color': '#f2f2f2', 'border': 1}),
+        'kpi_pct': wb.add_format({'bold': True, 'font_size': 22, 'align': 'center', 'valign': 'vcenter', 'bg_color': '#f2f2f2', 'border': 1, 'num_format': '0.0%'}),
+    }
 
-    if len(df_passed_export) > 0:
-        ws_pass.add_table(0, 0, len(df_passed_export), len(avail_cols), {
-            'columns': [{'header': c} for c in pass_cols], 
-            'style': 'TableStyleLight9'
-        })
+def export_columns(df):
+    return [c for c in EXPORT_ORDER if c in df.columns or c == 'Status']
 
-    ws_pass.data_validation(1, status_idx_pass, max_row_pass-1, status_idx_pass, {'validate': 'list', 'source': status_options})
-    
-    full_rng_pass = f"A2:{last_col_char_pass}{max_row_pass}"
+def carried_status(dframe, statuses, default):
+    """Status column of a partition: the analysts' statuses carried over by CIS (see import_workbooks), `default` elsewhere."""
+    if not statuses: return default
+    # Keyed on the stripped CIS (= ID, as in the HTML app): workbook cells are read back stripped
+    return dframe['ID'].astype(object).map(statuses).fillna(default)
+
+def export_frame(dframe, cols, status):
+    """Sheet view of a partition: export columns, short registry path and the initial Status (a value or a column)."""
+    out = dframe[[c for c in cols if c != 'Status']].copy()
+    if 'RegistryPath' in out.columns:
+        out['RegistryPath'] = dframe['RegShortPath']
+    out['Status'] = status
+    return out[cols]
+
+def write_rows(ws, first_row, export, key_col=None):
+    """Writes an export frame cell by cell (constant_memory friendly); returns the next free row."""
+    values = export.astype(object).where(export.notna(), None)
+    for r, vals in enumerate(values.itertuples(index=False, name=None), start=first_row):
+        ws.write_row(r, 0, vals)
+        if key_col: ws.write_formula(r, key_col[0], f'={key_col[1]}{r+1}&"|"&{key_col[2]}{r+1}')
+    return first_row + len(values)
+
+def sheet_layout(cols, n_rows, formula_mode):
+    """Column letters and ranges the Stats formulas need for one detail sheet."""
+    status_idx, cat_idx = cols.index('Status'), cols.index('Category')
+    lay = {'cols': cols, 'n_rows': n_rows, 'max_row': n_rows + 1, 'status_idx': status_idx,
+           'status_char': xl_utility.xl_col_to_name(status_idx), 'cat_char': xl_utility.xl_col_to_name(cat_idx),
+           'key_idx': len(cols) + 1 if formula_mode == 'lean' else None}
+    if formula_mode == 'lean':
+        key_char = xl_utility.xl_col_to_name(lay['key_idx'])
+        lay['key_rng'] = f"${key_char}$2:${key_char}${max(n_rows, 1) + 1}"
+        lay['status_rng'] = f"${lay['status_char']}$2:${lay['status_char']}${lay['max_row']}"
+    else:
+        lay['status_rng'] = f"{lay['status_char']}:{lay['status_char']}"
+    return lay
+
+def finish_detail_sheet(ws, lay, fmts, tab_color, table_style, extra_rules=()):
+    """Table, status dropdown and conditional row colors for Action Items / Passed Checks."""
+    ws.set_tab_color(tab_color)
+    ws.freeze_panes(1, 0)
+    cols, status_char = lay['cols'], lay['status_char']
+    max_col = len(cols) - 1
+
+    if lay['n_rows'] > 0:
+        if table_style:
+            ws.add_table(0, 0, lay['n_rows'], max_col, {'columns': [{'header': c} for c in cols], 'style': table_style})
+        else:
+            ws.autofilter(0, 0, lay['n_rows'], max_col)
+
+    ws.data_validation(1, lay['status_idx'], lay['max_row']-1, lay['status_idx'], {'validate': 'list', 'source': STATUS_OPTIONS})
     
-    ws_pass.conditional_format(full_rng_pass, {'type': 'formula', 'criteria': f'=${status_char_pass}2="Passed"', 'format': fmt_green})
+    full_rng = f"A2:{xl_utility.xl_col_to_name(max_col)}{lay['max_row']}"
     # Fixed = ירוק בהיר מודגש
-    ws_pass.conditional_format(full_rng_pass, {'type': 'formula', 'criteria': f'=${status_char_pass}2="Fixed"', 'format': fmt_fixed})
-    ws_pass.conditional_format(full_rng_pass, {'type': 'formula', 'criteria': f'=${status_char_pass}2="Not Relevant"', 'format': fmt_grey})
-    ws_pass.conditional_format(full_rng_pass, {'type': 'formula', 'criteria': f'=${status_char_pass}2="To Discuss"', 'format': fmt_yellow})
-    ws_pass.conditional_format(full_rng_pass, {'type': 'formula', 'criteria': f'=${status_char_pass}2="Can\'t Fix/Exclude"', 'format': fmt_red})
-    
-    ws_pass.set_column(f'{status_char_pass}:{status_char_pass}', 18)
+    for status, fmt in list(extra_rules) + [('Fixed', 'fixed'), ('Not Relevant', 'grey'), ('To Discuss', 'yellow'), ("Can't Fix/Exclude", 'red')]:
+        ws.conditional_format(full_rng, {'type': 'formula', 'criteria': f'=${status_char}2="{status}"', 'format': fmts[fmt]})
 
-    # --- Notes Sheet ---
-    ws_notes = wb.add_worksheet('Notes')
+    ws.set_column(f'{status_char}:{status_char}', 18)
+    if lay['key_idx']:
+        # Hidden helper key (Category|Status) right of the table; relative refs keep it valid after sorting
+        ws.set_column(lay['key_idx'], lay['key_idx'], None, None, {'hidden': True})
+
+NOTES_HEADERS = ['Date', 'Author', 'Category/Control', 'Note/Comment']
+
+def write_notes_sheet(ws_notes, fmts, table=True, notes=()):
+    """notes: rows carried over from returned workbooks, written under the header."""
     ws_notes.set_tab_color('#FFC000') 
     
-    notes_headers = ['Date', 'Author', 'Category/Control', 'Note/Comment']
-    ws_notes.write_row('A1', notes_headers, wb.add_format({'bold': True, 'bg_color': '#4472C4', 'font_color': 'white'}))
+    ws_notes.write_row('A1', NOTES_HEADERS, fmts['notes_head'])
     ws_notes.set_column('A:A', 15)
     ws_notes.set_column('B:B', 20)
     ws_notes.set_column('C:C', 30)
     ws_notes.set_column('D:D', 60)
-    ws_notes.add_table('A1:D20', {'columns': [{'header': c} for c in notes_headers], 'style': 'TableStyleMedium2'})
+    for r, note in enumerate(notes, start=1): ws_notes.write_row(r, 0, note)
+    if table: ws_notes.add_table(0, 0, max(19, len(notes)), 3, {'columns': [{'header': c} for c in NOTES_HEADERS], 'style': 'TableStyleMedium2'})
 
-    # --- Stats Logic (Hidden Sheet) ---
-    ws_stats = wb.add_worksheet('Stats')
+def write_trend_sheet(wb, ws_trend, history, fmts):
+    """Score and failed checks of every stored run of the host (findings store), oldest first, with a combined chart."""
+    ws_trend.set_tab_color('#4472C4')
+    ws_trend.write_row(0, 0, ['Scanned', 'Compliance Score', 'Failed', 'Passed', 'Checks'], fmts['header'])
+    pct = wb.add_format({'num_format': '0.0%'})
+    for r, run in enumerate(history.itertuples(index=False), start=1):
+        ws_trend.write(r, 0, run.scanned_at)
+        ws_trend.write(r, 1, run.score / 100, pct)
+        ws_trend.write_row(r, 2, [run.failed, run.passed, run.rows])
+    ws_trend.set_column('A:A', 20)
+    ws_trend.set_column('B:E', 16)
+    n = len(history)
+
+    score = wb.add_chart({'type': 'line'})
+    score.add_series({'name': 'Compliance Score', 'categories': ['Trend', 1, 0, n, 0], 'values': ['Trend', 1, 1, n, 1],
+                      'line': {'color': '#00B050', 'width': 2.5}, 'marker': {'type': 'circle', 'fill': {'color': '#00B050'}}})
+    failed = wb.add_chart({'type': 'column'})
+    failed.add_series({'name': 'Failed', 'categories': ['Trend', 1, 0, n, 0], 'values': ['Trend', 1, 2, n, 2],
+                       'fill': {'color': '#C00000'}, 'y2_axis': True})
+    score.combine(failed)
+    score.set_title({'name': 'Compliance Trend'})
+    score.set_y_axis({'name': 'Score', 'num_format': '0%', 'min': 0, 'max': 1})
+    failed.set_y2_axis({'name': 'Failed Checks'})
+    score.set_size({'width': 850, 'height': 450})
+    ws_trend.insert_chart('G2', score)
+
+def write_stats_sheet(ws_stats, pivot, total_checks, fail, pas, formula_mode):
+    """
+    Hidden Stats sheet feeding the dashboard. Everything is written in row order
+    (KPI block and category block side by side) so it also works in constant_memory mode.
+    """
     ws_stats.hide()
-    
-    pivot = df.pivot_table(index='Category', columns='TestResult', aggfunc='size', fill_value=0)
-    if 'Passed' not in pivot.columns: pivot['Passed'] = 0
-    if 'Failed' not in pivot.columns: pivot['Failed'] = 0
-    
-    pivot = pivot.sort_values('Failed', ascending=True)
     categories = pivot.index.tolist()
     init_pass_vals = pivot['Passed'].tolist()
     init_fail_vals = pivot['Failed'].tolist()
-    
+    cat_f, st_f = fail['cat_char'], fail['status_char']
+    cat_p, st_p = pas['cat_char'], pas['status_char']
+
     ws_stats.write_row('A1', ['Overall Status', 'Count'])
     ws_stats.write_row('D1', ['Category', 'Live Failed', 'Live Discuss', 'Live Not Relevant', 'Live Fixed', 'Live Passed', 'Init Pass', 'Init Fail', 'Total', '% Compliant', 'Chart Label'])
-    
-    for i, cat in enumerate(categories):
-        row = i + 1
-        ws_stats.write(row, 3, cat) 
-        ws_stats.write(row, 9, init_pass_vals[i]) # J
+    if formula_mode == 'lean':
+        ws_stats.write_row('P1', ['AI Not Relevant', 'AI Discuss', 'AI Fixed', 'PC Not Relevant', 'PC Discuss', 'PC Fixed'])
+
+    # KPI Calculation
+    count_pass_pc = f"COUNTIF('Passed Checks'!{pas['status_rng']}, \"Passed\")"
+    count_fix_ai  = f"COUNTIF('Action Items'!{fail['status_rng']}, \"Fixed\")"
+    count_fix_pc  = f"COUNTIF('Passed Checks'!{pas['status_rng']}, \"Fixed\")"
+    count_disc_ai = f"COUNTIF('Action Items'!{fail['status_rng']}, \"To Discuss\")"
+    count_disc_pc = f"COUNTIF('Passed Checks'!{pas['status_rng']}, \"To Discuss\")"
+    count_nr_ai = f"COUNTIF('Action Items'!{fail['status_rng']}, \"Not Relevant\")"
+    count_nr_pc = f"COUNTIF('Passed Checks'!{pas['status_rng']}, \"Not Relevant\")"
+    kpis = [
+        ('Passed', f"={count_pass_pc}"),
+        ('Fixed', f"={count_fix_ai} + {count_fix_pc}"),
+        ('To Discuss', f"={count_disc_ai} + {count_disc_pc}"),
+        ('Not Relevant', f"={count_nr_ai} + {count_nr_pc}"),
+        ('Failed', f"={total_checks} - B2 - B3 - B4 - B5"),
+    ]
+
+    for row in range(1, max(len(categories), len(kpis)) + 1):
+        if row <= len(kpis):
+            ws_stats.write(row, 0, kpis[row-1][0])
+            ws_stats.write_formula(row, 1, kpis[row-1][1])
+        if row > len(categories): continue
+
+        i, r = row - 1, row + 1
+        ws_stats.write(row, 3, categories[i]) 
+        ws_stats.write(row, 4 + 5, init_pass_vals[i]) # J
         ws_stats.write(row, 10, init_fail_vals[i]) # K
         
-        # Live Not Relevant
-        f_nr = f'=COUNTIFS(\'Action Items\'!{cat_char_fail}:{cat_char_fail}, D{row+1}, \'Action Items\'!{status_char_fail}:{status_char_fail}, "Not Relevant") + COUNTIFS(\'Passed Checks\'!{cat_char_pass}:{cat_char_pass}, D{row+1}, \'Passed Checks\'!{status_char_pass}:{status_char_pass}, "Not Relevant")'
-        ws_stats.write_formula(row, 6, f_nr)
+        if formula_mode == 'lean':
+            # Hidden per-category counts (P:U), one COUNTIF each; the live cells are plain arithmetic on them
+            for j, (sheet, lay, status) in enumerate([('Action Items', fail, 'Not Relevant'), ('Action Items', fail, 'To Discuss'),
+                                                      ('Action Items', fail, 'Fixed'), ('Passed Checks', pas, 'Not Relevant'),
+                                                      ('Passed Checks', pas, 'To Discuss'), ('Passed Checks', pas, 'Fixed')]):
+                ws_stats.write_formula(row, 15 + j, f'=COUNTIF(\'{sheet}\'!{lay["key_rng"]}, D{r}&"|{status}")')
+            ws_stats.write_formula(row, 4, f'=K{r}-R{r}-Q{r}-P{r}') # Live Failed
+            ws_stats.write_formula(row, 5, f'=Q{r}+T{r}')           # Live To Discuss
+            ws_stats.write_formula(row, 6, f'=P{r}+S{r}')           # Live Not Relevant
+            ws_stats.write_formula(row, 7, f'=R{r}+U{r}')           # Live Fixed
+            ws_stats.write_formula(row, 8, f'=J{r}-T{r}-S{r}-U{r}') # Live Passed
+        else:
+            # Live Failed
+            f_fail = f'=K{r} - COUNTIFS(\'Action Items\'!{cat_f}:{cat_f}, D{r}, \'Action Items\'!{st_f}:{st_f}, "Fixed") - COUNTIFS(\'Action Items\'!{cat_f}:{cat_f}, D{r}, \'Action Items\'!{st_f}:{st_f}, "To Discuss") - COUNTIFS(\'Action Items\'!{cat_f}:{cat_f}, D{r}, \'Action Items\'!{st_f}:{st_f}, "Not Relevant")'
+            ws_stats.write_formula(row, 4, f_fail)
 
-        # Live To Discuss
-        f_disc = f'=COUNTIFS(\'Action Items\'!{cat_char_fail}:{cat_char_fail}, D{row+1}, \'Action Items\'!{status_char_fail}:{status_char_fail}, "To Discuss") + COUNTIFS(\'Passed Checks\'!{cat_char_pass}:{cat_char_pass}, D{row+1}, \'Passed Checks\'!{status_char_pass}:{status_char_pass}, "To Discuss")'
-        ws_stats.write_formula(row, 5, f_disc)
+            # Live To Discuss
+            f_disc = f'=COUNTIFS(\'Action Items\'!{cat_f}:{cat_f}, D{r}, \'Action Items\'!{st_f}:{st_f}, "To Discuss") + COUNTIFS(\'Passed Checks\'!{cat_p}:{cat_p}, D{r}, \'Passed Checks\'!{st_p}:{st_p}, "To Discuss")'
+            ws_stats.write_formula(row, 5, f_disc)
 
-        # Live Fixed (הפרדה לסטטוס עצמאי)
-        f_fix = f'=COUNTIFS(\'Action Items\'!{cat_char_fail}:{cat_char_fail}, D{row+1}, \'Action Items\'!{status_char_fail}:{status_char_fail}, "Fixed") + COUNTIFS(\'Passed Checks\'!{cat_char_pass}:{cat_char_pass}, D{row+1}, \'Passed Checks\'!{status_char_pass}:{status_char_pass}, "Fixed")'
-        ws_stats.write_formula(row, 7, f_fix)
+            # Live Not Relevant
+            f_nr = f'=COUNTIFS(\'Action Items\'!{cat_f}:{cat_f}, D{r}, \'Action Items\'!{st_f}:{st_f}, "Not Relevant") + COUNTIFS(\'Passed Checks\'!{cat_p}:{cat_p}, D{r}, \'Passed Checks\'!{st_p}:{st_p}, "Not Relevant")'
+            ws_stats.write_formula(row, 6, f_nr)
 
-        # Live Passed (מנכה את ה-Fixed כי הם נספרים בנפרד)
-        f_pass = f'=J{row+1} - COUNTIFS(\'Passed Checks\'!{cat_char_pass}:{cat_char_pass}, D{row+1}, \'Passed Checks\'!{status_char_pass}:{status_char_pass}, "To Discuss") - COUNTIFS(\'Passed Checks\'!{cat_char_pass}:{cat_char_pass}, D{row+1}, \'Passed Checks\'!{status_char_pass}:{status_char_pass}, "Not Relevant") - COUNTIFS(\'Passed Checks\'!{cat_char_pass}:{cat_char_pass}, D{row+1}, \'Passed Checks\'!{status_char_pass}:{status_char_pass}, "Fixed")'
-        ws_stats.write_formula(row, 8, f_pass)
-        
-        # Live Failed
-        f_fail = f'=K{row+1} - COUNTIFS(\'Action Items\'!{cat_char_fail}:{cat_char_fail}, D{row+1}, \'Action Items\'!{status_char_fail}:{status_char_fail}, "Fixed") - COUNTIFS(\'Action Items\'!{cat_char_fail}:{cat_char_fail}, D{row+1}, \'Action Items\'!{status_char_fail}:{status_char_fail}, "To Discuss") - COUNTIFS(\'Action Items\'!{cat_char_fail}:{cat_char_fail}, D{row+1}, \'Action Items\'!{status_char_fail}:{status_char_fail}, "Not Relevant")'
-        ws_stats.write_formula(row, 4, f_fail)
+            # Live Fixed (הפרדה לסטטוס עצמאי)
+            f_fix = f'=COUNTIFS(\'Action Items\'!{cat_f}:{cat_f}, D{r}, \'Action Items\'!{st_f}:{st_f}, "Fixed") + COUNTIFS(\'Passed Checks\'!{cat_p}:{cat_p}, D{r}, \'Passed Checks\'!{st_p}:{st_p}, "Fixed")'
+            ws_stats.write_formula(row, 7, f_fix)
+
+            # Live Passed (מנכה את ה-Fixed כי הם נספרים בנפרד)
+            f_pass = f'=J{r} - COUNTIFS(\'Passed Checks\'!{cat_p}:{cat_p}, D{r}, \'Passed Checks\'!{st_p}:{st_p}, "To Discuss") - COUNTIFS(\'Passed Checks\'!{cat_p}:{cat_p}, D{r}, \'Passed Checks\'!{st_p}:{st_p}, "Not Relevant") - COUNTIFS(\'Passed Checks\'!{cat_p}:{cat_p}, D{r}, \'Passed Checks\'!{st_p}:{st_p}, "Fixed")'
+            ws_stats.write_formula(row, 8, f_pass)
         
         # Total
-        ws_stats.write_formula(row, 11, f'=E{row+1}+F{row+1}+G{row+1}+H{row+1}+I{row+1}')
+        ws_stats.write_formula(row, 11, f'=E{r}+F{r}+G{r}+H{r}+I{r}')
         
         # % Compliant (Fixed + Passed) / (Total - Not Relevant)
-        ws_stats.write_formula(row, 12, f'=IF((L{row+1}-G{row+1})=0, 0, (H{row+1}+I{row+1})/(L{row+1}-G{row+1}))')
+        ws_stats.write_formula(row, 12, f'=IF((L{r}-G{r})=0, 0, (H{r}+I{r})/(L{r}-G{r}))')
         
         # Chart Label
-        ws_stats.write_formula(row, 13, f'=D{row+1} & " (" & TEXT(M{row+1}, "0%") & ")"')
+        ws_stats.write_formula(row, 13, f'=D{r} & " (" & TEXT(M{r}, "0%") & ")"')
 
-    # KPI Calculation
-    count_pass_pc = f"COUNTIF('Passed Checks'!{status_char_pass}:{status_char_pass}, \"Passed\")"
-    count_fix_ai  = f"COUNTIF('Action Items'!{status_char_fail}:{status_char_fail}, \"Fixed\")"
-    count_fix_pc  = f"COUNTIF('Passed Checks'!{status_char_pass}:{status_char_pass}, \"Fixed\")"
-    
-    ws_stats.write('A2', 'Passed')
-    ws_stats.write_formula('B2', f"={count_pass_pc}")
-    
-    ws_stats.write('A3', 'Fixed')
-    ws_stats.write_formula('B3', f"={count_fix_ai} + {count_fix_pc}")
-
-    count_disc_ai = f"COUNTIF('Action Items'!{status_char_fail}:{status_char_fail}, \"To Discuss\")"
-    count_disc_pc = f"COUNTIF('Passed Checks'!{status_char_pass}:{status_char_pass}, \"To Discuss\")"
-    ws_stats.write('A4', 'To Discuss') 
-    ws_stats.write_formula('B4', f"={count_disc_ai} + {count_disc_pc}")
-    
-    count_nr_ai = f"COUNTIF('Action Items'!{status_char_fail}:{status_char_fail}, \"Not Relevant\")"
-    count_nr_pc = f"COUNTIF('Passed Checks'!{status_char_pass}:{status_char_pass}, \"Not Relevant\")"
-    ws_stats.write('A5', 'Not Relevant')
-    ws_stats.write_formula('B5', f"={count_nr_ai} + {count_nr_pc}")
-    
-    ws_stats.write('A6', 'Failed')
-    ws_stats.write_formula('B6', f"={total_checks} - B2 - B3 - B4 - B5")
-
-    # --- Dashboard ---
+def write_dashboard(wb, ws_dash, fmts, total_checks, num_cats, merge_cells=True):
     ws_dash.hide_gridlines(2)
     ws_dash.set_column('B:H', 20)
     
-    fmt_title = wb.add_format({'bold': True, 'font_size': 24, 'font_color': '#203764'})
-    fmt_head = wb.add_format({'bold': True, 'font_size': 12, 'color': 'white', 'bg_color': '#4472C4', 'align': 'center', 'border': 1})
-    fmt_val = wb.add_format({'bold': True, 'font_size': 22, 'align': 'center', 'bg_color': '#f2f2f2', 'border': 1})
-    fmt_pct = wb.add_format({'bold': True, 'font_size': 22, 'align': 'center', 'bg_color': '#f2f2f2', 'border': 1, 'num_format': '0.0%'})
-    
-    ws_dash.write('B2', 'Security Assessment Dashboard', fmt_title)
-    
-    ws_dash.write('B5', "Compliance Score", fmt_head)
-    ws_dash.write('C5', "Total Controls", fmt_head)
-    ws_dash.write('D5', "Passed Checks", fmt_head)
-    ws_dash.write('E5', "Fixed Checks", fmt_head)
-    ws_dash.write('F5', "Failed Checks", fmt_head)
-    ws_dash.write('G5', "To Discuss", fmt_head)
-    ws_dash.write('H5', "Not Relevant", fmt_head)
+    ws_dash.write('B2', 'Security Assessment Dashboard', fmts['title'])
+    ws_dash.write_row('B5', ["Compliance Score", "Total Controls", "Passed Checks", "Fixed Checks", "Failed Checks", "To Discuss", "Not Relevant"], fmts['kpi_head'])
 
     # Values
-    ws_dash.merge_range('B6:B7', '', fmt_pct)
-    ws_dash.write_formula('B6', f"=(Stats!B2 + Stats!B3) / ({total_checks} - Stats!B5)", fmt_pct)
-    
-    ws_dash.merge_range('C6:C7', total_checks, fmt_val)
-    
-    ws_dash.merge_range('D6:D7', '', fmt_val)
-    ws_dash.write_formula('D6', "=Stats!B2", fmt_val) # Passed
-    
-    ws_dash.merge_range('E6:E7', '', fmt_val)
-    ws_dash.write_formula('E6', "=Stats!B3", fmt_val) # Fixed
-    
-    ws_dash.merge_range('F6:F7', '', fmt_val)
-    ws_dash.write_formula('F6', "=Stats!B6", fmt_val) # Failed
-    
-    ws_dash.merge_range('G6:G7', '', fmt_val)
-    ws_dash.write_formula('G6', "=Stats!B4", fmt_val) # Discuss
-    
-    ws_dash.merge_range('H6:H7', '', fmt_val)
-    ws_dash.write_formula('H6', "=Stats!B5", fmt_val) # Not Relevant
+    kpis = [
+        ('B', f"=(Stats!B2 + Stats!B3) / ({total_checks} - Stats!B5)", fmts['kpi_pct']),
+        ('C', total_checks, fmts['kpi_val']),
+        ('D', "=Stats!B2", fmts['kpi_val']), # Passed
+        ('E', "=Stats!B3", fmts['kpi_val']), # Fixed
+        ('F', "=Stats!B6", fmts['kpi_val']), # Failed
+        ('G', "=Stats!B4", fmts['kpi_val']), # Discuss
+        ('H', "=Stats!B5", fmts['kpi_val']), # Not Relevant
+    ]
+    for col, val, fmt in kpis:
+        if merge_cells: ws_dash.merge_range(f'{col}6:{col}7', val, fmt)
+        else: ws_dash.write(f'{col}6', val, fmt)
+    # Merged ranges can't be written out of row order in constant_memory mode: use one tall row instead
+    if not merge_cells: ws_dash.set_row(5, 58)
 
     # --- Charts ---
 
@@ -310,7 +442,6 @@ def generate_excel(df, output_path, df_failed, df_passed):
     ws_dash.insert_chart('B10', chart1)
 
     # 2. Stacked Bar Chart
-    num_cats = len(categories)
     chart2 = wb.add_chart({'type': 'bar', 'subtype': 'stacked'})
     
     chart2.add_series({'name': 'Failed', 'categories': f'=Stats!$N$2:$N${num_cats+1}', 'values': f'=Stats!$E$2:$E${num_cats+1}', 'fill': {'color': '#C00000'}})
@@ -329,94 +460,159 @@ def generate_excel(df, output_path, df_failed, df_passed):
     chart2.set_y_axis({'reverse': True})
     ws_dash.insert_chart('F10', chart2)
 
-    writer.close()
+def stats_pivot(counts):
+    """counts: Series indexed by (Category, TestResult) -> Category x Passed/Failed frame, sorted for the bar chart."""
+    pivot = counts.unstack(fill_value=0) if len(counts) else pd.DataFrame()
+    pivot.columns = pivot.columns.astype(str)
+    if 'Passed' not in pivot.columns: pivot['Passed'] = 0
+    if 'Failed' not in pivot.columns: pivot['Failed'] = 0
+    return pivot.astype(int).sort_values('Failed', ascending=True)
+
+def result_counts(df):
+    return df.groupby(['Category', 'TestResult'], observed=True).size()
+
+def generate_excel(df, output_path, df_failed, df_passed, formula_mode='classic', history=None, carried=None):
+    """
+    formula_mode='classic': live Stats formulas use whole-column COUNTIFS.
+    formula_mode='lean': a hidden Category|Status key column per sheet and one bounded COUNTIF
+    per count, so recalculation scales with the number of rows instead of the full sheet.
+    history: the host's stored runs (run_history), written to a Trend sheet.
+    carried: {'statuses': {CIS: Status}, 'notes': [rows]} from the host's returned workbooks (carried_edits).
+    """
+    carried = carried or {}
+    writer = pd.ExcelWriter(output_path, engine='xlsxwriter')
+    wb = stable_workbook(writer.book)
+    
+    ws_dash = wb.add_worksheet('Dashboard')
+    fmts = excel_formats(wb)
+    cols = export_columns(df_failed)
+
+    # --- Action Items Sheet ---
+    with stage('excel_action_items', len(df_failed)):
+        df_failed_export = export_frame(df_failed, cols, carried_status(df_failed, carried.get('statuses'), ''))
+        df_failed_export.to_excel(writer, sheet_name='Action Items', index=False)
+        ws_fail = writer.sheets['Action Items']
+        fail = sheet_layout(cols, len(df_failed_export), formula_mode)
+        finish_detail_sheet(ws_fail, fail, fmts, '#C00000', 'TableStyleMedium9')
+        ws_fail.set_column(f"{fail['cat_char']}:{fail['cat_char']}", 25) 
+    
+    # --- Passed Checks Sheet ---
+    with stage('excel_passed_checks', len(df_passed)):
+        df_passed_export = export_frame(df_passed, cols, carried_status(df_passed, carried.get('statuses'), 'Passed'))
+        df_passed_export.to_excel(writer, sheet_name='Passed Checks', index=False)
+        ws_pass = writer.sheets['Passed Checks']
+        pas = sheet_layout(cols, len(df_passed_export), formula_mode)
+        finish_detail_sheet(ws_pass, pas, fmts, '#00B050', 'TableStyleLight9', extra_rules=[('Passed', 'green')])
+
+    if formula_mode == 'lean':
+        with stage('excel_lean_keys', fail['n_rows'] + pas['n_rows']):
+            for ws, lay in [(ws_fail, fail), (ws_pass, pas)]:
+                for r in range(1, lay['n_rows'] + 1):
+                    ws.write_formula(r, lay['key_idx'], f'={lay["cat_char"]}{r+1}&"|"&{lay["status_char"]}{r+1}')
+
+    with stage('excel_dashboard', len(df)):
+        # --- Notes Sheet ---
+        write_notes_sheet(wb.add_worksheet('Notes'), fmts, notes=carried.get('notes', ()))
+        if history is not None and len(history): write_trend_sheet(wb, wb.add_worksheet('Trend'), history, fmts)
+
+        # --- Stats Logic (Hidden Sheet) ---
+        pivot = stats_pivot(result_counts(df))
+        write_stats_sheet(wb.add_worksheet('Stats'), pivot, len(df), fail, pas, formula_mode)
+
+        # --- Dashboard ---
+        write_dashboard(wb, ws_dash, fmts, len(df), len(pivot))
+
+    with stage('excel_save', len(df)): writer.close()  # the sheet XML is generated and zipped here
     print(f"✅ Excel Created with Notes & Clean Registry Paths: {output_path}")
 
-def generate_html(df, output_path, score, total, passed, failed, categories):
-    df_failed = df[df['TestResult'].str.contains('Failed', na=False)].sort_values(by=['RiskScore'], ascending=False)
-    df_passed = df[df['TestResult'].str.contains('Passed', na=False)].sort_values(by=['Category'])
-    sorted_cats = sorted([str(c) for c in categories if str(c) != 'nan'])
-
-    def render_rows(dframe, is_action=True):
-        rows = []
-        for _, row in dframe.iterrows():
-            risk_class = "risk-low"
-            if is_action:
-                if row['RiskScore'] == 100: risk_class = "risk-100"
-                elif row['RiskScore'] >= 60: risk_class = "risk-high"
-                elif row['RiskScore'] >= 40: risk_class = "risk-med"
-            
-            fix = str(row.get('Fix', '')).replace('"', '&quot;')
-            desc = str(row.get('Description', row.get('Name', ''))).replace('"', '&quot;')
-            cis = str(row.get('CIS', row.get('ID', ''))).replace('nan', '')
-            
-            curr_raw = str(row.get('Result', ''))
-            exp_raw = str(row.get('Recommended', row.get('RecommendedValue', '')))
-            
-            curr = f'<div class="code-box">{curr_raw}</div>'
-            exp = f'<div class="code-box">{exp_raw}</div>'
-            
-            reg_path = str(row.get('RegistryPath', ''))
-            reg_item = str(row.get('RegistryItem', ''))
-            reg_html = ""
-            reg_btns = ""
-            
-            if reg_path and reg_path != "nan":
-                # --- VISUAL FIX: Clean display path ---
-                clean_short_path = reg_path.replace('HKLM:', 'HKLM').replace('HKCU:', 'HKCU')
-                # Ensure full names are shortened if present
-                clean_short_path = clean_short_path.replace('HKEY_LOCAL_MACHINE', 'HKLM').replace('HKEY_CURRENT_USER', 'HKCU')
-                
-                # --- FUNCTIONAL FIX: Build full path for Regedit Address Bar ---
-                reg_addr = clean_short_path.replace('HKLM', r'Computer\HKEY_LOCAL_MACHINE')\
-                                           .replace('HKCU', r'Computer\HKEY_CURRENT_USER')\
-                                           .replace('HKCR', r'Computer\HKEY_CLASSES_ROOT')\
-                                           .replace('HKU', r'Computer\HKEY_USERS')
-                
-                js_reg_addr = reg_addr.replace(chr(92), chr(92)+chr(92))
-
-                reg_html = f"<div class='reg-box'><div><b>Key:</b> {clean_short_path}</div><div><b>Val:</b> {reg_item}</div></div>"
-                
-                # Only Copy Path Button Remains
-                btn1 = f'''<button class="btn-icon" onclick="copyPathOnly('{js_reg_addr}')" title="Copy path to clipboard">📄 Copy Path</button>'''
-                reg_btns = f"<div class='btn-group'>{btn1}</div>"
-
-            data_attrs = f'''
-                data-id="{row['ID']}" 
-                data-cat="{row['Category']}" 
-                data-desc="{desc}" 
-                data-reg="{str(reg_html).replace('"', '&quot;')}"
-                data-regbtns="{str(reg_btns).replace('"', '&quot;')}"
-                data-curr="{str(curr).replace('"', '&quot;')}" 
-                data-exp="{str(exp).replace('"', '&quot;')}" 
-                data-fix="{fix}" 
-                data-score="{row['RiskScore']}"
-                data-cis="{cis}"
-            '''
-
-            rows.append(f'''
-            <tr {data_attrs}>
-                <td>{'<input type="checkbox" class="select-row">' if is_action else ''}</td>
-                <td><span class="badge {risk_class if is_action else 'OK'}">{row['RiskScore'] if is_action else 'OK'}</span></td>
-                <td style="font-weight:bold; white-space:nowrap;">{cis}</td>
-                <td>{row['Category']}</td>
-                <td><div class="desc-text">{desc}</div></td>
-                <td>{reg_html} {reg_btns}</td>
-                <td>{curr}</td>
-                <td>{exp}</td>
-            </tr>''')
-        return "\n".join(rows)
-
-    html = f"""
+FINDING_FIELDS = ['id', 'cis', 'cat', 'desc', 'key', 'item', 'reg', 'curr', 'exp', 'score']
+# Highly repetitive fields, stored as indexes into per-field lookup tables in the compressed payload
+DICT_FIELDS = ['cat', 'desc', 'key', 'item', 'reg', 'exp']
+
+def intern_values(values, table):
+    """Replaces each value by its index in `table` (value -> index, extended in place)."""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    lookup = [table.setdefault(u, len(table)) for u in uniques]
+    return [lookup[c] for c in codes]
+
+def finding_records(dframe, tables=None):
+    """
+    Findings as compact lists in FINDING_FIELDS order (the HTML app's embedded data).
+    With `tables` ({field: {value: index}}) those fields are dictionary-encoded, see DICT_FIELDS.
+    """
+    def col(*names):
+        # First available column, falling back to the next one for empty cells
+        out = pd.Series(None, index=dframe.index, dtype=object)
+        for n in names:
+            if n in dframe.columns: out = out.fillna(dframe[n].astype(object))
+        return out.fillna('').astype(str).tolist()
+
+    score = dframe['RiskScore'].astype(int).tolist()
+    columns = [col('ID'), col('CIS', 'ID'), col('Category'), col('Description', 'Name'), col('RegShortPath'),
+               col('RegistryItem'), col('RegeditPath'), col('Result'), col('Recommended', 'RecommendedValue'), score]
+    if tables is not None:
+        columns = [intern_values(c, tables[f]) if f in tables else c for f, c in zip(FINDING_FIELDS, columns)]
+    return list(zip(*columns))
+
+def render_html_rows(dframe, written=0, tables=None):
+    """JSON for a slice of findings, comma-separated from the `written` records already emitted."""
+    if len(dframe) == 0: return ""
+    body = json.dumps(finding_records(dframe, tables), ensure_ascii=False, separators=(',', ':'))[1:-1]
+    # '<' is escaped so the data can never close the <script> island
+    return ("," if written else "") + body.replace('<', '\\u003c')
+
+HTML_ROWS_MARK = '<!--KP-ROWS-->'
+CDN_CSS = """<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600&family=JetBrains+Mono:wght@400&display=swap" rel="stylesheet">
+    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.4/css/jquery.dataTables.min.css">
+    <link rel="stylesheet" href="https://cdn.datatables.net/fixedheader/3.3.2/css/fixedHeader.dataTables.min.css">
+    <link rel="stylesheet" href="https://cdn.datatables.net/colreorder/1.6.2/css/colReorder.dataTables.min.css">"""
+CDN_JS = """<script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
+    <script src="https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"></script>
+    <script src="https://cdn.datatables.net/fixedheader/3.3.2/js/dataTables.fixedHeader.min.js"></script>
+    <script src="https://cdn.datatables.net/colreorder/1.6.2/js/dataTables.colReorder.min.js"></script>"""
+
+def read_asset(name):
+    with open(os.path.join(ASSETS_DIR, name), encoding='utf-8') as f: return f.read().strip()
+
+def minify_css(css):
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{}:;,])\s*', r'\1', css).strip()
+
+def minify_js(js):
+    # Conservative: drops indentation, blank lines and full-line // comments, line breaks are kept (ASI)
+    lines = (l.strip() for l in js.splitlines())
+    return '\n'.join(l for l in lines if l and not l.startswith('//'))
+
+def minify_page(page):
+    """Minifies the app's own <style> / <script> blocks (the JSON data island has a type and is left alone)."""
+    page = re.sub(r'<style>(.*?)</style>', lambda m: f'<style>{minify_css(m.group(1))}</style>', page, flags=re.S)
+    return re.sub(r'<script>(.*?)</script>', lambda m: f'<script>{minify_js(m.group(1))}</script>', page, flags=re.S)
+
+def html_shell(score, total, passed, failed, sorted_cats, offline=False, compress=False, server=False, fixed=()):
+    """
+    The app page split around the two data slots (pending / passed findings): (head, middle, tail).
+    offline=True inlines the vendored libraries and minifies the page, so it never touches the network.
+    compress=True has a single slot for the packed payload instead: (head, tail), see write_packed.
+    server=True embeds no findings at all, the tables page through the local server's API: (page,).
+    fixed: IDs marked Fixed in returned workbooks, applied on load like saved progress.
+    """
+    cat_options = ''.join(f'<option value="{html.escape(c)}">{html.escape(c)}</option>' for c in sorted_cats)
+    # Placeholders are swapped for the (already minified) libraries after the page itself is minified
+    css_libs, js_libs = ('<!--KP-CSS-->', '<!--KP-JS-->') if offline else (CDN_CSS, CDN_JS)
+    if server: data_island = f'<script type="application/json" id="kp-data">{{"fields":{json.dumps(FINDING_FIELDS)},"server":true,"pending":[],"passed":[]}}</script>'
+    elif compress: data_island = f'<script type="application/json" id="kp-data" data-encoding="gzip">{HTML_ROWS_MARK}</script>'
+    else: data_island = f'<script type="application/json" id="kp-data">{{"fields":{json.dumps(FINDING_FIELDS)},"pending":[{HTML_ROWS_MARK}],"passed":[{HTML_ROWS_MARK}]}}</script>'
+    if fixed:
+        fixed_json = json.dumps(list(fixed)).replace('<', '\\u003c')
+        data_island += f'<script type="application/json" id="kp-fixed">{fixed_json}</script>'
+    page = f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>Hardening App</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600&family=JetBrains+Mono:wght@400&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.4/css/jquery.dataTables.min.css">
-    <link rel="stylesheet" href="https://cdn.datatables.net/fixedheader/3.3.2/css/fixedHeader.dataTables.min.css">
-    <link rel="stylesheet" href="https://cdn.datatables.net/colreorder/1.6.2/css/colReorder.dataTables.min.css">
+    {css_libs}
     
     <style>
         :root {{ --bg: #f4f6f8; --card: #fff; --text: #212b36; --r100: #7A0916; --rh: #D93025; --rm: #F9A825; --rl: #1877F2; --ok: #00AB55; }}
@@ -431,7 +627,7 @@ def generate_html(df, output_path, score, total, passed, failed, categories):
         body.dark .modal-content {{ background: #333 !important; color: #fff !important; }}
         body.dark #custom-modal {{ background-color: #2c2c2c !important; border-color: #444; color: #f0f0f0 !important; }}
         body.dark .modal-header {{ background-color: #1a1a1a; }}
-        body {{ font-family: 'Inter', sans-serif; background: var(--bg); color: var(--text); padding: 20px; }}
+        body {{ font-family: 'Inter', system-ui, -apple-system, 'Segoe UI', Roboto, sans-serif; background: var(--bg); color: var(--text); padding: 20px; }}
         .header {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px; }}
         .btn {{ padding: 8px 16px; border: none; border-radius: 6px; cursor: pointer; font-weight: 600; margin-left: 5px; }}
         .btn-primary {{ background: #212b36; color: white; }}
@@ -450,7 +646,7 @@ def generate_html(df, output_path, score, total, passed, failed, categories):
         .btn-group {{ display: flex; gap: 5px; margin-top: 5px; }}
         .btn-icon {{ flex: 1; background: #eee; border: 1px solid #ccc; padding: 4px 6px; border-radius: 4px; cursor: pointer; font-size: 11px; color: #333; }}
         .btn-restore {{ background: var(--rl); color: white; border: none; padding: 4px 8px; border-radius: 4px; cursor: pointer; }}
-        .reg-box, .code-box {{ font-family: 'JetBrains Mono', monospace; font-size: 11px; background: #f8f9fa; padding: 6px; border-radius: 4px; border: 1px solid #ddd; word-break: break-all; max-height: 100px; overflow-y: auto; }}
+        .reg-box, .code-box {{ font-family: 'JetBrains Mono', Consolas, 'Courier New', monospace; font-size: 11px; background: #f8f9fa; padding: 6px; border-radius: 4px; border: 1px solid #ddd; word-break: break-all; max-height: 100px; overflow-y: auto; }}
         .controls {{ display: flex; justify-content: space-between; margin-bottom: 10px; }}
         .desc-text {{ font-size: 14px; line-height: 1.5; }}
         table.dataTable {{ width: 100% !important; border-collapse: collapse; table-layout: fixed; }}
@@ -499,27 +695,24 @@ def generate_html(df, output_path, score, total, passed, failed, categories):
     <div id="pending" class="tab-content active">
         <div class="controls">
             <button class="btn btn-primary" onclick="moveMarked()">✅ Move Marked to Fixed</button>
-            <select onchange="applyFilter(this.value)"><option value="">All Categories</option>{''.join(f'<option value="{c}">{c}</option>' for c in sorted_cats)}</select>
+            <select onchange="applyFilter(this.value)"><option value="">All Categories</option>{cat_options}</select>
         </div>
         <table id="tp" class="display">
             <thead><tr><th><input type="checkbox" class="select-all"></th><th>Score</th><th>CIS</th><th>Category</th><th>Description</th><th>Registry Info</th><th>Current Value</th><th>Expected Value</th></tr></thead>
-            <tbody>{render_rows(df_failed, True)}</tbody>
         </table>
     </div>
 
     <div id="fixed" class="tab-content">
-        <div class="controls"><div></div><select onchange="applyFilter(this.value)"><option value="">All Categories</option>{''.join(f'<option value="{c}">{c}</option>' for c in sorted_cats)}</select></div>
+        <div class="controls"><div></div><select onchange="applyFilter(this.value)"><option value="">All Categories</option>{cat_options}</select></div>
         <table id="tf" class="display">
             <thead><tr><th>Restore</th><th>Score</th><th>CIS</th><th>Category</th><th>Description</th><th>Registry Info</th><th>Current Value</th><th>Expected Value</th></tr></thead>
-            <tbody></tbody>
         </table>
     </div>
 
     <div id="passed" class="tab-content">
-        <div class="controls"><div></div><select onchange="applyFilter(this.value)"><option value="">All Categories</option>{''.join(f'<option value="{c}">{c}</option>' for c in sorted_cats)}</select></div>
+        <div class="controls"><div></div><select onchange="applyFilter(this.value)"><option value="">All Categories</option>{cat_options}</select></div>
         <table id="tpass" class="display">
             <thead><tr><th>-</th><th>Status</th><th>CIS</th><th>Category</th><th>Description</th><th>Registry Info</th><th>Current Value</th><th>Expected Value</th></tr></thead>
-            <tbody>{render_rows(df_passed, False)}</tbody>
         </table>
     </div>
 
@@ -531,43 +724,114 @@ def generate_html(df, output_path, score, total, passed, failed, categories):
         <div class="modal-body" id="modal-msg"></div>
     </div>
 
-    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
-    <script src="https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"></script>
-    <script src="https://cdn.datatables.net/fixedheader/3.3.2/js/dataTables.fixedHeader.min.js"></script>
-    <script src="https://cdn.datatables.net/colreorder/1.6.2/js/dataTables.colReorder.min.js"></script>
+    {data_island}
+
+    {js_libs}
     
     <script>
-        let tp, tf, tpass, fileHandle;
+        // Findings are embedded once as compact arrays (see "fields"); tables render from this data
+        let DATA;
+        const F = {{}};
+        // In-memory state: findings by ID + the set of IDs marked as fixed (the tables only mirror it)
+        const findings = new Map();
+        const fixed = new Set();
+        const tables = {{}};
+        const selected = new Set();
+        let tp, tf, tpass, fileHandle, catFilter = '';
+        // Served by `KittyPorter.py serve`: the tables page through the API and the Fixed state lives on the server
+        let SERVER = false;
+        const api = (path, body) => fetch('api/' + path, body === undefined ? {{}} :
+            {{ method: 'POST', headers: {{ 'Content-Type': 'application/json' }}, body: JSON.stringify(body) }}).then(r => r.json());
+
+        const esc = s => String(s ?? '').replace(/[&<>"']/g, c => ({{ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }}[c]));
         
-        $(document).ready(function() {{
+        // Plain JSON, or dictionary-encoded JSON as gzip + base64 (data-encoding="gzip")
+        async function loadData() {{
+            const el = document.getElementById('kp-data');
+            if (el.dataset.encoding !== 'gzip') return JSON.parse(el.textContent);
+            const bin = atob(el.textContent.trim()), bytes = new Uint8Array(bin.length);
+            for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            const d = JSON.parse(await new Response(stream).text());
+            const rows = d.pending.concat(d.passed);
+            for (const [f, values] of Object.entries(d.dict)) {{
+                const i = d.fields.indexOf(f);
+                for (const r of rows) r[i] = values[r[i]];
+            }}
+            return d;
+        }}
+
+        $(document).ready(async function() {{
+            DATA = await loadData();
+            SERVER = DATA.server === true;
+            DATA.fields.forEach((f, i) => F[f] = i);
+            DATA.pending.forEach(r => findings.set(r[F.id], r));
+
             jQuery.extend( jQuery.fn.dataTable.ext.oSort, {{
                 "cis-sort-asc": function ( a, b ) {{ return a.toString().localeCompare(b.toString(), undefined, {{ numeric: true, sensitivity: 'base' }}); }},
                 "cis-sort-desc": function ( a, b ) {{ return b.toString().localeCompare(a.toString(), undefined, {{ numeric: true, sensitivity: 'base' }}); }}
             }});
 
-            const cfg = {{ 
-                "pageLength": -1, "lengthMenu": [[10, 25, 50, -1], [10, 25, 50, "All"]], "order": [[ 2, "asc" ]], 
-                "fixedHeader": true, "colReorder": true, "autoWidth": false, "columnDefs": [ {{ "type": "cis-sort", "targets": 2 }} ],
-                "initComplete": function() {{ initCustomResize(this); }}
-            }};
+            tp = getTable('pending'); // Fixed / Passed are created on first view
             
-            tp = $('#tp').DataTable(cfg);
-            tf = $('#tf').DataTable(cfg);
-            tpass = $('#tpass').DataTable(cfg);
-            
-            setTimeout(loadFromStorage, 300);
+            if (SERVER) api('state').then(updateScore); else setTimeout(loadFromStorage, 300);
             setupDraggableModal();
-            updateScore(); // Initial Calc
+            if (!SERVER) updateScore(); // Initial Calc
 
             $('#tp thead').on('click', '.select-all', function() {{
                 const isChecked = this.checked;
-                $('input.select-row', tp.rows({{ 'search': 'applied' }}).nodes()).prop('checked', isChecked);
+                tp.rows({{ 'search': 'applied' }}).data().each(r => isChecked ? selected.add(r[F.id]) : selected.delete(r[F.id]));
+                $('input.select-row', tp.rows({{ 'search': 'applied' }}).nodes().toArray().filter(Boolean)).prop('checked', isChecked);
             }});
             $('#tp tbody').on('change', 'input.select-row', function(){{
-                if(!this.checked) {{ $('.select-all').prop('checked', false); }}
+                if (this.checked) {{ selected.add(this.dataset.id); }}
+                else {{ selected.delete(this.dataset.id); $('.select-all').prop('checked', false); }}
             }});
         }});
 
+        // --- TABLES (rendered from data, rows only built when displayed) ---
+        function columnsFor(kind) {{
+            const text = (d, t) => t === 'display' ? esc(d) : d;
+            return [
+                {{ data: null, orderable: false, searchable: false, render: (d, t, r) => t !== 'display' ? '' :
+                    kind === 'pending' ? `<input type="checkbox" class="select-row" data-id="${{esc(r[F.id])}}" ${{selected.has(r[F.id]) ? 'checked' : ''}}>` :
+                    kind === 'fixed' ? `<button class="btn-restore" data-id="${{esc(r[F.id])}}" onclick="restoreItem(this.dataset.id)">↩️</button>` : '' }},
+                {{ data: F.score, render: (d, t) => t !== 'display' ? d : kind === 'passed' ? '<span class="badge OK">OK</span>' : `<span class="badge ${{getRisk(d)}}">${{d}}</span>` }},
+                {{ data: F.cis, render: text, createdCell: td => {{ td.style.fontWeight = 'bold'; td.style.whiteSpace = 'nowrap'; }} }},
+                {{ data: F.cat, render: text }},
+                {{ data: F.desc, render: (d, t) => t === 'display' ? `<div class="desc-text">${{esc(d)}}</div>` : d }},
+                {{ data: F.key, render: (d, t, r) => t !== 'display' ? d + ' ' + r[F.item] : !d ? '' :
+                    `<div class='reg-box'><div><b>Key:</b> ${{esc(d)}}</div><div><b>Val:</b> ${{esc(r[F.item])}}</div></div>` +
+                    `<div class='btn-group'><button class="btn-icon" data-reg="${{esc(r[F.reg])}}" onclick="copyPathOnly(this.dataset.reg)" title="Copy path to clipboard">📄 Copy Path</button></div>` }},
+                {{ data: F.curr, render: (d, t) => t === 'display' ? `<div class="code-box">${{esc(d)}}</div>` : d }},
+                {{ data: F.exp, render: (d, t) => t === 'display' ? `<div class="code-box">${{esc(d)}}</div>` : d }}
+            ];
+        }}
+
+        function tableData(kind) {{
+            if (kind === 'passed') return DATA.passed;
+            if (kind === 'fixed') return [...fixed].map(id => findings.get(id));
+            return DATA.pending.filter(r => !fixed.has(r[F.id]));
+        }}
+
+        function getTable(kind) {{
+            if (tables[kind]) return tables[kind];
+            const id = {{ pending: '#tp', fixed: '#tf', passed: '#tpass' }}[kind];
+            // Server mode: paging, sorting, category filter and search run in Python, the browser holds one page
+            const source = SERVER ? {{ "serverSide": true, "processing": true, "ajax": {{ "url": "api/findings", "data": d => {{ d.kind = kind; }} }} }}
+                                  : {{ "data": tableData(kind), "deferRender": true }};
+            const t = $(id).DataTable({{
+                ...source, "columns": columnsFor(kind),
+                "pageLength": 50, "lengthMenu": [[25, 50, 100, -1], [25, 50, 100, "All"]], "order": [[ 2, "asc" ]],
+                "fixedHeader": true, "colReorder": true, "autoWidth": false, "columnDefs": [ {{ "type": "cis-sort", "targets": 2 }} ],
+                "initComplete": function() {{ initCustomResize(this); }}
+            }});
+            if (catFilter) t.column(3).search(catFilter).draw();
+            tables[kind] = t;
+            if (kind === 'fixed') tf = t; else if (kind === 'passed') tpass = t;
+            return t;
+        }}
+
         function initCustomResize(dt) {{
             const table = $(dt.api().table().node());
             const headers = table.find('thead th');
@@ -604,10 +868,13 @@ def generate_html(df, output_path, score, total, passed, failed, categories):
         function tab(id) {{
             $('.tab-content').removeClass('active'); $('#'+id).addClass('active');
             $('.tab').removeClass('active'); $(event.target).addClass('active');
-            tp.columns.adjust().draw(); tf.columns.adjust().draw(); tpass.columns.adjust().draw();
+            getTable(id).columns.adjust().draw(false);
         }}
         
-        function applyFilter(v) {{ tp.column(3).search(v).draw(); tf.column(3).search(v).draw(); tpass.column(3).search(v).draw(); }}
+        function applyFilter(v) {{
+            catFilter = v;
+            Object.values(tables).forEach(t => t.column(3).search(v).draw());
+        }}
 
         function copyPathOnly(path) {{
             navigator.clipboard.writeText(path).then(() => {{
@@ -632,12 +899,13 @@ def generate_html(df, output_path, score, total, passed, failed, categories):
         function getRisk(s) {{ if(s==100) return 'risk-100'; if(s>=60) return 'risk-high'; if(s>=40) return 'risk-med'; return 'risk-low'; }}
         
         // --- SCORE LOGIC ---
-        function updateScore() {{
-            const pending = tp.rows().count();
-            const fixed = tf.rows().count();
-            const passed = tpass.rows().count();
-            const total = pending + fixed + passed;
-            const compliant = fixed + passed;
+        function updateScore(counts) {{
+            // counts: the server's {{pending, fixed, passed}}; computed from the in-page data otherwise
+            const nFixed = counts ? counts.fixed : fixed.size;
+            const pending = counts ? counts.pending : findings.size - nFixed;
+            const passed = counts ? counts.passed : DATA.passed.length;
+            const total = pending + nFixed + passed;
+            const compliant = nFixed + passed;
             
             let pct = 0;
             if (total > 0) {{ pct = (compliant / total) * 100; }}
@@ -647,90 +915,65 @@ def generate_html(df, output_path, score, total, passed, failed, categories):
             if (pct > 80) {{ $('#score-val').addClass('val-good'); }} else {{ $('#score-val').addClass('val-bad'); }}
             
             $('#cnt-p').text(pending);
-            $('#cnt-f').text(fixed);
+            $('#cnt-f').text(nFixed);
+        }}
+
+        // Marks ids as fixed (toFixed) or pending again: one pass over the source table,
+        // one batched rows.add on the target and a single redraw each, whatever the number of ids
+        function moveIds(ids, toFixed) {{
+            if (SERVER) {{
+                return api('state', {{ [toFixed ? 'fixed' : 'pending']: [...ids].map(String) }}).then(c => {{
+                    Object.values(tables).forEach(t => t.draw(false));
+                    updateScore(c);
+                    return c.moved;
+                }});
+            }}
+            const moving = [];
+            for (const id of ids) {{
+                const r = findings.get(String(id));
+                if (!r || fixed.has(r[F.id]) === toFixed) continue;
+                toFixed ? fixed.add(r[F.id]) : fixed.delete(r[F.id]);
+                moving.push(r);
+            }}
+            if (moving.length === 0) return 0;
+            const movingIds = new Set(moving.map(r => r[F.id]));
+            const from = tables[toFixed ? 'pending' : 'fixed'], to = tables[toFixed ? 'fixed' : 'pending'];
+            if (from) from.rows((i, r) => movingIds.has(r[F.id])).remove().draw(false);
+            if (to) to.rows.add(moving).draw(false);
+            updateScore();
+            persistProgress();
+            return moving.length;
         }}
 
         function moveMarked() {{
-            const rowsToRemove = [];
-            const dataToMove = [];
-            tp.rows().every(function() {{
-                const $node = $(this.node());
-                if ($node.find('input.select-row').is(':checked')) {{
-                    const d = {{
-                        id: $node.attr('data-id'), cis: $node.attr('data-cis'),
-                        cat: $node.attr('data-cat'), desc: $node.attr('data-desc'),
-                        reg: $node.attr('data-reg'), regbtns: $node.attr('data-regbtns'),
-                        curr: $node.attr('data-curr'), exp: $node.attr('data-exp'),
-                        score: $node.attr('data-score')
-                    }};
-                    dataToMove.push(d);
-                    rowsToRemove.push(this.node());
-                }}
-            }});
-            dataToMove.forEach(d => addFixed(d));
-            tp.rows(rowsToRemove).remove();
+            moveIds(selected, true);
+            selected.clear();
             $('.select-all').prop('checked', false);
-            tp.draw(); tf.draw(); 
-            updateScore(); // Recalc Score
-            saveToStorage();
         }}
 
-        function restoreItem(btn) {{
-            const row = $(btn).closest('tr');
-            const d = {{
-                id: row.attr('data-id'), cis: row.attr('data-cis'),
-                cat: row.attr('data-cat'), desc: row.attr('data-desc'),
-                reg: row.attr('data-reg'), regbtns: row.attr('data-regbtns'),
-                curr: row.attr('data-curr'), exp: row.attr('data-exp'),
-                score: row.attr('data-score')
-            }};
-            addPending(d);
-            tf.row(row).remove().draw();
-            tp.draw(); 
-            updateScore(); 
-            saveToStorage();
-        }}
+        function restoreItem(id) {{ moveIds([id], false); }}
 
-        function addFixed(d) {{
-            if (!d || !d.id) return;
-            const r = getRisk(d.score);
-            const node = tf.row.add([
-                `<button class="btn-restore" onclick="restoreItem(this)">↩️</button>`,
-                `<span class="badge ${{r}}">${{d.score}}</span>`, d.cis, d.cat, d.desc, d.reg + ' ' + d.regbtns, d.curr, d.exp
-            ]).node();
-            $(node).attr('data-id', d.id).attr('data-cis', d.cis)
-                   .attr('data-cat', d.cat).attr('data-desc', d.desc)
-                   .attr('data-reg', d.reg).attr('data-regbtns', d.regbtns)
-                   .attr('data-curr', d.curr).attr('data-exp', d.exp)
-                   .attr('data-score', d.score);
-        }}
-        
-        function addPending(d) {{
-            if (!d || !d.id) return;
-            const r = getRisk(d.score);
-            const node = tp.row.add([
-                `<input type="checkbox" class="select-row">`,
-                `<span class="badge ${{r}}">${{d.score}}</span>`, d.cis, d.cat, d.desc, d.reg + ' ' + d.regbtns, d.curr, d.exp
-            ]).node();
-            $(node).attr('data-id', d.id).attr('data-cis', d.cis)
-                   .attr('data-cat', d.cat).attr('data-desc', d.desc)
-                   .attr('data-reg', d.reg).attr('data-regbtns', d.regbtns)
-                   .attr('data-curr', d.curr).attr('data-exp', d.exp)
-                   .attr('data-score', d.score);
+        function fixedIds() {{ return [...fixed]; }}
+
+        // Progress is saved from the Set (no table scans), coalescing bursts of changes into one write
+        let persistTimer = null;
+        function persistProgress() {{
+            clearTimeout(persistTimer);
+            persistTimer = setTimeout(saveToStorage, 250);
         }}
 
         function saveToStorage() {{
-            const data = [];
-            tf.rows().every(function() {{ 
-                const id = $(this.node()).attr('data-id');
-                if (id && id !== "undefined") data.push(id); 
-            }});
-            localStorage.setItem('hk_progress', JSON.stringify(data));
+            clearTimeout(persistTimer);
+            if (SERVER) return; // already saved by the server
+            localStorage.setItem('hk_progress', JSON.stringify(fixedIds()));
         }}
 
         function loadFromStorage() {{
+            // Fixed statuses carried over from returned workbooks, then this browser's own progress
+            const el = document.getElementById('kp-fixed');
+            const carried = el && el.textContent ? JSON.parse(el.textContent) : [];
             const ids = JSON.parse(localStorage.getItem('hk_progress') || '[]');
-            applyProgress(ids);
+            applyProgress(carried.concat(ids));
         }}
         
         function loadFromFile(input) {{
@@ -750,39 +993,11 @@ def generate_html(df, output_path, score, total, passed, failed, categories):
             input.value = '';
         }}
 
-        function applyProgress(ids) {{
-            const nodesToRemove = [];
-            tp.rows().every(function() {{
-                const node = this.node();
-                const id = String($(node).attr('data-id'));
-                if (ids.includes(id)) {{
-                    const d = {{
-                        id: $(node).attr('data-id'), cis: $(node).attr('data-cis'),
-                        cat: $(node).attr('data-cat'), desc: $(node).attr('data-desc'),
-                        reg: $(node).attr('data-reg'), regbtns: $(node).attr('data-regbtns'),
-                        curr: $(node).attr('data-curr'), exp: $(node).attr('data-exp'),
-                        score: $(node).attr('data-score')
-                    }};
-                    addFixed(d);
-                    nodesToRemove.push(node);
-                }}
-            }});
-            if (nodesToRemove.length > 0) {{
-                tp.rows(nodesToRemove).remove();
-                tp.draw(); tf.draw(); 
-                updateScore(); 
-                saveToStorage();
-            }}
-        }}
+        function applyProgress(ids) {{ return moveIds(ids, true); }}
 
         async function saveFile() {{
             saveToStorage(); 
-            const data = [];
-            tf.rows().every(function() {{ 
-                const id = $(this.node()).attr('data-id');
-                if (id && id !== "undefined") data.push(id);
-            }});
-            const str = JSON.stringify(data, null, 2); 
+            const str = JSON.stringify(SERVER ? (await api('state')).ids : fixedIds(), null, 2); 
             try {{
                 if (!fileHandle) {{
                     fileHandle = await window.showSaveFilePicker({{ suggestedName: 'progress.json', types: [{{ description: 'JSON', accept: {{ 'application/json': ['.json'] }} }}] }});
@@ -795,66 +1010,1937 @@ def generate_html(df, output_path, score, total, passed, failed, categories):
 </body>
 </html>
     """
-    with open(output_path, "w", encoding="utf-8") as f: f.write(html)
+    if offline:
+        page = minify_page(page)
+        page = page.replace(css_libs, ''.join(f'<style>{read_asset(n)}</style>' for n in OFFLINE_CSS))
+        page = page.replace(js_libs, ''.join(f'<script>{read_asset(n)}</script>' for n in OFFLINE_JS))
+    return tuple(page.split(HTML_ROWS_MARK))
+
+def iter_html_rows(dframe, written=0, tables=None, chunk_rows=5000):
+    for i in range(0, len(dframe), chunk_rows):
+        part = dframe.iloc[i:i + chunk_rows]
+        yield render_html_rows(part, written, tables)
+        written += len(part)
+
+def write_html_rows(f, dframe, written=0, tables=None):
+    """Appends the findings to an open data array; returns the number of records written so far."""
+    f.writelines(iter_html_rows(dframe, written, tables))
+    return written + len(dframe)
+
+def packed_json(pending, passed, tables):
+    """The compressed payload's JSON text, in pieces. The lookup tables go last, once all rows are interned."""
+    yield f'{{"fields":{json.dumps(FINDING_FIELDS)},"pending":['
+    yield from pending
+    yield '],"passed":['
+    yield from passed
+    yield '],"dict":' + json.dumps({f: list(t) for f, t in tables.items()}, ensure_ascii=False, separators=(',', ':')) + '}'
+
+def write_packed(f, pieces):
+    """Streams the text pieces into f as one gzip + base64 blob (never held in memory as a whole)."""
+    z = zlib.compressobj(9, zlib.DEFLATED, 31)  # 31 = gzip container, mtime 0 so the output is reproducible
+    rest = b''
+    def emit(data):
+        nonlocal rest
+        data = rest + data
+        cut = len(data) - len(data) % 3  # base64 in whole 3-byte groups, no padding mid-stream
+        f.write(base64.b64encode(data[:cut]).decode('ascii'))
+        rest = data[cut:]
+    for piece in pieces: emit(z.compress(piece.encode('utf-8')))
+    emit(z.flush())
+    f.write(base64.b64encode(rest).decode('ascii'))
+
+def write_html_page(f, shell, pending, passed, tables=None):
+    """
+    Writes the app page around the two findings arrays (iterables of JSON row text).
+    With interning tables (compressed mode) the payload is packed into the single data slot instead.
+    """
+    if tables is None:
+        head, middle, tail = shell
+        f.write(head); f.writelines(pending); f.write(middle); f.writelines(passed); f.write(tail)
+        return
+    head, tail = shell
+    f.write(head)
+    write_packed(f, packed_json(pending, passed, tables))
+    f.write(tail)
+
+def spool_pieces(spool, size=1 << 20):
+    spool.seek(0)
+    return iter(lambda: spool.read(size), '')
+
+def generate_html(df, output_path, score, total, passed, failed, categories, offline=False, compress=False, partitions=None, fixed=()):
+    """partitions: the (failed, passed) slices from split_results, already in display order. fixed: IDs pre-marked Fixed."""
+    with stage('html_prepare', len(df)):
+        if partitions is None: _, df_failed, df_passed = split_results(df)
+        else: df_failed, df_passed = partitions
+        sorted_cats = sorted([str(c) for c in categories if str(c) != 'nan'])
+        shell = html_shell(score, total, passed, failed, sorted_cats, offline, compress, fixed=fixed)
+    tables = {f: {} for f in DICT_FIELDS} if compress else None
+
+    # Written piece by piece, the full page is never built in memory
+    with stage('html_write', len(df_failed) + len(df_passed)), open(output_path, "w", encoding="utf-8") as f:
+        write_html_page(f, shell, iter_html_rows(df_failed, tables=tables), iter_html_rows(df_passed, tables=tables), tables)
     print(f"✅ HTML App Created: {output_path}")
 
-def main():
-    report, templates = select_files_gui()
-    if not report: return
-    
-    df = pd.read_csv(report)
+def schema_columns(path, schema):
+    header = pd.read_csv(path, nrows=0).columns
+    cols = [c for c in header if c in schema or c == 'id']
+    return cols, {c: schema.get(c, str) for c in cols}
+
+def read_csv_fast(path, schema):
+    """
+    Reads only the schema columns of a CSV with explicit dtypes ('id' is accepted for 'ID').
+    Uses the pyarrow engine when installed, otherwise the C engine with memory mapping.
+    """
+    cols, dtypes = schema_columns(path, schema)
+    if HAS_PYARROW:
+        try: return pd.read_csv(path, engine='pyarrow', usecols=cols, dtype=dtypes)
+        except Exception: pass  # e.g. malformed quoting that only the C parser tolerates
+    return pd.read_csv(path, usecols=cols, dtype=dtypes, memory_map=True)
+
+def _title_categories(s):
+    if not isinstance(s.dtype, pd.CategoricalDtype): s = s.astype('category')
+    titled = s.cat.categories.astype(str).str.title()
+    if titled.is_unique: return s.cat.rename_categories(titled)
+    return s.astype(str).str.title().astype('category')
+
+def load_report(report):
+    return prepare_report(read_csv_fast(report, REPORT_SCHEMA))
+
+def iter_report_chunks(report, chunk_size):
+    """Yields the prepared report in chunks of chunk_size rows (C engine, memory mapped)."""
+    cols, dtypes = schema_columns(report, REPORT_SCHEMA)
+    with pd.read_csv(report, usecols=cols, dtype=dtypes, memory_map=True, chunksize=chunk_size) as reader:
+        for chunk in reader:
+            yield prepare_report(chunk)
+
+def prepare_report(df):
     if 'id' in df.columns: df.rename(columns={'id': 'ID'}, inplace=True)
     if 'ID' in df.columns: df['CIS'] = df['ID']
         
-    df['ID'] = df['ID'].astype(str).str.strip()
+    df['ID'] = df['ID'].str.strip()
     if 'TestResult' not in df.columns and 'Result' in df.columns:
          df['TestResult'] = df['TestResult'].apply(lambda x: 'Failed' if 'Failed' in str(x) else 'Passed')
-    df['TestResult'] = df['TestResult'].astype(str).str.title()
+    df['TestResult'] = _title_categories(df['TestResult'])
+    return df
 
-    if templates:
-        print(f"Processing {len(templates)} template files...")
-        combined_tmpl = pd.DataFrame()
-        for t_file in templates:
-            try:
-                t = pd.read_csv(t_file)
-                if 'id' in t.columns: t.rename(columns={'id': 'ID'}, inplace=True)
-                t['ID'] = t['ID'].astype(str).str.strip()
-                
-                if 'Name' in t.columns:
-                    t['Description'] = t['Name']
-                
-                desired_cols = ['ID', 'Description', 'Method', 'MethodArgument', 'RegistryPath', 'RegistryItem', 'RecommendedValue']
-                actual_cols = [c for c in desired_cols if c in t.columns]
-                
-                if combined_tmpl.empty: combined_tmpl = t[actual_cols]
-                else: combined_tmpl = pd.concat([combined_tmpl, t[actual_cols]])
-            except Exception as e: print(f"Error loading template {t_file}: {e}")
-        
-        if not combined_tmpl.empty:
-            combined_tmpl = combined_tmpl.drop_duplicates(subset=['ID'], keep='last')
-            df = pd.merge(df, combined_tmpl, on='ID', how='left', suffixes=('', '_tmpl'))
+def _file_digest(path, index):
+    # Content hash, reused from the index while the file's mtime and size are unchanged
+    st = os.stat(path)
+    entry = index.get(path)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size: return entry[2]
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''): h.update(chunk)
+    index[path] = [st.st_mtime_ns, st.st_size, h.hexdigest()]
+    return h.hexdigest()
+
+def template_cache_key(templates, cache_dir):
+    """Key of a template set: ordered content hashes (order matters, later templates win)."""
+    index_path = os.path.join(cache_dir, 'template_hashes.json')
+    try:
+        with open(index_path, encoding='utf-8') as f: index = json.load(f)
+    except (OSError, ValueError): index = {}
+    before = json.dumps(index, sort_keys=True)
+    digests = [_file_digest(os.path.abspath(t), index) for t in templates]
+    if json.dumps(index, sort_keys=True) != before:
+        tmp = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f: json.dump(index, f)
+        os.replace(tmp, index_path)
+    return hashlib.sha256(f"v{TEMPLATE_CACHE_VERSION}|{'|'.join(digests)}".encode()).hexdigest()[:32]
+
+def parse_templates(templates):
+    """
+    Parses and merges the template CSVs into a single catalog indexed by ID (one row per ID).
+    Returns (catalog, ok) - ok is False if any template failed to load.
+    """
+    frames, ok = [], True
+    print(f"Processing {len(templates)} template files...")
+    for t_file in templates:
+        try:
+            t = read_csv_fast(t_file, TEMPLATE_SCHEMA)
+            if 'id' in t.columns: t.rename(columns={'id': 'ID'}, inplace=True)
+            t['ID'] = t['ID'].str.strip()
             
-            if 'Description_tmpl' in df.columns:
-                df['Description'] = df['Description_tmpl'].combine_first(df['Description'])
-                df.drop(columns=['Description_tmpl'], inplace=True, errors='ignore')
+            if 'Name' in t.columns:
+                t['Description'] = t['Name']
             
-            for col in ['Method', 'MethodArgument']:
-                 if col + '_tmpl' in df.columns:
-                     df[col] = df[col + '_tmpl']
-                     df.drop(columns=[col + '_tmpl'], inplace=True)
+            desired_cols = ['ID', 'Description', 'Method', 'MethodArgument', 'RegistryPath', 'RegistryItem', 'RecommendedValue']
+            frames.append(t[[c for c in desired_cols if c in t.columns]])
+        except Exception as e:
+            print(f"Error loading template {t_file}: {e}")
+            ok = False
+    
+    if not frames: return pd.DataFrame(), ok
+    combined_tmpl = pd.concat(frames, ignore_index=True).drop_duplicates(subset=['ID'], keep='last')
+    if 'Method' in combined_tmpl.columns: combined_tmpl['Method'] = combined_tmpl['Method'].astype('category')
+    return combined_tmpl.set_index('ID'), ok
+
+def load_templates(templates, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Returns the merged template catalog (indexed by ID), or an empty DataFrame.
+    The catalog is cached in cache_dir keyed by the template contents, so unchanged
+    finding lists are never parsed twice (across runs and across hosts). cache_dir=None disables it.
+    """
+    if not templates: return pd.DataFrame()
+    cache_file = None
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            cache_file = os.path.join(cache_dir, f"templates_{template_cache_key(templates, cache_dir)}.pkl")
+            if os.path.exists(cache_file):
+                print(f"Using cached template catalog ({len(templates)} files)")
+                return pd.read_pickle(cache_file)
+        except Exception as e:
+            print(f"Template cache unavailable: {e}")
+            cache_file = None
 
-    df['RiskScore'] = df.apply(calculate_risk, axis=1)
-    df['Fix'] = df.apply(generate_fix, axis=1) if 'RegistryPath' in df.columns else ""
+    combined_tmpl, ok = parse_templates(templates)
+    if cache_file and ok and not combined_tmpl.empty:
+        tmp = f"{cache_file}.{os.getpid()}.tmp"
+        combined_tmpl.to_pickle(tmp)
+        os.replace(tmp, cache_file)
+    return combined_tmpl
+
+def catalog_digest(combined_tmpl):
+    if combined_tmpl is None or combined_tmpl.empty: return None
+    h = hashlib.sha256(json.dumps([str(c) for c in combined_tmpl.columns]).encode())
+    h.update(pd.util.hash_pandas_object(combined_tmpl, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+def output_options(opts):
+    """The options that change the bytes written. Writer mode, instrumentation and output locations don't."""
+    export = opts['export'] or ('parquet' if opts['export_dir'] else None)
+    return {'formula_mode': opts['formula_mode'], 'streaming': opts['streaming'], 'offline': opts['offline'],
+            'compress_html': opts['compress_html'], 'export': export, 'partitioned': bool(export and opts['export_dir']),
+            # Only the export follows the chunks (one row group / record batch each); the workbook and app don't
+            'chunk_size': opts['chunk_size'] if export and opts['streaming'] else None}
+
+def output_cache_key(report, combined_tmpl, rules, opts, history=None):
+    """Fingerprint of everything the outputs depend on: report bytes, template catalog, rules, options, code (and the Trend history)."""
+    h = hashlib.sha256()
+    with open(report, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''): h.update(chunk)
+    # The code itself stands in for a version number (plus the inlined assets in offline mode)
+    for path in [os.path.abspath(__file__)] + ([os.path.join(ASSETS_DIR, n) for n in OFFLINE_CSS + OFFLINE_JS] if opts['offline'] else []):
+        with open(path, 'rb') as f: h.update(f.read())
+    settings = {'version': OUTPUT_CACHE_VERSION, 'templates': catalog_digest(combined_tmpl),
+                'rules': {k: v for k, v in (rules or load_rules()).items() if k != 'keyword_pattern'},
+                'options': output_options(opts), 'history': history}
+    h.update(json.dumps(settings, sort_keys=True).encode())
+    return h.hexdigest()[:32]
+
+def restore_outputs(cache_dir, key, targets):
+    """Copies a cached entry's artifacts to targets ({kind: path}); returns its manifest, or None on a miss."""
+    entry = os.path.join(cache_dir, key)
+    try:
+        with open(os.path.join(entry, 'manifest.json'), encoding='utf-8') as f: manifest = json.load(f)
+        # Copies, not links: the workbooks get edited (statuses, notes) and must not change the cached originals
+        for kind, path in targets.items(): shutil.copyfile(os.path.join(entry, manifest['artifacts'][kind]['file']), path)
+    except (OSError, ValueError, KeyError): return None
+    return manifest
+
+def store_outputs(cache_dir, key, artifacts, report, summary):
+    """Adds generated artifacts ({kind: path}) to the cache with a manifest; the entry appears atomically."""
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=f'{key}.', dir=cache_dir)
+    try:
+        manifest = {'version': OUTPUT_CACHE_VERSION, 'key': key, 'report': os.path.abspath(report), 'summary': summary, 'artifacts': {}}
+        for kind, path in artifacts.items():
+            name = kind + os.path.splitext(path)[1]
+            shutil.copyfile(path, os.path.join(tmp, name))
+            manifest['artifacts'][kind] = {'file': name, 'size': os.path.getsize(path), 'sha256': _file_digest(path, {})}
+        with open(os.path.join(tmp, 'manifest.json'), 'w', encoding='utf-8') as f: json.dump(manifest, f, indent=2)
+        os.replace(tmp, os.path.join(cache_dir, key))
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)  # e.g. another worker stored the same key first
+
+def merge_templates(df, combined_tmpl):
+    """Joins the template catalog on ID (template Description / Method / MethodArgument win)."""
+    if combined_tmpl is None or combined_tmpl.empty: return df
+    df = df.join(combined_tmpl, on='ID', lsuffix='', rsuffix='_tmpl')
+    
+    if 'Description_tmpl' in df.columns:
+        df['Description'] = df['Description_tmpl'].combine_first(df['Description'])
+        df.drop(columns=['Description_tmpl'], inplace=True, errors='ignore')
     
+    for col in ['Method', 'MethodArgument']:
+         if col + '_tmpl' in df.columns:
+             df[col] = df[col + '_tmpl']
+             df.drop(columns=[col + '_tmpl'], inplace=True)
+    return df
+
+def enrich(df, combined_tmpl, rules=None):
+    with stage('merge_templates', len(df)): df = merge_templates(df, combined_tmpl)
+    with stage('normalize_registry', len(df)): df = normalize_registry(df)
+    with stage('calculate_risk', len(df)): df['RiskScore'] = calculate_risk(df, rules)
+    with stage('generate_fix', len(df)): df['Fix'] = generate_fix(df)
+    with stage('compact_findings', len(df)): df = compact_findings(df)
+    return df
+
+COMPACT_MAX_UNIQUE = 0.5  # text columns with at most this share of distinct values become categoricals
+
+def compact_findings(df):
+    """
+    Shrinks the enriched frame: repetitive text columns (registry paths, fixes, values, names in merged reports)
+    become categoricals - each distinct string stored once plus small integer codes - and RiskScore the
+    smallest integer dtype. ~550 -> ~33 bytes/row on a 200k-row merged report (2,000 controls).
+    """
+    for col in df.columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype) or not pd.api.types.is_string_dtype(s.dtype): continue
+        if len(s) and s.nunique() <= len(s) * COMPACT_MAX_UNIQUE: df[col] = s.astype('category')
+    df['RiskScore'] = pd.to_numeric(df['RiskScore'], downcast='integer')
+    return df
+
+def split_results(df):
+    """
+    Reorders the frame once - failed checks riskiest first, then passed checks by category - and returns
+    (df, failed, passed) where the partitions are row slices of it (views, no copies under copy-on-write).
+    """
+    res = df['TestResult']
+    failed = np.flatnonzero(res.str.contains('Failed', na=False).to_numpy())
+    passed = np.flatnonzero((res.str.contains('Passed', na=False) & ~res.str.contains('Failed', na=False)).to_numpy())
+    others = np.setdiff1d(np.arange(len(df)), np.concatenate([failed, passed]))
+    failed = failed[np.argsort(-df['RiskScore'].to_numpy(dtype=np.int64)[failed], kind='stable')]
+    passed = passed[df['Category'].iloc[passed].reset_index(drop=True).sort_values(kind='stable').index.to_numpy()]
+    df = df.iloc[np.concatenate([failed, passed, others])]
+    return df, df.iloc[:len(failed)], df.iloc[len(failed):len(failed) + len(passed)]
+
+def compliance_score(passed, total):
+    return (passed / total * 100) if total else 0
+
+def report_summary(rows, failed, passed):
+    return {'rows': rows, 'failed': failed, 'passed': passed, 'score': round(compliance_score(passed, rows), 1)}
+
+def stream_report(report, combined_tmpl, xlsx_path, html_path, rules=None, formula_mode='classic', chunk_size=50000,
+                  offline=False, compress=False, sink=None, history=None, carried=None):
+    """
+    Constant-memory variant of the pipeline: the report is enriched chunk by chunk, Excel rows go
+    straight to xlsxwriter's constant_memory temp files and the HTML findings are spooled to temp files,
+    so only one chunk is held in memory. Returns (rows, failed, passed).
+    Excel tables can't be used in this mode, the detail sheets get an autofilter instead.
+    sink(chunk) gets every enriched chunk; history(summary) returns the runs for the Trend sheet once the totals are known.
+    carried: statuses and notes from returned workbooks, see generate_excel.
+    """
+    carried = carried or {}
+    wb = stable_workbook(xlsxwriter.Workbook(xlsx_path, {'constant_memory': True}))
+    # Sheets are created up front to keep the tab order; rows are then written strictly top to bottom
+    ws_dash, ws_fail, ws_pass = wb.add_worksheet('Dashboard'), wb.add_worksheet('Action Items'), wb.add_worksheet('Passed Checks')
+    ws_notes = wb.add_worksheet('Notes')
+    ws_trend = wb.add_worksheet('Trend') if history else None
+    ws_stats = wb.add_worksheet('Stats')
+    fmts = excel_formats(wb)
+
+    spool_fail = tempfile.TemporaryFile('w+', encoding='utf-8')
+    spool_pass = tempfile.TemporaryFile('w+', encoding='utf-8')
+    counts, categories = None, set()
+    tables = {f: {} for f in DICT_FIELDS} if compress else None
+    cols, fail, pas, row_fail, row_pass = None, None, None, 1, 1
+    try:
+        for chunk in iter_report_chunks(report, chunk_size):
+            chunk = enrich(chunk, combined_tmpl, rules)  # stages are logged once per chunk
+            if sink: sink(chunk)
+            if cols is None:
+                cols = export_columns(chunk)
+                fail, pas = sheet_layout(cols, 0, formula_mode), sheet_layout(cols, 0, formula_mode)
+                ws_fail.write_row(0, 0, cols, fmts['header'])
+                ws_pass.write_row(0, 0, cols, fmts['header'])
+
+            c_failed = chunk[chunk['TestResult'].str.contains('Failed', na=False)]
+            c_passed = chunk[chunk['TestResult'].str.contains('Passed', na=False)]
+            key_f = (fail['key_idx'], fail['cat_char'], fail['status_char']) if fail['key_idx'] else None
+            key_p = (pas['key_idx'], pas['cat_char'], pas['status_char']) if pas['key_idx'] else None
+            write_html_rows(spool_fail, c_failed, row_fail - 1, tables)
+            write_html_rows(spool_pass, c_passed, row_pass - 1, tables)
+            row_fail = write_rows(ws_fail, row_fail, export_frame(c_failed, cols, carried_status(c_failed, carried.get('statuses'), '')), key_f)
+            row_pass = write_rows(ws_pass, row_pass, export_frame(c_passed, cols, carried_status(c_passed, carried.get('statuses'), 'Passed')), key_p)
+
+            c_counts = result_counts(chunk)
+            counts = c_counts if counts is None else counts.add(c_counts, fill_value=0)
+            categories.update(str(c) for c in chunk['Category'].dropna().unique())
+
+        n_fail, n_pass = row_fail - 1, row_pass - 1
+        total = int(counts.sum()) if counts is not None else 0
+        fail = sheet_layout(cols, n_fail, formula_mode)
+        pas = sheet_layout(cols, n_pass, formula_mode)
+        finish_detail_sheet(ws_fail, fail, fmts, '#C00000', None)
+        ws_fail.set_column(f"{fail['cat_char']}:{fail['cat_char']}", 25)
+        finish_detail_sheet(ws_pass, pas, fmts, '#00B050', None, extra_rules=[('Passed', 'green')])
+        write_notes_sheet(ws_notes, fmts, table=False, notes=carried.get('notes', ()))
+        if ws_trend: write_trend_sheet(wb, ws_trend, history({'rows': total, 'failed': n_fail, 'passed': n_pass,
+                                                              'score': round(compliance_score(n_pass, total), 1)}), fmts)
+        pivot = stats_pivot(counts if counts is not None else pd.Series(dtype=int))
+        write_stats_sheet(ws_stats, pivot, total, fail, pas, formula_mode)
+        write_dashboard(wb, ws_dash, fmts, total, len(pivot), merge_cells=False)
+        with stage('excel_save', total): wb.close()
+        print(f"✅ Excel Created with Notes & Clean Registry Paths: {xlsx_path}")
+
+        shell = html_shell(compliance_score(n_pass, total), total, n_pass, n_fail, sorted(categories), offline, compress,
+                           fixed=carried_fixed(carried))
+        with stage('html_write', total), open(html_path, "w", encoding="utf-8") as f:
+            write_html_page(f, shell, spool_pieces(spool_fail), spool_pieces(spool_pass), tables)
+        print(f"✅ HTML App Created: {html_path}")
+    finally:
+        spool_fail.close(); spool_pass.close()
+    return total, n_fail, n_pass
+
+# --- Findings Store (SQLite history) ---
+
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY, host TEXT NOT NULL, report TEXT, report_sha256 TEXT NOT NULL,
+    scanned_at TEXT, run_at TEXT, rows INTEGER, failed INTEGER, passed INTEGER, score REAL,
+    UNIQUE (host, report_sha256)
+);
+CREATE TABLE IF NOT EXISTS findings (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    id TEXT, category TEXT, description TEXT, test_result TEXT, severity TEXT, result TEXT,
+    recommended TEXT, registry_path TEXT, registry_item TEXT, risk_score INTEGER, fix TEXT
+);
+CREATE TABLE IF NOT EXISTS statuses (
+    host TEXT NOT NULL, id TEXT NOT NULL, status TEXT NOT NULL, updated_at TEXT, workbook TEXT,
+    PRIMARY KEY (host, id)
+);
+CREATE TABLE IF NOT EXISTS notes (
+    host TEXT NOT NULL, noted TEXT NOT NULL, author TEXT NOT NULL, control TEXT NOT NULL, note TEXT NOT NULL, workbook TEXT,
+    UNIQUE (host, noted, author, control, note)
+);
+CREATE INDEX IF NOT EXISTS runs_host ON runs (host, scanned_at);
+CREATE INDEX IF NOT EXISTS findings_run ON findings (run_id);
+CREATE INDEX IF NOT EXISTS findings_control ON findings (id, run_id);
+"""
+# findings column -> enriched frame column(s), first non-empty wins
+STORE_FIELDS = {
+    'id': ['ID'], 'category': ['Category'], 'description': ['Description', 'Name'], 'test_result': ['TestResult'],
+    'severity': ['Severity'], 'result': ['Result'], 'recommended': ['Recommended', 'RecommendedValue'],
+    'registry_path': ['RegShortPath'], 'registry_item': ['RegistryItem'], 'risk_score': ['RiskScore'], 'fix': ['Fix'],
+}
+INSERT_FINDING = f"INSERT INTO findings (run_id, {', '.join(STORE_FIELDS)}) VALUES ({', '.join('?' * (len(STORE_FIELDS) + 1))})"
+COMPLETE_RUNS = "SELECT * FROM runs WHERE rows IS NOT NULL"  # a run gets its summary once all findings are in
+
+def open_store(path):
+    """Connection to the findings store (created on first use). WAL lets readers and batch workers share it."""
+    con = sqlite3.connect(path, timeout=120)
+    con.execute('PRAGMA journal_mode = WAL')
+    con.execute('PRAGMA foreign_keys = ON')
+    con.executescript(STORE_SCHEMA)
+    return con
+
+def store_rows(dframe):
+    """Findings of a frame as tuples in STORE_FIELDS order (plain Python values, None for missing)."""
+    def col(names):
+        out = pd.Series(None, index=dframe.index, dtype=object)
+        for n in names:
+            if n in dframe.columns: out = out.fillna(dframe[n].astype(object))
+        return out.where(out.notna(), None).tolist()
+    return zip(*[col(names) for names in STORE_FIELDS.values()])
+
+# The three steps below don't commit: callers group them into transactions (`with con:`)
+def begin_run(con, host, report, digest):
+    """Registers a run of `report` (summary still empty); returns its run_id, or None if this exact report is already stored."""
+    con.execute('DELETE FROM runs WHERE host = ? AND report_sha256 = ? AND rows IS NULL', (host, digest))  # left over by a crash
+    scanned = datetime.fromtimestamp(os.path.getmtime(report)).isoformat(sep=' ', timespec='seconds')
+    cur = con.execute('INSERT OR IGNORE INTO runs (host, report, report_sha256, scanned_at, run_at) VALUES (?, ?, ?, ?, ?)',
+                      (host, os.path.abspath(report), digest, scanned, datetime.now().isoformat(sep=' ', timespec='seconds')))
+    return cur.lastrowid if cur.rowcount else None
+
+def add_findings(con, run_id, dframe):
+    con.executemany(INSERT_FINDING, ((run_id, *row) for row in store_rows(dframe)))
+
+def finish_run(con, run_id, summary):
+    con.execute('UPDATE runs SET rows = ?, failed = ?, passed = ?, score = ? WHERE run_id = ?',
+                (summary['rows'], summary['failed'], summary['passed'], summary['score'], run_id))
+
+def report_stored(con, host, digest):
+    return con.execute(f'SELECT 1 FROM ({COMPLETE_RUNS}) WHERE host = ? AND report_sha256 = ?', (host, digest)).fetchone() is not None
+
+def run_history(con, host, exclude_digest=None):
+    """Stored runs of a host, oldest scan first: scanned_at, score, failed, passed, rows (+ run_id, report)."""
+    return pd.read_sql_query(f'SELECT run_id, report, scanned_at, score, failed, passed, rows FROM ({COMPLETE_RUNS}) '
+                             'WHERE host = ? AND report_sha256 IS NOT ? ORDER BY scanned_at, run_id', con, params=(host, exclude_digest))
+
+def latest_runs(con):
+    """The most recent run of every host, lowest score first."""
+    return pd.read_sql_query(f"""SELECT host, scanned_at, score, failed, passed, rows, runs_stored FROM (
+        SELECT *, ROW_NUMBER() OVER (PARTITION BY host ORDER BY scanned_at DESC, run_id DESC) AS n,
+               COUNT(*) OVER (PARTITION BY host) AS runs_stored FROM ({COMPLETE_RUNS})) WHERE n = 1 ORDER BY score, host""", con)
+
+def failing_hosts(con, control_id):
+    """Hosts whose most recent run fails the control, riskiest first."""
+    return pd.read_sql_query(f"""SELECT r.host, r.scanned_at, f.id, f.category, f.description, f.result, f.recommended, f.risk_score, f.fix
+        FROM (SELECT *, ROW_NUMBER() OVER (PARTITION BY host ORDER BY scanned_at DESC, run_id DESC) AS n FROM ({COMPLETE_RUNS})) r
+        JOIN findings f ON f.run_id = r.run_id
+        WHERE r.n = 1 AND f.id = ? AND f.test_result LIKE '%Failed%' ORDER BY f.risk_score DESC, r.host""", con, params=(control_id,))
+
+# --- Workbook Read-back (analyst statuses and notes) ---
+
+STATUS_SHEETS = ['Action Items', 'Passed Checks']
+# The most recently modified workbook decides a control's status, whatever order the workbooks are imported in
+UPSERT_STATUS = """INSERT INTO statuses (host, id, status, updated_at, workbook) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (host, id) DO UPDATE SET status = excluded.status, updated_at = excluded.updated_at, workbook = excluded.workbook
+WHERE excluded.updated_at >= statuses.updated_at"""
+INSERT_NOTE = "INSERT OR IGNORE INTO notes (host, noted, author, control, note, workbook) VALUES (?, ?, ?, ?, ?, ?)"
+
+def workbook_host(path):
+    """Host of a generated workbook from its name (<host>_Report_<date>_<time>.xlsx), else the file name."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    m = re.match(r'^(.+)_Report_\d{8}_\d{4}$', stem)
+    return m.group(1) if m else stem
+
+def _cell_text(v):
+    if v is None: return ''
+    if isinstance(v, datetime): return v.date().isoformat() if v.time() == datetime.min.time() else v.isoformat(sep=' ', timespec='minutes')
+    return str(v).strip()
+
+def read_workbook_edits(path):
+    """
+    The analysts' edits in a KittyPorter workbook, streamed with openpyxl read_only (row by row, no styles):
+    {CIS: Status} over both detail sheets ('' where cleared or left at the default 'Passed') and the filled Notes rows.
+    """
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        statuses, notes = {}, []
+        for name in STATUS_SHEETS:
+            if name not in wb.sheetnames: continue
+            ws = wb[name]
+            ws.reset_dimensions()  # files re-saved by other tools may carry a stale sheet size
+            rows = ws.iter_rows(values_only=True)
+            header = [_cell_text(v) for v in next(rows, ())]
+            if 'CIS' not in header or 'Status' not in header: continue
+            ci, si = header.index('CIS'), header.index('Status')
+            for row in rows:
+                cis = _cell_text(row[ci]) if ci < len(row) else ''
+                if not cis: continue
+                status = _cell_text(row[si]) if si < len(row) else ''
+                statuses[cis] = '' if status == 'Passed' else status
+        if 'Notes' in wb.sheetnames:
+            ws = wb['Notes']
+            ws.reset_dimensions()
+            for row in ws.iter_rows(min_row=2, max_col=len(NOTES_HEADERS), values_only=True):
+                note = tuple(_cell_text(v) for v in row) + ('',) * (len(NOTES_HEADERS) - len(row))
+                if any(note): notes.append(note)
+    finally:
+        wb.close()
+    return statuses, notes
+
+def _edits_in_worker(path):
+    try: return read_workbook_edits(path), None
+    except Exception as e: return ({}, []), f"{type(e).__name__}: {e}"
+
+def import_workbooks(workbooks, store, workers=None, host=None):
+    """
+    Bulk-imports returned workbooks into the findings store: read in worker processes, written in one transaction.
+    A control's status comes from the host's most recently modified workbook; identical notes are kept once.
+    Returns one {'workbook', 'host', 'statuses', 'notes', 'error'} per workbook.
+    """
+    con = open_store(store)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool, con:
+        for path, ((statuses, notes), error) in zip(workbooks, pool.map(_edits_in_worker, workbooks, chunksize=8)):
+            h = host or workbook_host(path)
+            if not error:
+                updated = datetime.fromtimestamp(os.path.getmtime(path)).isoformat(sep=' ', timespec='seconds')
+                con.executemany(UPSERT_STATUS, [(h, cis, status, updated, path) for cis, status in statuses.items()])
+                con.executemany(INSERT_NOTE, [(h, *note, path) for note in notes])
+            results.append({'workbook': path, 'host': h, 'statuses': sum(1 for v in statuses.values() if v), 'notes': len(notes), 'error': error})
+    con.close()
+    return results
+
+def carried_edits(con, host):
+    """The host's imported statuses ({CIS: Status}, cleared ones left out) and notes, for its next outputs; None if there are none."""
+    statuses = dict(con.execute("SELECT id, status FROM statuses WHERE host = ? AND status != ''", (host,)).fetchall())
+    notes = [list(n) for n in con.execute('SELECT noted, author, control, note FROM notes WHERE host = ? ORDER BY noted, rowid', (host,))]
+    return {'statuses': statuses, 'notes': notes} if statuses or notes else None
+
+def carried_fixed(carried):
+    """IDs to pre-mark as Fixed in the HTML app (the app has no other statuses), stripped like the app's IDs."""
+    return [cis.strip() for cis, status in (carried or {}).get('statuses', {}).items() if status == 'Fixed']
+
+# --- Columnar Export (Parquet / Feather) ---
+
+EXPORT_SCHEMA_VERSION = 1  # bump when columns or types change
+# Same columns as the findings store, plus the CIS label and the check method
+EXPORT_FIELDS = {**STORE_FIELDS, 'cis': ['CIS', 'ID'], 'method': ['Method']}
+EXPORT_DICT_FIELDS = {'host', 'category', 'test_result', 'severity', 'recommended', 'registry_path', 'registry_item', 'method'}
+
+def export_schema(partitioned=False, metadata=None):
+    """
+    The fixed Arrow schema of an export, whatever the report contained: repetitive columns are dictionary-encoded
+    (categoricals in pandas), risk_score int16. Partitioned exports leave host to the host=... directory.
+    """
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    fields = [] if partitioned else [pa.field('host', dictionary)]
+    fields.append(pa.field('scanned_at', pa.timestamp('ms')))  # Parquet has no second resolution
+    fields += [pa.field(name, pa.int16() if name == 'risk_score' else dictionary if name in EXPORT_DICT_FIELDS else pa.string())
+               for name in EXPORT_FIELDS]
+    return pa.schema(fields, metadata={'kittyporter': json.dumps(metadata, sort_keys=True)} if metadata else None)
+
+def export_column(dframe, names, dtype):
+    present = [n for n in names if n in dframe.columns]
+    if not present: return pa.nulls(len(dframe), dtype)
+    s = dframe[present[0]]
+    if dtype == pa.int16(): return pa.array(pd.to_numeric(s, errors='coerce'), from_pandas=True).cast(dtype)
+    if len(present) == 1 and isinstance(s.dtype, pd.CategoricalDtype):
+        return pa.array(s.cat.rename_categories(s.cat.categories.astype(str))).cast(dtype)  # codes are kept as they are
+    out = s.astype(object)
+    for n in present[1:]: out = out.fillna(dframe[n].astype(object))
+    arr = pa.array(out.where(out.notna(), None).map(str, na_action='ignore'), type=pa.string(), from_pandas=True)
+    return (arr.dictionary_encode() if pa.types.is_dictionary(dtype) else arr).cast(dtype)
+
+def export_table(dframe, schema, host, scanned_at):
+    """One chunk of the enriched frame in the export schema (host and scan time repeated on every row)."""
+    n, arrays = len(dframe), []
+    for field in schema:
+        if field.name == 'host': arrays.append(pa.DictionaryArray.from_arrays(pa.array(np.zeros(n, dtype=np.int32)), pa.array([host])))
+        elif field.name == 'scanned_at': arrays.append(pa.array(np.full(n, np.datetime64(scanned_at, 'ms'))))
+        else: arrays.append(export_column(dframe, EXPORT_FIELDS[field.name], field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+def export_path(base, host, report, ts, fmt, export_dir=None):
+    """<base>_Findings_<ts>.<fmt>, or export_dir/host=<host>/date=<scan date>/<host>_<ts>.<fmt> (hive partitions)."""
+    if not export_dir: return f"{base}_Findings_{ts}.{fmt}"
+    day = datetime.fromtimestamp(os.path.getmtime(report)).strftime('%Y-%m-%d')
+    return os.path.join(export_dir, f"host={quote(host, safe='')}", f"date={day}", f"{host}_{ts}.{fmt}")
+
+def open_export(path, fmt, report, host, partitioned=False):
+    """
+    Returns (write(chunk), close()) for an export of `report`. Parquet is written row group by row group;
+    Feather (uncompressed, so readers can memory-map it) is assembled at close since an Arrow IPC file holds
+    one dictionary per column. Host, report, its sha256 and scan time go into the schema metadata.
+    """
+    if not HAS_PYARROW: raise RuntimeError("the Parquet/Feather export needs pyarrow (pip install pyarrow)")
+    scanned = datetime.fromtimestamp(int(os.path.getmtime(report)))
+    schema = export_schema(partitioned, {'schema_version': EXPORT_SCHEMA_VERSION, 'host': host, 'report': os.path.abspath(report),
+                                         'report_sha256': _file_digest(report, {}), 'scanned_at': scanned.isoformat()})
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tables = []
+    writer = pq.ParquetWriter(path, schema, compression='zstd') if fmt == 'parquet' else None
+
+    def write(chunk):
+        table = export_table(chunk, schema, host, scanned)
+        if writer: writer.write_table(table)
+        else: tables.append(table)
+    def close():
+        if writer: return writer.close()
+        table = pa.concat_tables(tables).unify_dictionaries().combine_chunks() if tables else schema.empty_table()
+        feather.write_feather(table, path, compression='uncompressed')
+    return write, close
+
+def export_findings(dframe, path, fmt, report, host, partitioned=False):
+    write, close = open_export(path, fmt, report, host, partitioned)
+    write(dframe)
+    close()
+    print(f"✅ {fmt.title()} Export Created: {path}")
+
+# --- Instrumentation (opt-in) ---
+
+_INSTRUMENT = None  # {'log', 'profile_dir', 'host', 'open'} while a report is instrumented
+
+@contextlib.contextmanager
+def instrumented(opts, host=None, memory=True):
+    """
+    Turns stage() on for the enclosed block when opts has an 'instrument' log or a 'profile_dir'.
+    memory=False leaves tracemalloc off (timings without its overhead, no peak_mb).
+    """
+    global _INSTRUMENT
+    if not (opts.get('instrument') or opts.get('profile_dir')) or _INSTRUMENT is not None:
+        yield
+        return
+    trace = memory and bool(opts.get('instrument')) and not tracemalloc.is_tracing()
+    if trace: tracemalloc.start()
+    _INSTRUMENT = {'log': opts.get('instrument'), 'profile_dir': opts.get('profile_dir'), 'host': host, 'open': []}
+    try: yield
+    finally:
+        _INSTRUMENT = None
+        if trace: tracemalloc.stop()
+
+def _fold_peak(open_stages):
+    # tracemalloc has a single peak counter: credit it to every open stage before resetting it
+    current, peak = tracemalloc.get_traced_memory()
+    for st in open_stages: st['peak'] = max(st['peak'], peak - st['base'])
+    tracemalloc.reset_peak()
+    return current
+
+def _append_record(path, record):
+    # One O_APPEND write per line, so records of parallel workers never interleave
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try: os.write(fd, (json.dumps(record) + '\n').encode('utf-8'))
+    finally: os.close(fd)
+
+@contextlib.contextmanager
+def stage(name, rows=None):
+    """
+    Measures the enclosed pipeline stage when instrumentation is on, otherwise does nothing.
+    Appends one NDJSON record: host, stage, parent stage, wall / CPU seconds, rows, tracemalloc peak
+    above the stage start (MB) and error. The yielded dict takes a 'rows' count known only afterwards.
+    Top-level stages get a cProfile dump in profile_dir.
+    """
+    rec, inst = {'rows': rows}, _INSTRUMENT
+    if inst is None:
+        yield rec
+        return
+    stack, tracing = inst['open'], tracemalloc.is_tracing()
+    st = {'name': name, 'base': _fold_peak(stack) if tracing else 0, 'peak': 0}
+    prof = None
+    if inst['profile_dir'] and not stack:
+        import cProfile
+        prof = cProfile.Profile()
+    parent = stack[-1]['name'] if stack else None
+    stack.append(st)
+    error, wall, cpu = None, time.perf_counter(), time.process_time()
+    if prof: prof.enable()
+    try:
+        yield rec
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        if prof: prof.disable()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if tracing: _fold_peak(stack)
+        stack.pop()
+        record = {'ts': datetime.now().isoformat(timespec='milliseconds'), 'host': inst['host'], 'pid': os.getpid(),
+                  'stage': name, 'parent': parent, 'wall_s': round(wall, 4), 'cpu_s': round(cpu, 4), 'rows': rec['rows'],
+                  'peak_mb': round(st['peak'] / 2 ** 20, 2) if tracing else None, 'error': error}
+        if prof:
+            os.makedirs(inst['profile_dir'], exist_ok=True)
+            record['profile'] = os.path.join(inst['profile_dir'], f"{inst['host'] or 'run'}.{name}.{os.getpid()}.prof")
+            prof.dump_stats(record['profile'])
+        if inst['log']: _append_record(inst['log'], record)
+
+def stage_summary(log_path):
+    """Per-stage totals of an instrumentation log (top-level stages, slowest first)."""
+    df = pd.read_json(log_path, lines=True)
+    top = df[df['parent'].isna()]
+    return top.groupby('stage').agg(hosts=('host', 'nunique'), wall_s=('wall_s', 'sum'), cpu_s=('cpu_s', 'sum'),
+                                     max_wall_s=('wall_s', 'max'), max_peak_mb=('peak_mb', 'max')).sort_values('wall_s', ascending=False)
+
+_FORK_WRITERS = {}
+
+def _run_writer(name, writers=None):
+    t0 = time.perf_counter()
+    try:
+        (writers or _FORK_WRITERS)[name]()
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return {'seconds': round(time.perf_counter() - t0, 2), 'error': error}
+
+def run_writers(writers, mode='thread'):
+    """
+    Runs independent output writers ({name: callable}) side by side over the same read-only prepared data.
+    Each one is timed and isolated: a failing writer doesn't stop the others. Returns {name: {'seconds', 'error'}}.
+    mode='thread' shares the frames directly; 'process' forks (copy-on-write, POSIX only, else threads); 'serial'.
+    """
+    names = list(writers)
+    if mode == 'serial' or len(names) < 2: return {n: _run_writer(n, writers) for n in names}
+    if mode == 'process' and 'fork' in multiprocessing.get_all_start_methods():
+        # Forked children inherit the writers (closures can't be pickled), so they are handed over via a global
+        global _FORK_WRITERS
+        _FORK_WRITERS = writers
+        try:
+            with ProcessPoolExecutor(len(names), mp_context=multiprocessing.get_context('fork')) as pool:
+                return dict(zip(names, pool.map(_run_writer, names)))
+        finally:
+            _FORK_WRITERS = {}
+    with ThreadPoolExecutor(len(names)) as pool:
+        return dict(zip(names, pool.map(_run_writer, names, [writers] * len(names))))
+
+def process_report(report, combined_tmpl, out_dir=None, rules=None, options=None):
+    """
+    Runs the full pipeline for a single report and returns a summary dict.
+    Outputs are written next to the report unless out_dir is given.
+    options: output switches, see DEFAULT_OPTIONS.
+    """
+    opts = {**DEFAULT_OPTIONS, **(options or {})}
+    t0 = time.perf_counter()
     base = os.path.splitext(report)[0]
+    if out_dir: base = os.path.join(out_dir, os.path.basename(base))
     ts = datetime.now().strftime("%Y%m%d_%H%M")
-    
-    df_failed = df[df['TestResult'].str.contains('Failed', na=False)].copy()
-    df_passed = df[df['TestResult'].str.contains('Passed', na=False)].copy()
+    xlsx_path, html_path = f"{base}_Report_{ts}.xlsx", f"{base}_App_{ts}.html"
+    host = os.path.basename(os.path.splitext(report)[0])
+    con = open_store(opts['store']) if opts['store'] else None
+    digest = _file_digest(report, {}) if con else None
+    export_fmt = opts['export'] or ('parquet' if opts['export_dir'] else None)
+    targets = {'report': xlsx_path, 'app': html_path}
+    if export_fmt: targets['export'] = export_path(base, host, report, ts, export_fmt, opts['export_dir'])
+
+    key = None
+    # With a store the Trend sheet and the carried-over statuses are part of the outputs: both go into the key.
+    # A report that isn't stored yet always goes through the pipeline, so it gets recorded.
+    carried = carried_edits(con, host) if con else None
+    if opts['output_cache'] and (con is None or report_stored(con, host, digest)):
+        others = run_history(con, host, digest).drop(columns=['run_id', 'report']).to_dict('records') if con else None
+        key = output_cache_key(report, combined_tmpl, rules, opts, {'runs': others, 'carried': carried} if con else None)
+    if key and 'export' in targets: os.makedirs(os.path.dirname(os.path.abspath(targets['export'])), exist_ok=True)
+    manifest = key and restore_outputs(opts['output_cache'], key, targets)
+    if manifest:
+        print(f"♻️ Unchanged, reused cached outputs: {host}")
+        if con: con.close()
+        return {'host': host, 'report': report, **manifest['summary'], 'seconds': round(time.perf_counter() - t0, 2),
+                'outputs': list(targets.values()), 'error': None, 'cached': True, 'timings': {}}
+
+    produced = {'excel': [xlsx_path], 'html': [html_path], 'export': [targets.get('export')], 'streaming': list(targets.values())}
+    with instrumented(opts, host):
+        if opts['streaming']:
+            t1 = time.perf_counter()
+            run_id = None
+            if con:
+                with con: run_id = begin_run(con, host, report, digest)
+            def store_chunk(chunk):
+                with con: add_findings(con, run_id, chunk)  # a short transaction per chunk, other workers aren't held up
+            sinks = [store_chunk] if run_id else []
+            if export_fmt:
+                write_export, close_export = open_export(targets['export'], export_fmt, report, host, bool(opts['export_dir']))
+                sinks.append(write_export)
+            def sink(chunk):
+                for write in sinks: write(chunk)
+            def history(summary):
+                if run_id:
+                    with con: finish_run(con, run_id, summary)
+                return run_history(con, host)
+            with stage('stream_report') as st:
+                rows, n_failed, n_passed = stream_report(report, combined_tmpl, xlsx_path, html_path, rules,
+                                                         opts['formula_mode'], opts['chunk_size'], opts['offline'], opts['compress_html'],
+                                                         sink if sinks else None, history if con else None, carried)
+                st['rows'] = rows
+            if export_fmt:
+                close_export()
+                print(f"✅ {export_fmt.title()} Export Created: {targets['export']}")
+            writers = {'streaming': {'seconds': round(time.perf_counter() - t1, 2), 'error': None}}
+        else:
+            with stage('read_report') as st:
+                df = load_report(report)
+                st['rows'] = len(df)
+            with stage('enrich', len(df)): df = enrich(df, combined_tmpl, rules)
+            with stage('split_results', len(df)): df, df_failed, df_passed = split_results(df)
+            rows, n_failed, n_passed = len(df), len(df_failed), len(df_passed)
+            trend = None
+            if con:
+                # One transaction (bulk executemany) per run
+                with stage('store_findings', rows), con:
+                    run_id = begin_run(con, host, report, digest)
+                    if run_id:
+                        add_findings(con, run_id, df)
+                        finish_run(con, run_id, report_summary(rows, n_failed, n_passed))
+                trend = run_history(con, host)
+
+            def excel():
+                with stage('generate_excel', rows): generate_excel(df, xlsx_path, df_failed, df_passed, opts['formula_mode'], trend, carried)
+            def app():
+                with stage('generate_html', rows):
+                    generate_html(df, html_path, compliance_score(n_passed, rows), rows, n_passed, n_failed,
+                                  df['Category'].unique(), opts['offline'], opts['compress_html'], (df_failed, df_passed),
+                                  carried_fixed(carried))
+            # Both writers only read the prepared frames. Instrumented and profiled runs write one after the other:
+            # tracemalloc, the CPU clock and the open-stage stack (which stage gets the profiler) are process-wide,
+            # concurrent stages couldn't be told apart
+            jobs = {'excel': excel, 'html': app}
+            if export_fmt:
+                def export():
+                    with stage('export_findings', rows):
+                        export_findings(df, targets['export'], export_fmt, report, host, bool(opts['export_dir']))
+                jobs['export'] = export
+            writers = run_writers(jobs, 'serial' if opts['instrument'] or opts['profile_dir'] else opts['writers'])
+
+    if con: con.close()
+    summary = report_summary(rows, n_failed, n_passed)
+    errors = '; '.join(f"{name}: {w['error']}" for name, w in writers.items() if w['error'])
+    outputs = [p for name, w in writers.items() if not w['error'] for p in produced[name]]
+    if key and not errors: store_outputs(opts['output_cache'], key, targets, report, summary)
+    return {'host': host, 'report': report, **summary, 'seconds': round(time.perf_counter() - t0, 2),
+            'outputs': outputs, 'error': errors or None, 'cached': False,
+            'timings': {name: w['seconds'] for name, w in writers.items()}}
+
+# --- Batch Mode (Headless) ---
+
+_WORKER_TMPL = None
+_WORKER_RULES = None
+_WORKER_OPTS = None
+
+def _init_worker(combined_tmpl, rules, options):
+    # Runs once per worker process: the template catalog is shipped once instead of with every task
+    global _WORKER_TMPL, _WORKER_RULES, _WORKER_OPTS
+    _WORKER_TMPL, _WORKER_RULES, _WORKER_OPTS = combined_tmpl, rules, options
+
+def _failed_result(report, error, seconds=0):
+    return {'host': os.path.basename(os.path.splitext(report)[0]), 'report': report, 'rows': 0,
+            'failed': 0, 'passed': 0, 'score': None, 'seconds': seconds,
+            'outputs': [], 'error': error, 'cached': False, 'timings': {}}
+
+def _process_in_worker(report, out_dir):
+    t0 = time.perf_counter()
+    try:
+        return process_report(report, _WORKER_TMPL, out_dir, _WORKER_RULES, _WORKER_OPTS)
+    except Exception as e:
+        return _failed_result(report, f"{type(e).__name__}: {e}", round(time.perf_counter() - t0, 2))
+
+def collect_files(paths, ext='.csv', skip=None):
+    """Expands directories (*<ext> inside) and glob patterns into a sorted list of files; names starting with `skip` are left out."""
+    found = []
+    for p in paths:
+        if os.path.isdir(p): found.extend(glob.glob(os.path.join(p, f'*{ext}')))
+        elif glob.has_magic(p): found.extend(glob.glob(p))
+        else: found.append(p)
+    return sorted(set(os.path.abspath(f) for f in found if not (skip and os.path.basename(f).startswith(skip))))
+
+def name_clashes(reports):
+    """File names shared by several reports: written into one output directory, their outputs would overwrite each other."""
+    names = collections.Counter(os.path.normcase(os.path.basename(r)) for r in reports)
+    return sorted(n for n, count in names.items() if count > 1)
+
+def run_batch(reports, templates, out_dir=None, workers=None, rules=None, cache_dir=DEFAULT_CACHE_DIR, options=None):
+    opts = options or {}
+    # The host is the file name (outputs, store, export partitions): same-named reports can't share a destination
+    clashes = name_clashes(reports) if out_dir or opts.get('export_dir') else []
+    if clashes: raise ValueError(f"several reports are named {', '.join(clashes)}; their outputs would overwrite each other "
+                                 "(rename them or convert them into separate output directories)")
+    with instrumented(opts), stage('load_templates') as st:
+        combined_tmpl = load_templates(templates, cache_dir)
+        st['rows'] = len(combined_tmpl)
+    rules = rules or load_rules()
+    if out_dir: os.makedirs(out_dir, exist_ok=True)
+    if opts.get('store'): open_store(opts['store']).close()  # schema created once, before the workers race for it
+    print(f"Converting {len(reports)} reports...")
+
+    workers = workers or os.cpu_count() or 1
+    make_pool = lambda: ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(combined_tmpl, rules, options))
+    results, backlog, suspects, running = [], collections.deque(reports), collections.deque(), {}
+    pool = make_pool()
+    try:
+        while backlog or suspects or running:
+            # No more reports in flight than workers, so a crash only implicates the ones actually running.
+            # After a crash its suspects run again one at a time: the report that breaks the pool on its own has failed
+            while (suspects or backlog) and len(running) < (1 if suspects else workers):
+                queue = suspects or backlog
+                try: running[pool.submit(_process_in_worker, queue[0], out_dir)] = queue[0]
+                except BrokenProcessPool:
+                    if running: break  # their futures report the crash below
+                    pool.shutdown(wait=False)  # a worker died while idle
+                    pool = make_pool()
+                    continue
+                queue.popleft()
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut not in running: continue  # already requeued after a pool failure
+                report = running.pop(fut)
+                try:
+                    res = fut.result()
+                except BrokenProcessPool:
+                    # A worker died (e.g. out of memory, a crash in a native library) and took every running report with it
+                    crashed = [report, *running.values()]
+                    running.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = make_pool()
+                    if len(crashed) > 1:
+                        suspects.extend(sorted(crashed, key=reports.index))
+                        continue
+                    res = _failed_result(report, 'worker process died')
+                results.append(res)
+                print(f"{'✅' if not res['error'] else '❌'} [{len(results)}/{len(reports)}] {res['host']}")
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    results.sort(key=lambda r: r['host'])
+    print_summary(results)
+    if opts.get('instrument') and os.path.exists(opts['instrument']):
+        print(f"\n⏱️ Stage totals ({opts['instrument']}):\n{stage_summary(opts['instrument']).to_string()}")
+    return results
+
+def print_summary(results):
+    print(f"\n{'Host':<40} {'Rows':>6} {'Failed':>7} {'Score':>7} {'Time(s)':>8}  Status")
+    for r in results:
+        score = f"{r['score']:.1f}%" if r['score'] is not None else '-'
+        status = ('OK (cached)' if r['cached'] else 'OK') if not r['error'] else f"FAILED ({r['error']})"
+        print(f"{r['host'][:40]:<40} {r['rows']:>6} {r['failed']:>7} {score:>7} {r['seconds']:>8.2f}  {status}")
+    failures = sum(1 for r in results if r['error'])
+    print(f"\n🎉 {len(results) - failures}/{len(results)} reports converted, {failures} failed.")
+
+# --- Watch Folder (long-running) ---
+
+IN_CLOSE_WRITE, IN_MOVED_TO = 0x08, 0x80  # <sys/inotify.h>
+THROUGHPUT_WINDOW = 300  # seconds of completions behind the throughput counters
+
+def inotify_fd(directory):
+    """Non-blocking inotify descriptor that becomes readable when a file in `directory` is closed after writing or moved in.
+    None when inotify isn't available (not Linux, no libc, network mounts that fail to register): the caller polls."""
+    if not sys.platform.startswith('linux'): return None
+    try:
+        import ctypes, ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0: return None
+        if libc.inotify_add_watch(fd, os.fsencode(os.path.abspath(directory)), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+def wait_for_change(fd, timeout):
+    """Sleeps up to `timeout` seconds, waking up early on an inotify event (the events are drained, the caller rescans)."""
+    if fd is None:
+        time.sleep(timeout)
+        return
+    if select.select([fd], [], [], timeout)[0]:
+        try:
+            while os.read(fd, 65536): pass
+        except BlockingIOError: pass
+
+def _init_watch_worker(combined_tmpl, rules, options):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C stops the watcher, which lets running conversions finish
+    _init_worker(combined_tmpl, rules, options)
+
+def watch_status(counters, running, backlog, settling, recent, started):
+    """Counter snapshot: queue depth (handed to workers), backlog (ready or crash suspects, waiting for a slot), throughput over the window."""
+    now = time.monotonic()
+    while recent and now - recent[0][0] > THROUGHPUT_WINDOW: recent.popleft()
+    window = min(THROUGHPUT_WINDOW, max(now - started, 1))
+    return {**counters, 'queue_depth': len(running), 'backlog': backlog, 'settling': len(settling),
+            'reports_per_min': round(len(recent) * 60 / window, 2), 'rows_per_s': round(sum(r for _, r in recent) / window, 1),
+            'uptime_s': round(now - started), 'updated': datetime.now().isoformat(timespec='seconds')}
+
+def write_status(path, status):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f: json.dump(status, f, indent=2)
+    os.replace(tmp, path)
+
+def watch_folder(directory, templates, out_dir=None, workers=None, rules=None, cache_dir=DEFAULT_CACHE_DIR, options=None, watch=None):
+    """
+    Converts report CSVs as they land in `directory` until Ctrl+C / SIGTERM (or watch['idle_exit'] seconds without work).
+    A file is taken once its size and mtime have been stable for watch['settle'] seconds (partially copied files wait).
+    At most watch['queue_size'] reports are handed to the pool at once; the rest wait as paths. The template catalog
+    is parsed once and kept in every worker. Returns the final counters.
+    """
+    watch = {'settle': 2.0, 'poll': 5.0, 'queue_size': None, 'status_file': None, 'stats_interval': 60,
+             'archive': None, 'skip_existing': False, 'idle_exit': None, **(watch or {})}
+    combined_tmpl = load_templates(templates, cache_dir)
+    rules = rules or load_rules()
+    opts = options or {}
+    workers = workers or os.cpu_count() or 1
+    limit = watch['queue_size'] or 2 * workers
+    for d in [out_dir, watch['archive']]:
+        if d: os.makedirs(d, exist_ok=True)
+    if opts.get('store'): open_store(opts['store']).close()
+
+    fd = inotify_fd(directory)
+    started = last_work = last_stats = time.monotonic()
+    counters = {'directory': os.path.abspath(directory), 'trigger': 'inotify' if fd is not None else 'polling',
+                'workers': workers, 'queue_limit': limit, 'discovered': 0, 'converted': 0, 'failed': 0, 'skipped': 0, 'rows': 0}
+    settling, ready, running, handled = {}, collections.deque(), {}, set()  # handled: (path, size, mtime_ns)
+    suspects = collections.deque()  # (path, sig) that were running when a worker died, rerun one at a time
+    recent = collections.deque()  # (finish time, rows) of the last THROUGHPUT_WINDOW seconds
+    stop = []
+    signal.signal(signal.SIGTERM, lambda *_: stop.append('SIGTERM'))
+
+    def signature(path):
+        try: st = os.stat(path)
+        except OSError: return None
+        return st.st_size, st.st_mtime_ns
+
+    if watch['skip_existing']:
+        handled.update((p, *signature(p)) for p in glob.glob(os.path.join(directory, '*.csv')) if signature(p))
+    make_pool = lambda: ProcessPoolExecutor(workers, initializer=_init_watch_worker, initargs=(combined_tmpl, rules, opts))
+    pool = make_pool()
+
+    def collect(fut):
+        nonlocal pool
+        if fut not in running: return  # already put back after a pool failure
+        path, sig = running.pop(fut)
+        try:
+            res = fut.result()
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory) and took every running report with it. Which one did it is unknown:
+            # they all run again one at a time (in arrival order), a report that breaks the pool on its own has failed
+            crashed = [(path, sig), *running.values()]
+            running.clear()
+            pool.shutdown(wait=False, cancel_futures=True)
+            pool = make_pool()
+            if len(crashed) > 1:
+                suspects.extend(crashed)
+                return
+            res = _failed_result(path, 'worker process died')
+        handled.add((path, *sig))
+        counters['converted' if not res['error'] else 'failed'] += 1
+        counters['rows'] += res['rows']
+        recent.append((time.monotonic(), res['rows']))
+        if not res['error'] and watch['archive'] and os.path.exists(path):
+            shutil.move(path, os.path.join(watch['archive'], os.path.basename(path)))
+        print(f"{'✅' if not res['error'] else '❌'} {res['host']} ({res['rows']} rows, {res['seconds']:.2f}s)"
+              + (f": {res['error']}" if res['error'] else '') + f"  [queue {len(running)}, backlog {len(ready) + len(suspects)}]")
+
+    print(f"👀 Watching {directory} ({counters['trigger']}), {workers} workers, queue limit {limit}. Ctrl+C to stop.")
+    try:
+        while not stop:
+            now = time.monotonic()
+            # 1. Discover: a new / changed file settles first, then joins the ready backlog
+            queued = {p for p, _ in ready} | {p for p, _ in suspects} | {p for p, _ in running.values()}
+            for path in sorted(glob.glob(os.path.join(directory, '*.csv'))):
+                sig = signature(path)
+                if not sig or (path, *sig) in handled or path in queued: continue
+                if path not in settling: counters['discovered'] += 1
+                if settling.get(path, (None,))[0] != sig: settling[path] = (sig, now)
+                elif now - settling[path][1] >= watch['settle']:
+                    del settling[path]
+                    if sig[0]: ready.append((path, sig))
+                    else:  # still empty: skipped until it gets content (a new signature)
+                        handled.add((path, *sig))
+                        counters['skipped'] += 1
+                        print(f"⏭️ {os.path.basename(path)} is empty, skipped")
+
+            # 2. Hand reports to the pool, never more than the queue limit (one at a time while crash suspects rerun)
+            while (suspects or ready) and len(running) < (1 if suspects else limit):
+                queue = suspects or ready
+                try: running[pool.submit(_process_in_worker, queue[0][0], out_dir)] = queue[0]
+                except BrokenProcessPool:
+                    if running: break  # their futures report the crash in step 3
+                    pool.shutdown(wait=False)  # a worker died while idle
+                    pool = make_pool()
+                    continue
+                queue.popleft()
+
+            # 3. Collect
+            for fut in [f for f in running if f.done()]: collect(fut)
+
+            # 4. Counters
+            if running or ready or suspects or settling: last_work = time.monotonic()
+            status = watch_status(counters, running, len(ready) + len(suspects), settling, recent, started)
+            if watch['status_file']: write_status(watch['status_file'], status)
+            if time.monotonic() - last_stats >= watch['stats_interval']:
+                last_stats = time.monotonic()
+                print(f"📊 {status['converted']} converted, {status['failed']} failed | queue {status['queue_depth']}/{limit}, "
+                      f"backlog {status['backlog']}, settling {status['settling']} | {status['reports_per_min']} reports/min, {status['rows_per_s']} rows/s")
+            if watch['idle_exit'] is not None and time.monotonic() - last_work >= watch['idle_exit']: break
 
-    generate_excel(df, f"{base}_Report_{ts}.xlsx", df_failed, df_passed)
-    generate_html(df, f"{base}_App_{ts}.html", 0, len(df), len(df_passed), len(df_failed), df['Category'].unique())
+            # Busy: check back soon (settle timers, finished jobs); idle: wait for inotify or the next poll
+            wait_for_change(fd, min(0.5, watch['settle']) if (running or ready or suspects or settling) else watch['poll'])
+    except KeyboardInterrupt:
+        stop.append('SIGINT')
+    try:
+        # Reports already handed to the pool are finished; the backlog stays on disk for the next start
+        if running: print(f"Stopping: finishing {len(running)} queued conversion(s)...")
+        for fut in as_completed(list(running)): collect(fut)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        if fd is not None: os.close(fd)
+    status = watch_status(counters, {}, len(ready) + len(suspects), settling, recent, started)
+    if watch['status_file']: write_status(watch['status_file'], {**status, 'stopped': True})
+    print(f"\n🎉 {status['converted']} reports converted, {status['failed']} failed.")
+    return status
+
+# --- Fleet Report (controls x hosts) ---
+
+EXCEL_MAX_ROWS, EXCEL_MAX_COLS = 1048576, 16384
+FLEET_FAILED, FLEET_PASSED, FLEET_NOT_RUN = 1, 0, -1  # matrix cell codes
+
+def fleet_frame(report):
+    """The columns the fleet matrix needs from one report, TestResult reduced to a matrix code."""
+    df = load_report(report)
+    res = df['TestResult'].astype(str)
+    code = pd.Series(FLEET_NOT_RUN, index=df.index, dtype='int8')
+    code[res.str.contains('Passed', na=False)] = FLEET_PASSED
+    code[res.str.contains('Failed', na=False)] = FLEET_FAILED
+    out = pd.DataFrame({'ID': df['ID'], 'Code': code})
+    for col in ['Category', 'Name', 'Severity']:
+        out[col] = df[col].astype(object) if col in df.columns else None
+    return out
+
+def _fleet_in_worker(report):
+    try: return fleet_frame(report), None
+    except Exception as e: return None, f"{type(e).__name__}: {e}"
+
+def host_labels(reports):
+    """Report file names without extension, made unique with a ~n suffix."""
+    seen, labels = {}, []
+    for r in reports:
+        name = os.path.basename(os.path.splitext(r)[0])
+        seen[name] = seen.get(name, 0) + 1
+        labels.append(name if seen[name] == 1 else f"{name}~{seen[name]}")
+    return labels
+
+def build_fleet(reports, workers=None):
+    """
+    Loads every report and builds the fleet view:
+    {'hosts': [...], 'controls': frame (ID, Category, Name, Severity), 'matrix': int8 array controls x hosts}.
+    Cells hold FLEET_FAILED / FLEET_PASSED / FLEET_NOT_RUN. Reports that can't be read are skipped.
+    """
+    labels = host_labels(reports)
+    hosts, frames = [], []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for label, (frame, error) in zip(labels, pool.map(_fleet_in_worker, reports)):
+            if error:
+                print(f"❌ {label}: {error}")
+                continue
+            hosts.append(label); frames.append(frame)
+    if not frames: return {'hosts': [], 'controls': pd.DataFrame(columns=['ID', 'Category', 'Name', 'Severity']), 'matrix': np.zeros((0, 0), 'int8')}
+
+    long = pd.concat(frames, ignore_index=True)
+    host_codes = np.repeat(np.arange(len(frames)), [len(f) for f in frames])
+    id_codes, ids = pd.factorize(long['ID'])
+    matrix = np.full((len(ids), len(hosts)), FLEET_NOT_RUN, dtype='int8')
+    matrix[id_codes, host_codes] = long['Code'].to_numpy()
+
+    # Control metadata: first report that has it; the severity comes from a failing host (passing rows say 'Passed')
+    meta = long[['Category', 'Name']].groupby(id_codes).first()
+    failing = (long['Code'].to_numpy() == FLEET_FAILED) & (long['Severity'] != 'Passed').to_numpy()
+    severity = long.loc[failing, 'Severity'].groupby(id_codes[failing]).first()
+    controls = pd.DataFrame({'ID': ids, 'Category': meta['Category'].reindex(range(len(ids))).to_numpy(),
+                             'Name': meta['Name'].reindex(range(len(ids))).to_numpy(),
+                             'Severity': severity.reindex(range(len(ids))).to_numpy()})
+    order = np.lexsort((controls['ID'].astype(str).to_numpy(), controls['Category'].fillna('').astype(str).to_numpy()))
+    return {'hosts': hosts, 'controls': controls.iloc[order].reset_index(drop=True), 'matrix': matrix[order]}
+
+def fleet_stats(fleet):
+    """Per-control and per-host counts plus the Category x Host failure-rate heatmap, all vectorized on the matrix."""
+    m, controls = fleet['matrix'], fleet['controls']
+    failed, checked = (m == FLEET_FAILED), (m != FLEET_NOT_RUN)
+    ctrl = controls.copy()
+    ctrl['Hosts Checked'] = checked.sum(axis=1)
+    ctrl['Hosts Failed'] = failed.sum(axis=1)
+    ctrl['Failure Rate'] = np.divide(ctrl['Hosts Failed'], ctrl['Hosts Checked'], out=np.zeros(len(ctrl)), where=ctrl['Hosts Checked'] > 0)
+
+    hosts = pd.DataFrame({'Host': fleet['hosts'], 'Checks': checked.sum(axis=0), 'Failed': failed.sum(axis=0)})
+    hosts['Passed'] = (m == FLEET_PASSED).sum(axis=0)
+    hosts['Score'] = np.divide(hosts['Passed'], hosts['Checks'], out=np.zeros(len(hosts)), where=hosts['Checks'] > 0)
+
+    cats = controls['Category'].fillna('(none)').astype(str).to_numpy()
+    cat_failed = pd.DataFrame(failed, columns=fleet['hosts']).groupby(cats).sum()
+    cat_checked = pd.DataFrame(checked, columns=fleet['hosts']).groupby(cats).sum()
+    heat = cat_failed / cat_checked.where(cat_checked > 0)
+    heat.insert(0, 'Fleet', cat_failed.sum(axis=1) / cat_checked.sum(axis=1).where(lambda s: s > 0))
+    return ctrl, hosts.sort_values('Score', kind='stable'), heat
+
+def sheet_blocks(n_rows, n_cols, lead_cols):
+    """(row_start, row_end, col_start, col_end) slices that fit one sheet under a header row, next to lead_cols columns."""
+    row_cap, col_cap = EXCEL_MAX_ROWS - 1, EXCEL_MAX_COLS - lead_cols
+    return [(r, min(r + row_cap, n_rows), c, min(c + col_cap, n_cols))
+            for r in range(0, max(n_rows, 1), row_cap) for c in range(0, max(n_cols, 1), col_cap)]
+
+def write_split_sheets(wb, name, lead, grid, header_fmt, grid_fmt=None):
+    """
+    Writes lead columns + a value grid (both DataFrames, one row each per line) over as many sheets
+    as the Excel limits need; the lead columns are repeated on every sheet. Returns [(ws, rows, cols)].
+    """
+    lead = lead.astype(object).where(lead.notna(), None)
+    values = grid.astype(object).where(grid.notna(), None).to_numpy() if grid is not None else np.empty((len(lead), 0), object)
+    grid_cols = list(grid.columns) if grid is not None else []
+    blocks = sheet_blocks(len(lead), len(grid_cols), len(lead.columns))
+    sheets = []
+    for i, (r0, r1, c0, c1) in enumerate(blocks, start=1):
+        ws = wb.add_worksheet(name if len(blocks) == 1 else f"{name} {i}"[:31])
+        ws.write_row(0, 0, list(lead.columns) + grid_cols[c0:c1], header_fmt)
+        ws.freeze_panes(1, len(lead.columns))
+        for r, (head, vals) in enumerate(zip(lead.iloc[r0:r1].itertuples(index=False, name=None), values[r0:r1, c0:c1]), start=1):
+            ws.write_row(r, 0, head)
+            ws.write_row(r, len(head), vals, grid_fmt)
+        sheets.append((ws, r1 - r0, len(lead.columns) + c1 - c0))
+    return sheets
+
+def write_fleet_workbook(fleet, output_path, top_n=25):
+    ctrl, hosts, heat = fleet_stats(fleet)
+    wb = stable_workbook(xlsxwriter.Workbook(output_path, {'constant_memory': True}))
+    fmts = excel_formats(wb)
+    pct = wb.add_format({'num_format': '0.0%'})
+    scale = {'type': '3_color_scale', 'min_color': '#C6EFCE', 'mid_color': '#FFEB9C', 'max_color': '#FFC7CE',
+             'min_type': 'num', 'min_value': 0, 'mid_type': 'num', 'mid_value': 0.5, 'max_type': 'num', 'max_value': 1}
+
+    # --- Summary + Top-N chart ---
+    ws_sum = wb.add_worksheet('Fleet Summary')
+    ws_sum.hide_gridlines(2)
+    ws_sum.set_column('B:E', 22)
+    ws_sum.write('B2', 'Fleet Compliance Overview', fmts['title'])
+    ws_sum.write_row('B5', ['Hosts', 'Controls', 'Average Score', 'Failed Checks'], fmts['kpi_head'])
+    ws_sum.write_row('B6', [len(hosts), len(ctrl)], fmts['kpi_val'])
+    ws_sum.write('D6', hosts['Score'].mean() if len(hosts) else 0, fmts['kpi_pct'])
+    ws_sum.write('E6', int(hosts['Failed'].sum()), fmts['kpi_val'])
+    ws_sum.set_row(5, 58)
+
+    top = ctrl[ctrl['Hosts Failed'] > 0].sort_values(['Hosts Failed', 'Failure Rate'], ascending=False, kind='stable').head(top_n)
+    if len(top):
+        chart = wb.add_chart({'type': 'bar'})
+        chart.add_series({'name': 'Hosts Failed', 'categories': f"='Top Failed Controls'!$B$2:$B${len(top)+1}",
+                          'values': f"='Top Failed Controls'!$G$2:$G${len(top)+1}", 'fill': {'color': '#C00000'}})
+        chart.set_title({'name': f'Top {len(top)} Most-Failed Controls'})
+        chart.set_legend({'none': True})
+        chart.set_y_axis({'reverse': True})
+        chart.set_size({'width': 850, 'height': max(300, 22 * len(top))})
+        ws_sum.insert_chart('B9', chart)
+
+    # --- Host Scores ---
+    ws_hosts = write_split_sheets(wb, 'Host Scores', hosts[['Host', 'Checks', 'Passed', 'Failed', 'Score']], None, fmts['header'])
+    for ws, n, _ in ws_hosts:
+        ws.set_column('A:A', 35); ws.set_column('E:E', 10, pct)
+        if n: ws.conditional_format(1, 4, n, 4, {'type': 'data_bar', 'bar_color': '#00B050', 'min_type': 'num', 'min_value': 0, 'max_type': 'num', 'max_value': 1})
+
+    # --- Per-control failure rates / Top N ---
+    rate_cols = ['ID', 'Category', 'Name', 'Severity', 'Hosts Checked', 'Hosts Failed', 'Failure Rate']
+    by_rate = ctrl.sort_values(['Failure Rate', 'Hosts Failed'], ascending=False, kind='stable')[rate_cols]
+    for sheet, frame in [('Control Failure Rates', by_rate), ('Top Failed Controls', top.assign(Rank=range(1, len(top) + 1))[['Rank'] + rate_cols])]:
+        for ws, n, n_cols in write_split_sheets(wb, sheet, frame, None, fmts['header']):
+            ws.set_column(0, n_cols - 1, 14)
+            ws.set_column(n_cols - 5, n_cols - 5, 60)  # Name
+            ws.set_column(n_cols - 1, n_cols - 1, 12, pct)
+            if n: ws.conditional_format(1, n_cols - 1, n, n_cols - 1, scale)
+
+    # --- Category heatmap (failure rate per category and host) ---
+    for ws, n, n_cols in write_split_sheets(wb, 'Category Heatmap', heat.index.to_frame(name='Category'), heat, fmts['header'], pct):
+        ws.set_column(0, 0, 40)
+        if n: ws.conditional_format(1, 1, n, n_cols - 1, scale)
+
+    # --- Controls x Hosts matrix ---
+    cells = pd.DataFrame(np.array(['', 'P', 'F'], dtype=object)[fleet['matrix'].astype(int) + 1], columns=fleet['hosts'])
+    lead = ctrl[['ID', 'Category', 'Name', 'Failure Rate']]
+    for ws, n, n_cols in write_split_sheets(wb, 'Matrix', lead, cells, fmts['header']):
+        ws.set_column(2, 2, 50); ws.set_column(3, 3, 10, pct)
+        if n:
+            ws.conditional_format(1, 4, n, n_cols - 1, {'type': 'cell', 'criteria': '==', 'value': '"F"', 'format': fmts['red']})
+            ws.conditional_format(1, 4, n, n_cols - 1, {'type': 'cell', 'criteria': '==', 'value': '"P"', 'format': fmts['green']})
+
+    wb.close()
+    print(f"✅ Fleet Workbook Created: {output_path} ({len(hosts)} hosts x {len(ctrl)} controls)")
+
+def run_fleet(reports, output_path, workers=None, top_n=25):
+    print(f"Building fleet matrix from {len(reports)} reports...")
+    fleet = build_fleet(reports, workers)
+    if not fleet['hosts']: print("No readable reports, nothing written.")
+    else: write_fleet_workbook(fleet, output_path, top_n)
+    return fleet
+
+# --- Run-to-run Diff ---
+
+DIFF_FIELDS = ['Category', 'Description', 'TestResult', 'Result', 'Recommended', 'RiskScore']
+DIFF_CHANGES = ['Newly Failed', 'Newly Passed', 'Value Changed', 'Risk Changed', 'New Control', 'Removed Control']
+
+def load_run(path, combined_tmpl=None, rules=None):
+    """
+    One run as a frame indexed by ID (DIFF_FIELDS columns): either a report CSV (enriched here)
+    or a workbook previously generated by KittyPorter (Action Items = failed, Passed Checks = passed).
+    """
+    if path.lower().endswith('.xlsx'):
+        sheets = pd.read_excel(path, sheet_name=['Action Items', 'Passed Checks'], dtype=str)
+        df = pd.concat([sheets['Action Items'].assign(TestResult='Failed'), sheets['Passed Checks'].assign(TestResult='Passed')],
+                       ignore_index=True).rename(columns={'CIS': 'ID'})
+        df['RiskScore'] = pd.to_numeric(df.get('RiskScore'), errors='coerce').fillna(0).astype(int)
+    else:
+        df = enrich(load_report(path), combined_tmpl, rules)
+        if 'RecommendedValue' in df.columns:
+            df['Recommended'] = df['Recommended'].combine_first(df['RecommendedValue']) if 'Recommended' in df.columns else df['RecommendedValue']
+    for col in DIFF_FIELDS:
+        if col not in df.columns: df[col] = None
+    df = df[['ID'] + DIFF_FIELDS].astype({'TestResult': str, 'Category': object})
+    return df.drop_duplicates('ID', keep='last').set_index('ID')
+
+def diff_runs(old, new):
+    """
+    Joins two runs on ID in one pass and keeps only the controls that changed, with the first matching
+    reason from DIFF_CHANGES. Value Changed compares the current value (Result); Recommended is shown alongside.
+    """
+    m = old.join(new, how='outer', lsuffix='_old', rsuffix='_new')
+    in_old, in_new = m['TestResult_old'].notna(), m['TestResult_new'].notna()
+    res_old, res_new = m['TestResult_old'].fillna('').astype(str), m['TestResult_new'].fillna('').astype(str)
+    val = lambda s: s.astype(object).where(s.notna(), '').astype(str).str.strip()
+    risk_old = pd.to_numeric(m['RiskScore_old'], errors='coerce').fillna(0).astype(int)
+    risk_new = pd.to_numeric(m['RiskScore_new'], errors='coerce').fillna(0).astype(int)
+
+    change = np.select(
+        [in_new & ~in_old, in_old & ~in_new,
+         res_old.str.contains('Passed') & res_new.str.contains('Failed'),
+         res_old.str.contains('Failed') & res_new.str.contains('Passed'),
+         val(m['Result_old']) != val(m['Result_new']),
+         risk_old != risk_new],
+        DIFF_CHANGES[4:] + DIFF_CHANGES[:4], default='')
+    keep = change != ''
+
+    pick = lambda col: m[col + '_new'].combine_first(m[col + '_old'])
+    delta = pd.DataFrame({
+        'ID': m.index, 'Change': change, 'Category': pick('Category'), 'Description': pick('Description'),
+        'Old Result': m['TestResult_old'], 'New Result': m['TestResult_new'],
+        'Old Value': m['Result_old'], 'New Value': m['Result_new'], 'Recommended': pick('Recommended'),
+        'Old Risk': risk_old.where(in_old).astype('Int64'), 'New Risk': risk_new.where(in_new).astype('Int64'),
+        'Risk Delta': (risk_new - risk_old).where(in_old & in_new).astype('Int64'),
+    })[keep]
+    order = pd.Categorical(delta['Change'], categories=DIFF_CHANGES, ordered=True)
+    return delta.assign(_o=order).sort_values(['_o', 'New Risk'], ascending=[True, False], kind='stable').drop(columns='_o').reset_index(drop=True)
+
+def write_delta(delta, output_path):
+    """Delta report: .csv for downstream jobs, otherwise a one-sheet workbook colored by change type."""
+    if output_path.lower().endswith('.csv'):
+        delta.to_csv(output_path, index=False)
+        return
+    writer = pd.ExcelWriter(output_path, engine='xlsxwriter')
+    delta.to_excel(writer, sheet_name='Delta', index=False)
+    wb, ws = stable_workbook(writer.book), writer.sheets['Delta']
+    fmts = excel_formats(wb)
+    n, last = len(delta), len(delta.columns) - 1
+    if n:
+        ws.add_table(0, 0, n, last, {'columns': [{'header': c} for c in delta.columns], 'style': 'TableStyleMedium2'})
+        for change, fmt in [('Newly Failed', 'red'), ('Newly Passed', 'green'), ('Value Changed', 'yellow'), ('Risk Changed', 'yellow'), ('Removed Control', 'grey')]:
+            ws.conditional_format(1, 0, n, last, {'type': 'formula', 'criteria': f'=$B2="{change}"', 'format': fmts[fmt]})
+    ws.freeze_panes(1, 0)
+    ws.set_column('A:B', 16); ws.set_column('C:C', 25); ws.set_column('D:D', 60); ws.set_column(4, last, 14)
+    writer.close()
+
+def run_diff(old_path, new_path, templates=(), output_path=None, rules=None, cache_dir=DEFAULT_CACHE_DIR):
+    # Like -o elsewhere: a directory gets the default file name inside it
+    name = f"{os.path.splitext(os.path.basename(new_path))[0]}_Delta_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx"
+    if output_path is None: output_path = os.path.join(os.path.dirname(new_path), name)
+    elif os.path.isdir(output_path): output_path = os.path.join(output_path, name)
+    if not os.path.isdir(os.path.dirname(os.path.abspath(output_path))):
+        raise ValueError(f"output directory does not exist: {os.path.dirname(os.path.abspath(output_path))}")
+    combined_tmpl = load_templates(templates, cache_dir) if templates else None
+    delta = diff_runs(load_run(old_path, combined_tmpl, rules), load_run(new_path, combined_tmpl, rules))
+    write_delta(delta, output_path)
+
+    counts = delta['Change'].value_counts()
+    print(' | '.join(f"{c}: {counts.get(c, 0)}" for c in DIFF_CHANGES))
+    print(f"✅ Delta Report Created: {output_path} ({len(delta)} changed controls)")
+    return delta
+
+# --- Remediation Script (PowerShell) ---
+
+PS_HIVES = {'HKLM': 'LocalMachine', 'HKCU': 'CurrentUser', 'HKCR': 'ClassesRoot', 'HKU': 'Users'}
+PS_COMMON = """$ErrorActionPreference = 'Stop'
+$hives = @{{ {hives} }}
+"""
+PS_REMEDIATE = """#Requires -RunAsAdministrator
+param([string]$Backup = (Join-Path $PSScriptRoot '{backup}'))
+{common}$plan = @'
+{plan}'@ | ConvertFrom-Csv
+$keys = @($plan | Group-Object Key)
+
+# 1. Record the prior values (read-only) before anything changes
+$backupRows = foreach ($g in $keys) {{
+    $hive, $sub = $g.Name -split '\\\\', 2
+    $k = $hives[$hive].OpenSubKey($sub)
+    foreach ($v in $g.Group) {{
+        $prior = $null; $kind = $null
+        if ($k) {{ $prior = $k.GetValue($v.Name, $null, 'DoNotExpandEnvironmentNames') }}
+        if ($null -ne $prior) {{ $kind = $k.GetValueKind($v.Name).ToString() }}
+        [pscustomobject]@{{ Key = $g.Name; KeyCreated = -not $k; Name = $v.Name; Existed = $null -ne $prior; Kind = $kind; Value = $prior }}
+    }}
+    if ($k) {{ $k.Close() }}
+}}
+ConvertTo-Json @($backupRows) -Depth 3 | Set-Content -Path $Backup -Encoding UTF8
+$priorKind = @{{}}
+foreach ($b in $backupRows) {{ if ($b.Existed) {{ $priorKind["$($b.Key)\\$($b.Name)"] = $b.Kind }} }}
+Write-Host "Prior values saved to $Backup"
+
+# 2. Apply: each key is opened (or created) once for all of its values
+$set = 0; $failed = 0; $i = 0
+foreach ($g in $keys) {{
+    $i++
+    Write-Progress -Activity 'KittyPorter remediation' -Status $g.Name -PercentComplete ($i * 100 / $keys.Count)
+    $hive, $sub = $g.Name -split '\\\\', 2
+    try {{ $k = $hives[$hive].CreateSubKey($sub) }}
+    catch {{ $failed += $g.Count; Write-Warning "$($g.Name): $_"; continue }}
+    foreach ($v in $g.Group) {{
+        try {{
+            # An existing String / DWord value keeps its type (e.g. REG_SZ policies holding numbers)
+            $kind = $priorKind["$($g.Name)\\$($v.Name)"]
+            if ($kind -notin 'String', 'ExpandString', 'DWord') {{ $kind = $v.Kind }}
+            $data = $v.Value
+            if ($kind -eq 'DWord') {{ $data = [BitConverter]::ToInt32([BitConverter]::GetBytes([int64]$v.Value), 0) }}
+            $k.SetValue($v.Name, $data, $kind)
+            $set++
+        }} catch {{ $failed++; Write-Warning "$($g.Name)\\$($v.Name) (CIS $($v.CIS)): $_" }}
+    }}
+    $k.Close()
+    Write-Host ('[{{0}}/{{1}}] {{2}}: {{3}} value(s)' -f $i, $keys.Count, $g.Name, $g.Count)
+}}
+Write-Progress -Activity 'KittyPorter remediation' -Completed
+Write-Host "Done: $set value(s) set, $failed failed. Undo with {rollback}"
+if ($failed) {{ exit 1 }}
+"""
+PS_ROLLBACK = """#Requires -RunAsAdministrator
+param([string]$Backup = (Join-Path $PSScriptRoot '{backup}'))
+{common}$entries = @(Get-Content -Raw -Path $Backup | ConvertFrom-Json)
+$keys = @($entries | Group-Object Key)
+$restored = 0; $failed = 0; $i = 0
+foreach ($g in $keys) {{
+    $i++
+    Write-Progress -Activity 'KittyPorter rollback' -Status $g.Name -PercentComplete ($i * 100 / $keys.Count)
+    $hive, $sub = $g.Name -split '\\\\', 2
+    $k = $hives[$hive].OpenSubKey($sub, $true)
+    if (-not $k) {{ continue }}
+    foreach ($e in $g.Group) {{
+        try {{
+            if (-not $e.Existed) {{ $k.DeleteValue($e.Name, $false) }}
+            else {{
+                $data = switch ($e.Kind) {{
+                    'DWord' {{ [int]$e.Value }} 'QWord' {{ [long]$e.Value }} 'Binary' {{ [byte[]]$e.Value }}
+                    'MultiString' {{ [string[]]$e.Value }} default {{ [string]$e.Value }}
+                }}
+                $k.SetValue($e.Name, $data, $e.Kind)
+            }}
+            $restored++
+        }} catch {{ $failed++; Write-Warning "$($g.Name)\\$($e.Name): $_" }}
+    }}
+    $empty = $k.ValueCount -eq 0 -and $k.SubKeyCount -eq 0
+    $k.Close()
+    # Keys the remediation created are removed again once empty
+    if ($g.Group[0].KeyCreated -and $empty) {{ $hives[$hive].DeleteSubKey($sub, $false) }}
+    Write-Host ('[{{0}}/{{1}}] {{2}}: {{3}} value(s)' -f $i, $keys.Count, $g.Name, $g.Count)
+}}
+Write-Progress -Activity 'KittyPorter rollback' -Completed
+Write-Host "Done: $restored value(s) restored, $failed failed."
+if ($failed) {{ exit 1 }}
+"""
+
+def remediation_plan(df_failed, min_risk=0, categories=None):
+    """
+    The registry values to set for the failed findings (RiskScore >= min_risk, in `categories` when given):
+    one row per key and value name, sorted by key, with the CIS IDs it fixes. Identical fixes are merged; when
+    findings disagree on a value the riskiest one wins. -> (plan, conflicts, findings covered)
+    """
+    text = lambda col: df_failed[col].astype(object).where(df_failed[col].notna()) if col in df_failed.columns else pd.Series(None, index=df_failed.index, dtype=object)
+    df = pd.DataFrame({'Key': text('RegShortPath'), 'Name': text('RegistryItem'), 'Value': text('RecommendedValue'),
+                       'CIS': text('CIS').fillna(text('ID')), 'Category': text('Category'), 'RiskScore': df_failed['RiskScore'].astype(int)})
+    keep = (df['RiskScore'] >= min_risk) & df['Key'].str.split('\\').str[0].isin(PS_HIVES) & df['Name'].notna() & df['Value'].notna()
+    if categories: keep &= df['Category'].isin(categories)
+    df = df[keep].astype({'Key': str, 'Name': str, 'Value': str, 'CIS': str}).sort_values('RiskScore', ascending=False, kind='stable')
+    df['Value'] = df['Value'].str.replace(r'[\r\n]+', ' ', regex=True)
+
+    plan = df.drop_duplicates(['Key', 'Name']).set_index(['Key', 'Name'])
+    kept = plan['Value'].reindex(pd.MultiIndex.from_frame(df[['Key', 'Name']])).to_numpy()
+    same = df['Value'].to_numpy() == kept
+    conflicts = df[~same].assign(Kept=kept[~same])
+    plan['CIS'] = df[same].groupby(['Key', 'Name'], sort=False)['CIS'].agg(lambda c: ', '.join(dict.fromkeys(c)))
+    number = pd.to_numeric(plan['Value'].where(plan['Value'].str.fullmatch(r'-?\d+')), errors='coerce')
+    plan['Kind'] = np.where(number.between(-2**31, 2**32 - 1), 'DWord', 'String')
+    plan = plan.reset_index().sort_values(['Key', 'Name'], key=lambda s: s.str.lower(), kind='stable')
+    return plan[['Key', 'Name', 'Value', 'Kind', 'CIS']].reset_index(drop=True), conflicts, int(same.sum())
+
+def write_remediation(plan, conflicts, covered, ps1_path, rollback_path, host, scope):
+    """One remediation .ps1 (prior values backed up first) and its rollback script, UTF-8 with BOM for Windows PowerShell."""
+    backup = os.path.splitext(os.path.basename(ps1_path))[0] + '.backup.json'
+    common = PS_COMMON.format(hives='; '.join(f"{h} = [Microsoft.Win32.Registry]::{n}" for h, n in PS_HIVES.items()))
+    head = [f"# KittyPorter remediation for {host} ({scope})",
+            f"# {len(plan)} registry values in {plan['Key'].nunique()} keys, fixing {covered} failed checks (identical fixes merged).",
+            "# Prior values are saved to the backup JSON next to this script before anything changes.",
+            "# HKCU values apply to the account running the script."]
+    for r in conflicts.itertuples():
+        head.append(f"# Conflict: {r.Key}\\{r.Name} = {r.Kept} kept, CIS {r.CIS} recommends {r.Value}")
+    csv_text = plan.to_csv(index=False, quoting=csv.QUOTE_ALL, lineterminator='\n')
+    script = '\n'.join(head) + '\n' + PS_REMEDIATE.format(backup=backup, common=common, plan=csv_text,
+                                                          rollback=os.path.basename(rollback_path))
+    rollback = f"# Rolls back {os.path.basename(ps1_path)} for {host} from its backup JSON\n" + PS_ROLLBACK.format(backup=backup, common=common)
+    for path, text in [(ps1_path, script), (rollback_path, rollback)]:
+        with open(path, 'w', encoding='utf-8-sig', newline='\r\n') as f: f.write(text)
+
+def run_remediation(reports, templates, out_dir=None, min_risk=0, categories=None, rules=None, cache_dir=DEFAULT_CACHE_DIR):
+    combined_tmpl = load_templates(templates, cache_dir)
+    ts = datetime.now().strftime("%Y%m%d_%H%M")
+    scope = f"failed checks with RiskScore >= {min_risk}" + (f" in {', '.join(categories)}" if categories else '')
+    written = []
+    for report, host in zip(reports, host_labels(reports)):
+        _, df_failed, _ = split_results(enrich(load_report(report), combined_tmpl, rules))
+        plan, conflicts, covered = remediation_plan(df_failed, min_risk, categories)
+        if plan.empty:
+            print(f"ℹ️ Nothing to remediate for {host} ({scope})")
+            continue
+        # In a shared out_dir the host label (report name, ~n for repeated names) keeps same-named reports apart
+        base = os.path.join(out_dir, host) if out_dir else os.path.splitext(report)[0]
+        ps1_path, rollback_path = f"{base}_Remediation_{ts}.ps1", f"{base}_Rollback_{ts}.ps1"
+        write_remediation(plan, conflicts, covered, ps1_path, rollback_path, host, scope)
+        print(f"✅ Remediation Script Created: {ps1_path} ({len(plan)} values in {plan['Key'].nunique()} keys for {covered} findings"
+              + (f", {len(conflicts)} conflicting" if len(conflicts) else '') + f") + {os.path.basename(rollback_path)}")
+        written.append(ps1_path)
+    return written
+
+# --- Local Server (paged findings API) ---
+
+SORT_FIELDS = ['score', 'cis', 'cat']  # orderable columns; any other column keeps the CIS order
+SEARCH_FIELDS = ['cis', 'cat', 'desc', 'key', 'item', 'curr', 'exp']
+SEARCH_CACHE_SIZE = 16
+
+def natural_ranks(values):
+    """Rank of each value in natural order ('1.10' after '1.9') and the value -> rank lookup; only distinct values are sorted."""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    key = lambda v: [(0, int(p), '') if p.isdigit() else (1, 0, p.lower()) for p in re.split(r'(\d+)', str(v)) if p]
+    order = sorted(range(len(uniques)), key=lambda i: key(uniques[i]))
+    rank = np.empty(len(uniques), dtype=np.int64)
+    rank[order] = np.arange(len(uniques))
+    return rank[codes], dict(zip(uniques, rank.tolist()))
+
+def load_served(reports, combined_tmpl, rules=None):
+    """Enriched findings of one or more reports; with several, IDs and CIS are prefixed with the host."""
+    frames = []
+    for report, host in zip(reports, host_labels(reports)):
+        df = enrich(load_report(report), combined_tmpl, rules)
+        if len(reports) > 1:
+            df['ID'] = host + ':' + df['ID'].astype(str)
+            df['CIS'] = host + ' ' + df['CIS'].astype(str)
+        frames.append(df)
+    df = frames[0] if len(frames) == 1 else compact_findings(pd.concat(frames, ignore_index=True))
+    return split_results(df)
+
+def findings_index(df_failed, df_passed, fixed_ids=()):
+    """
+    The served findings, built once: records in FINDING_FIELDS order (what the app's tables render) plus
+    numpy columns to filter and sort on - failed / fixed flags, score, natural CIS and category ranks -
+    and a lowercased search text per row.
+    """
+    records = finding_records(df_failed) + finding_records(df_passed)
+    cols = dict(zip(FINDING_FIELDS, map(list, zip(*records)))) if records else {f: [] for f in FINDING_FIELDS}
+    ids = pd.Series(cols['id'], dtype=object)
+    failed = np.zeros(len(records), dtype=bool)
+    failed[:len(df_failed)] = True
+    cis_rank, _ = natural_ranks(cols['cis'])
+    cat_rank, categories = natural_ranks(cols['cat'])
+    text = pd.Series([' '.join(v) for v in zip(*(cols[f] for f in SEARCH_FIELDS))], dtype=object).str.lower()
+    return {'records': records, 'ids': ids, 'failed': failed, 'fixed': ids.isin(set(map(str, fixed_ids))).to_numpy() & failed,
+            'score': np.array(cols['score'], dtype=np.int64), 'cis': cis_rank, 'cat': cat_rank, 'categories': categories,
+            'text': text, 'orders': {}, 'searches': {}, 'lock': threading.Lock()}
+
+def sort_order(index, field, descending=False):
+    """All row positions ordered on `field` (ties in CIS order), computed once per field and direction."""
+    key = (field, descending)
+    if key not in index['orders']:
+        values = index[field]
+        index['orders'][key] = np.lexsort((index['cis'], -values if descending else values))
+    return index['orders'][key]
+
+def search_mask(index, term):
+    """Rows whose text contains `term`; a cached shorter term it contains narrows the rows to scan (typing ahead)."""
+    cache = index['searches']
+    if term not in cache:
+        base = next((cache[t] for t in sorted(cache, key=len, reverse=True) if t in term), None)
+        rows = np.flatnonzero(base) if base is not None else np.arange(len(index['text']))
+        mask = np.zeros(len(index['text']), dtype=bool)
+        mask[rows] = index['text'].iloc[rows].str.contains(term, regex=False).to_numpy(dtype=bool)
+        if len(cache) >= SEARCH_CACHE_SIZE: cache.pop(next(iter(cache)))
+        cache[term] = mask
+    return cache[term]
+
+def query_findings(index, params):
+    """
+    One DataTables server-side request (parse_qs of draw, start, length, order[0][column|dir], columns[i][data],
+    columns[i][search][value], search[value] and kind = pending / fixed / passed) -> its response with one page of rows.
+    Columns are matched by their data field index, so reordered columns in the browser don't matter.
+    """
+    get = lambda k, default='': params.get(k, [default])[0]
+    field = lambda i: FINDING_FIELDS[int(get(f'columns[{i}][data]'))] if get(f'columns[{i}][data]').isdigit() else None
+    kind = get('kind', 'pending')
+    failed, fixed = index['failed'], index['fixed']
+    mask = {'pending': failed & ~fixed, 'fixed': fixed, 'passed': ~failed}.get(kind)
+    if mask is None: raise ValueError(f"Unknown kind: {kind}")
+    total = int(mask.sum())
+
+    for key in params:
+        col = re.fullmatch(r'columns\[(\d+)\]\[search\]\[value\]', key)
+        if col and get(key) and field(col.group(1)) == 'cat': mask = mask & (index['cat'] == index['categories'].get(get(key), -1))
+    term = get('search[value]').strip().lower()
+    if term: mask = mask & search_mask(index, term)
+
+    by = field(get('order[0][column]', '-'))
+    order = sort_order(index, by, get('order[0][dir]') == 'desc') if by in SORT_FIELDS else sort_order(index, 'cis')
+    rows = order[mask[order]]
+    start, length = max(int(get('start', 0)), 0), int(get('length', 50))
+    page = rows[start:] if length < 0 else rows[start:start + length]
+    records = index['records']
+    return {'draw': int(get('draw', 0)), 'recordsTotal': total, 'recordsFiltered': len(rows), 'data': [records[r] for r in page]}
+
+def state_counts(index):
+    fixed = index['fixed']
+    n_failed = int(index['failed'].sum())
+    return {'pending': n_failed - int(fixed.sum()), 'fixed': int(fixed.sum()), 'passed': len(fixed) - n_failed}
+
+def fixed_ids(index):
+    return list(dict.fromkeys(index['ids'][index['fixed']].tolist()))
+
+def set_fixed(index, ids, fixed, state_path=None):
+    """
+    Marks failed findings as fixed (or pending again) and saves the fixed IDs to state_path (the app's progress.json
+    format). The flags are swapped in as a new array, so concurrent queries see either the old or the new state.
+    Returns the number of rows moved.
+    """
+    with index['lock']:
+        hit = index['ids'].isin(set(map(str, ids))).to_numpy() & index['failed'] & (index['fixed'] != fixed)
+        moved = int(hit.sum())
+        if moved:
+            flags = index['fixed'].copy()
+            flags[hit] = fixed
+            index['fixed'] = flags
+            if state_path: write_status(state_path, fixed_ids(index))
+    return moved
+
+def gzip_bytes(data):
+    c = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    return c.compress(data) + c.flush()
+
+def findings_handler():
+    """The request handler class; http.server is only imported when serving."""
+    from http.server import BaseHTTPRequestHandler
+
+    class FindingsHandler(BaseHTTPRequestHandler):
+        """GET / (the app), GET /api/findings (one table page), GET /api/state, POST /api/state {"fixed"|"pending": [ids]}."""
+        protocol_version = 'HTTP/1.1'
+
+        def send_body(self, body, content_type='application/json', status=200):
+            body = body if isinstance(body, bytes) else json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            if len(body) > 1024 and 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = gzip_bytes(body)
+                self.send_response(status)
+                self.send_header('Content-Encoding', 'gzip')
+            else: self.send_response(status)
+            self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            index = self.server.index
+            try:
+                if url.path in ('/', '/index.html'): self.send_body(self.server.page, 'text/html')
+                elif url.path == '/api/findings': self.send_body(query_findings(index, parse_qs(url.query, keep_blank_values=True)))
+                elif url.path == '/api/state': self.send_body({**state_counts(index), 'ids': fixed_ids(index)})
+                else: self.send_body({'error': 'not found'}, status=404)
+            except ValueError as e: self.send_body({'error': str(e)}, status=400)
+
+        def do_POST(self):
+            if urlsplit(self.path).path != '/api/state': return self.send_body({'error': 'not found'}, status=404)
+            # Only the app itself may change state: other pages in the same browser can POST here too
+            origin = self.headers.get('Origin')
+            if origin is not None and origin not in (self.server.origins or {f"http://{self.headers.get('Host')}"}):
+                return self.send_body({'error': 'cross-origin request refused'}, status=403)
+            if self.headers.get('Content-Type', '').split(';')[0].strip().lower() != 'application/json':
+                return self.send_body({'error': 'expected Content-Type: application/json'}, status=415)
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                to_fixed = 'fixed' in body
+                moved = set_fixed(self.server.index, body['fixed' if to_fixed else 'pending'], to_fixed, self.server.state_path)
+            except (ValueError, KeyError, TypeError) as e: return self.send_body({'error': f"bad request: {e}"}, status=400)
+            self.send_body({**state_counts(self.server.index), 'moved': moved})
+
+        def log_message(self, fmt, *args): pass  # one line per table page would drown the console
+    return FindingsHandler
+
+LOOPBACK_NAMES = {'127.0.0.1', 'localhost', '::1'}
+
+def server_origins(host, port):
+    """The origins the app is loaded from (None for a wildcard bind: then it is whatever Host the browser used)."""
+    if host in ('', '0.0.0.0', '::'): return None
+    names = LOOPBACK_NAMES if host in LOOPBACK_NAMES else {host}
+    return {f"http://{f'[{n}]' if ':' in n else n}:{port}" for n in names}
+
+def serve_findings(reports, templates, host='127.0.0.1', port=8765, state_path=None, rules=None, cache_dir=DEFAULT_CACHE_DIR, offline=False):
+    """
+    Loads and enriches the reports once and serves the HTML app with server-side tables: paging, sorting, the category
+    filter and search run here on the indexed findings, the browser only holds the page on screen. The Fixed IDs
+    are kept in state_path (default: <first report>_progress.json) and picked up again on the next start.
+    """
+    t0 = time.perf_counter()
+    df, df_failed, df_passed = load_served(reports, load_templates(templates, cache_dir), rules)
+    state_path = state_path or f"{os.path.splitext(reports[0])[0]}_progress.json"
+    saved = []
+    if os.path.exists(state_path):
+        with open(state_path, encoding='utf-8') as f: saved = json.load(f)
+    index = findings_index(df_failed, df_passed, saved)
+    rows, n_failed, n_passed = len(df), len(df_failed), len(df_passed)
+    cats = sorted(str(c) for c in df['Category'].unique() if str(c) != 'nan')
+    page = ''.join(html_shell(compliance_score(n_passed, rows), rows, n_passed, n_failed, cats, offline, server=True))
+    del df, df_failed, df_passed  # the index holds everything the API needs
+
+    from http.server import ThreadingHTTPServer
+    server = ThreadingHTTPServer((host, port), findings_handler())
+    server.daemon_threads = True
+    server.index, server.page, server.state_path = index, page.encode('utf-8'), state_path
+    server.origins = server_origins(host, server.server_address[1])
+    print(f"✅ {rows} findings indexed in {time.perf_counter() - t0:.1f}s ({state_counts(index)['fixed']} fixed, state: {state_path})")
+    print(f"🌐 Serving on http://{host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try: server.serve_forever()
+    except KeyboardInterrupt: pass
+    finally: server.server_close()
+    print("🛑 Server stopped.")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="KittyPorter - Make Hardening Kitty Reports Great Again")
+    parser.add_argument('--offline', action='store_true', help="Inline the vendored JS/CSS into the HTML app (no CDN / font requests)")
+    parser.add_argument('--compress-html', action='store_true', help="Dictionary-encoded, gzip-compressed findings in the HTML app")
+    sub = parser.add_subparsers(dest='command')
+
+    # Conversion options shared by batch and watch
+    conv = argparse.ArgumentParser(add_help=False)
+    conv.add_argument('-t', '--templates', nargs='*', default=[], help="Template CSV file(s)")
+    conv.add_argument('-o', '--out-dir', help="Output directory (default: next to each report)")
+    conv.add_argument('-w', '--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    conv.add_argument('-r', '--rules', help="JSON scoring rules file (weights, keywords, bonus)")
+    conv.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Template catalog cache directory")
+    conv.add_argument('--no-cache', action='store_true', help="Always re-parse the templates (and never reuse outputs)")
+    conv.add_argument('--reuse-outputs', action='store_true',
+                      help="Copy the previous outputs of unchanged reports (same report, templates, rules, options, version)")
+    conv.add_argument('--formula-mode', choices=['classic', 'lean'], default=DEFAULT_OPTIONS['formula_mode'],
+                      help="Excel Stats formulas: whole-column COUNTIFS (classic) or bounded helper-key COUNTIF (lean)")
+    conv.add_argument('--streaming', action='store_true', help="Process each report in chunks with bounded memory")
+    conv.add_argument('--chunk-size', type=int, default=DEFAULT_OPTIONS['chunk_size'], help="Rows per chunk in streaming mode")
+    conv.add_argument('--writers', choices=['thread', 'process', 'serial'], default=DEFAULT_OPTIONS['writers'],
+                      help="How the Excel and HTML writers of one report run side by side")
+    conv.add_argument('--instrument', metavar='LOG',
+                      help="Append per-stage wall/CPU time, rows and peak memory per host to this NDJSON log (writers run serially)")
+    conv.add_argument('--profile-dir', help="Write a cProfile dump per host and top-level stage here (writers run serially)")
+    conv.add_argument('--store', metavar='DB', help="Append every run's findings to this SQLite history (adds a Trend sheet)")
+    conv.add_argument('--export', choices=['parquet', 'feather'], help="Also write the enriched findings in this columnar format (needs pyarrow)")
+    conv.add_argument('--export-dir', help="Write the exports into host=<host>/date=<scan date> partitions under this directory")
+    # SUPPRESS keeps a top-level --offline from being reset by the subcommand's default
+    conv.add_argument('--offline', action='store_true', default=argparse.SUPPRESS, help="Self-contained HTML app, see above")
+    conv.add_argument('--compress-html', action='store_true', default=argparse.SUPPRESS, help="Compressed HTML app payload, see above")
+
+    p_batch = sub.add_parser('batch', parents=[conv], help="Convert many reports without the GUI")
+    p_batch.add_argument('reports', nargs='+', help="Report CSV files, directories or glob patterns")
+
+    p_watch = sub.add_parser('watch', parents=[conv], help="Convert reports as they land in a directory (runs until stopped)")
+    p_watch.add_argument('directory', help="Directory to watch for report CSVs")
+    p_watch.add_argument('--settle', type=float, default=2.0, help="Seconds a file's size/mtime must stay unchanged before it is converted")
+    p_watch.add_argument('--poll', type=float, default=5.0, help="Rescan interval in seconds (the only trigger without inotify)")
+    p_watch.add_argument('--queue-size', type=int, default=None, help="Max reports handed to the workers at once (default: 2 x workers)")
+    p_watch.add_argument('--status-file', help="Keep the queue / throughput counters in this JSON file")
+    p_watch.add_argument('--stats-interval', type=float, default=60, help="Seconds between counter lines on the console")
+    p_watch.add_argument('--archive', help="Move converted reports here (failed ones stay in place)")
+    p_watch.add_argument('--skip-existing', action='store_true', help="Ignore the reports already in the directory at start")
+    p_watch.add_argument('--idle-exit', type=float, default=None, help="Exit after this many seconds without any work")
+
+    p_fleet = sub.add_parser('fleet', help="One controls x hosts compliance workbook for many reports")
+    p_fleet.add_argument('reports', nargs='+', help="Report CSV files, directories or glob patterns")
+    p_fleet.add_argument('-o', '--output', help="Workbook path (default: Fleet_Report_<date>.xlsx)")
+    p_fleet.add_argument('-w', '--workers', type=int, default=None, help="Worker processes for loading (default: CPU count)")
+    p_fleet.add_argument('--top', type=int, default=25, help="Number of most-failed controls to chart")
+
+    p_diff = sub.add_parser('diff', help="Only the controls whose result changed between two runs")
+    p_diff.add_argument('old', help="Previous run: report CSV or a KittyPorter .xlsx")
+    p_diff.add_argument('new', help="New run: report CSV or a KittyPorter .xlsx")
+    p_diff.add_argument('-t', '--templates', nargs='*', default=[], help="Template CSV file(s) for CSV inputs")
+    p_diff.add_argument('-o', '--output', help="Delta report (.xlsx or .csv) or a directory for it (default: <new>_Delta_<date>.xlsx)")
+    p_diff.add_argument('-r', '--rules', help="JSON scoring rules file (weights, keywords, bonus)")
+    p_diff.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Template catalog cache directory")
+
+    p_serve = sub.add_parser('serve', help="Serve the HTML app from a local server that pages, sorts and searches the findings")
+    p_serve.add_argument('reports', nargs='+', help="Report CSV file(s); several are shown together with the host in front of each ID")
+    p_serve.add_argument('-t', '--templates', nargs='*', default=[], help="Template CSV file(s)")
+    p_serve.add_argument('-r', '--rules', help="JSON scoring rules file (weights, keywords, bonus)")
+    p_serve.add_argument('--host', default='127.0.0.1', help="Address to bind (default: localhost only)")
+    p_serve.add_argument('--port', type=int, default=8765, help="Port (0 = any free port)")
+    p_serve.add_argument('--state', help="Fixed IDs file, same format as the app's progress.json (default: <report>_progress.json)")
+    p_serve.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Template catalog cache directory")
+    p_serve.add_argument('--offline', action='store_true', default=argparse.SUPPRESS, help="Inline the vendored JS/CSS, see above")
+
+    p_fix = sub.add_parser('remediate', help="One PowerShell script per report fixing its failed checks, grouped by registry key, plus a rollback script")
+    p_fix.add_argument('reports', nargs='+', help="Report CSV files, directories or glob patterns")
+    p_fix.add_argument('-t', '--templates', nargs='*', default=[], help="Template CSV file(s)")
+    p_fix.add_argument('-o', '--out-dir', help="Output directory (default: next to each report)")
+    p_fix.add_argument('-r', '--rules', help="JSON scoring rules file (weights, keywords, bonus)")
+    p_fix.add_argument('--min-risk', type=int, default=0, help="Only findings with at least this RiskScore")
+    p_fix.add_argument('--category', nargs='*', default=None, help="Only findings in these categories")
+    p_fix.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Template catalog cache directory")
+
+    p_imp = sub.add_parser('import', help="Read analyst statuses and notes back from returned workbooks into the findings store")
+    p_imp.add_argument('workbooks', nargs='+', help="KittyPorter .xlsx files, directories or glob patterns")
+    p_imp.add_argument('--store', required=True, metavar='DB', help="SQLite findings store; later runs with --store carry the statuses over")
+    p_imp.add_argument('--host', help="Host of all given workbooks (default: from each file name, <host>_Report_<date>.xlsx)")
+    p_imp.add_argument('-w', '--workers', type=int, default=None, help="Worker processes for reading (default: CPU count)")
+
+    p_hist = sub.add_parser('history', help="Query the findings store: latest score per host, a host's trend or a control")
+    p_hist.add_argument('store', help="SQLite findings store (batch --store)")
+    p_hist.add_argument('--host', help="Score trend of this host")
+    p_hist.add_argument('--control', help="Hosts whose latest run fails this control ID")
+    p_hist.add_argument('-o', '--output', help="Also write the result to this CSV")
+    return parser.parse_args(argv)
+
+def conversion_options(args):
+    return {'formula_mode': args.formula_mode, 'streaming': args.streaming, 'chunk_size': args.chunk_size,
+            'offline': args.offline, 'compress_html': args.compress_html,
+            'output_cache': os.path.join(args.cache_dir, 'outputs') if args.reuse_outputs and not args.no_cache else None,
+            'writers': args.writers, 'instrument': args.instrument, 'profile_dir': args.profile_dir, 'store': args.store,
+            'export': args.export, 'export_dir': args.export_dir}
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'batch':
+        reports = collect_files(args.reports)
+        if not reports:
+            print("No report CSV files found.")
+            return 1
+        try:
+            results = run_batch(reports, args.templates, args.out_dir, args.workers, load_rules(args.rules),
+                                None if args.no_cache else args.cache_dir, conversion_options(args))
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        return 1 if any(r['error'] for r in results) else 0
+    if args.command == 'watch':
+        if not os.path.isdir(args.directory):
+            print(f"Not a directory: {args.directory}")
+            return 1
+        stats = watch_folder(args.directory, args.templates, args.out_dir, args.workers, load_rules(args.rules),
+                             None if args.no_cache else args.cache_dir, conversion_options(args),
+                             {'settle': args.settle, 'poll': args.poll, 'queue_size': args.queue_size, 'status_file': args.status_file,
+                              'stats_interval': args.stats_interval, 'archive': args.archive, 'skip_existing': args.skip_existing,
+                              'idle_exit': args.idle_exit})
+        return 1 if stats['failed'] else 0
+    if args.command == 'fleet':
+        reports = collect_files(args.reports)
+        if not reports:
+            print("No report CSV files found.")
+            return 1
+        output = args.output or f"Fleet_Report_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx"
+        fleet = run_fleet(reports, output, args.workers, args.top)
+        return 0 if fleet['hosts'] else 1
+    if args.command == 'diff':
+        try: run_diff(args.old, args.new, args.templates, args.output, load_rules(args.rules), args.cache_dir)
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            return 1
+        return 0
+    if args.command == 'remediate':
+        reports = collect_files(args.reports)
+        if not reports:
+            print("No report CSV files found.")
+            return 1
+        if args.out_dir: os.makedirs(args.out_dir, exist_ok=True)
+        run_remediation(reports, args.templates, args.out_dir, args.min_risk, args.category, load_rules(args.rules), args.cache_dir)
+        return 0
+    if args.command == 'serve':
+        reports = collect_files(args.reports)
+        if not reports:
+            print("No report CSV files found.")
+            return 1
+        serve_findings(reports, args.templates, args.host, args.port, args.state, load_rules(args.rules), args.cache_dir, args.offline)
+        return 0
+    if args.command == 'import':
+        workbooks = collect_files(args.workbooks, '.xlsx', skip='~$')  # ~$: Excel's lock files
+        if not workbooks:
+            print("No workbooks found.")
+            return 1
+        results = import_workbooks(workbooks, args.store, args.workers, args.host)
+        for r in results:
+            print(f"❌ {os.path.basename(r['workbook'])}: {r['error']}" if r['error'] else
+                  f"✅ {os.path.basename(r['workbook'])} -> {r['host']}: {r['statuses']} statuses, {r['notes']} notes")
+        ok = sum(1 for r in results if not r['error'])
+        print(f"\n🎉 {ok}/{len(results)} workbooks imported into {args.store}.")
+        return 0 if ok == len(results) else 1
+    if args.command == 'history':
+        if not os.path.exists(args.store):
+            print(f"Findings store not found: {args.store}")
+            return 1
+        con = open_store(args.store)
+        if args.host: result = run_history(con, args.host).drop(columns='run_id')
+        elif args.control: result = failing_hosts(con, args.control)
+        else: result = latest_runs(con)
+        con.close()
+        print(result.to_string(index=False) if len(result) else "No matching runs.")
+        if args.output: result.to_csv(args.output, index=False)
+        return 0
+
+    report, templates = select_files_gui()
+    if not report: return
+    
+    res = process_report(report, load_templates(templates), options={'offline': args.offline, 'compress_html': args.compress_html})
+    print("⏱️ " + ", ".join(f"{name}: {sec:.2f}s" for name, sec in res['timings'].items()))
+    if res['error']:
+        print(f"❌ {res['error']}")
+        return 1
     print("\n🎉 Full Suite Generated Successfully!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+KittyPorter benchmark: synthesizes HardeningKitty report / template CSVs of a given size,
+times every stage of the real pipeline (wall time + peak memory) and writes the results as JSON.
+
+    python benchmark.py --rows 1000 100000 1000000 --templates 1 20 200 --categories 10 500 -o bench.json
+    python benchmark.py --rows 100000 --compare bench.json      # exit code 1 on a regression
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import itertools
+import platform
+import statistics
+import subprocess
+import tempfile
+import contextlib
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+import KittyPorter as kp
+
+try: import resource  # POSIX only
+except ImportError: resource = None
+
+BENCH_VERSION = 2  # bump when the result layout changes
+STARTUP_BUDGET = 0.25  # seconds for `python KittyPorter.py --help` (see README, Startup)
+LAZY_MODULES = ['pandas', 'numpy', 'xlsxwriter', 'openpyxl', 'pyarrow', 'tkinter']  # must not load on `import KittyPorter`
+
+CATEGORY_NAMES = [
+    'Account Policies', 'Administrative Templates: LAPS', 'Administrative Templates: Network', 'Administrative Templates: System',
+    'Advanced Audit Policy Configuration', 'Microsoft Defender Antivirus', 'Microsoft Defender Exploit Guard', 'MS Security Guide',
+    'Network Security', 'PowerShell', 'Security Options', 'User Rights Assignment', 'Windows Firewall', 'Windows Components',
+]
+REG_KEYS = [
+    'HKLM:\\SOFTWARE\\Policies\\Microsoft\\Windows\\System', 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Lsa',
+    'HKEY_LOCAL_MACHINE\\SOFTWARE\\Policies\\Microsoft\\Windows Defender', 'HKLM:\\SYSTEM\\CurrentControlSet\\Services\\LanmanServer\\Parameters',
+    'HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System', 'HKCU:\\Software\\Policies\\Microsoft\\Windows\\Control Panel',
+    'HKLM\\SOFTWARE\\Policies\\Microsoft\\WindowsFirewall\\DomainProfile', 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\SecurityProviders\\WDigest',
+]
+SETTINGS = ['Audit Credential Validation', 'Configure SMB v1 client driver', 'Turn off multicast name resolution (LLMNR)',
+            'Enable Structured Exception Handling Overwrite Protection', 'Allow Print Spooler to accept client connections',
+            'Minimum password length', 'Turn on PowerShell Script Block Logging', 'Configure LSASS to run as a protected process',
+            'Network security: Restrict NTLM', 'Prevent enabling lock screen camera', 'Turn off Autoplay']
+SEVERITIES = ['Low', 'Medium', 'High']
+
+# --- Synthetic data ---
+
+def category_names(n):
+    if n <= len(CATEGORY_NAMES): return CATEGORY_NAMES[:n]
+    return [f"{CATEGORY_NAMES[i % len(CATEGORY_NAMES)]} {i // len(CATEGORY_NAMES) + 1}" for i in range(n)]
+
+def synth_catalog(controls, categories, seed):
+    """One row per control, with HardeningKitty finding list columns."""
+    rng = kp.np.random.default_rng(seed)
+    n = kp.np.arange(controls)
+    cats = kp.np.array(category_names(categories), dtype=object)
+    setting = kp.np.array(SETTINGS, dtype=object)[n % len(SETTINGS)]
+    registry = n % 6 != 0  # the rest are accesschk / auditpol / secedit style checks
+    return kp.pd.DataFrame({
+        'ID': (n + 1000).astype(str),
+        'Category': cats[rng.integers(0, len(cats), controls)],
+        'Name': [f"{s} ({i})" for s, i in zip(setting, n)],
+        'Method': kp.np.where(registry, 'Registry', kp.np.array(['accesschk', 'auditpol', 'secedit'], dtype=object)[n % 3]),
+        'MethodArgument': '',
+        # a key per ~5 controls, so paths repeat the way they do in real finding lists
+        'RegistryPath': kp.np.where(registry, [f"{REG_KEYS[i % len(REG_KEYS)]}\\Sub{i // 5 % 97}" for i in n], ''),
+        'RegistryItem': kp.np.where(registry, [f"Value{i}" for i in n], ''),
+        'ClassName': '', 'Namespace': '', 'Property': '', 'DefaultValue': '',
+        'RecommendedValue': (n % 3).astype(str),
+        'Operator': '=',
+        'Severity': kp.np.array(SEVERITIES, dtype=object)[rng.integers(0, 3, controls)],
+    })
+
+def write_templates(catalog, n_templates, path_fmt):
+    """Splits the catalog over n_templates finding lists; each one repeats a slice of the previous (later wins)."""
+    paths, bounds = [], kp.np.linspace(0, len(catalog), n_templates + 1).astype(int)
+    for t, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])):
+        part = catalog.iloc[max(0, lo - (hi - lo) // 10):hi]
+        part.to_csv(path_fmt.format(t), index=False)
+        paths.append(path_fmt.format(t))
+    return paths
+
+def write_report(catalog, rows, path, seed):
+    """rows checks cycling over the catalog (a merged multi-host report past its size), ~2% unknown IDs, ~60% passed."""
+    rng = kp.np.random.default_rng(seed + 1)
+    rep = catalog.iloc[kp.np.arange(rows) % len(catalog)].reset_index(drop=True)
+    passed = rng.random(rows) < 0.6
+    unknown = rng.random(rows) < 0.02
+    result = rng.integers(0, 3, rows).astype(str)
+    kp.pd.DataFrame({
+        'ID': rep['ID'].where(~unknown, '99' + rep['ID']), 'Category': rep['Category'], 'Name': rep['Name'],
+        'Severity': rep['Severity'].where(~passed, 'Passed'), 'Result': kp.np.where(passed, rep['RecommendedValue'], result),
+        'Recommended': rep['RecommendedValue'], 'TestResult': kp.np.where(passed, 'Passed', 'Failed'),
+        'SeverityFinding': rep['Severity'].where(~passed, 'Passed'),
+    }).to_csv(path, index=False)
+
+def make_dataset(data_dir, rows, templates, categories, controls, seed):
+    """Writes (or reuses) the CSVs of one case; returns (report, [templates])."""
+    tag = f"c{controls}_k{categories}_s{seed}"
+    report = os.path.join(data_dir, f"report_{rows}_{tag}.csv")
+    path_fmt = os.path.join(data_dir, f"template_{templates}_{tag}_{{}}.csv")
+    tmpl = [path_fmt.format(t) for t in range(templates)]
+    if not all(os.path.exists(p) for p in [report] + tmpl):
+        catalog = synth_catalog(controls, categories, seed)
+        tmpl = write_templates(catalog, templates, path_fmt)
+        if not os.path.exists(report): write_report(catalog, rows, report, seed)
+    return report, tmpl
+
+# --- Measurement ---
+
+def peak_rss_mb():
+    if resource is None: return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)  # bytes on macOS, KiB elsewhere
+
+def check_startup(repeat=5):
+    """In fresh interpreters: the lazy modules loaded by `import KittyPorter` (should be none) and the best `--help` wall time."""
+    here = os.path.dirname(os.path.abspath(kp.__file__))
+    probe = f"import sys, json, KittyPorter; print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+    eager = json.loads(subprocess.run([sys.executable, '-c', probe], cwd=here, capture_output=True, text=True, check=True).stdout)
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(here, 'KittyPorter.py'), '--help'], capture_output=True, check=True)
+        times.append(time.perf_counter() - t0)
+    return {'eager_imports': eager, 'help_seconds': round(min(times), 3), 'budget_seconds': STARTUP_BUDGET}
+
+def measure(report, templates, options, trace):
+    """
+    One pass through the real entry points (parse_templates, process_report) with the --instrument log on:
+    {stage: {parent, wall_s, peak_mb}}; peak_mb (above the stage's starting point) only with trace.
+    """
+    with tempfile.TemporaryDirectory(prefix='kp_bench_') as out_dir, open(os.devnull, 'w') as null, contextlib.redirect_stdout(null):
+        log = os.path.join(out_dir, 'stages.ndjson')
+        opts = {**options, 'instrument': log}
+        with kp.instrumented(opts, memory=trace):
+            with kp.stage('parse_templates') as st:
+                combined_tmpl, _ = kp.parse_templates(templates)
+                st['rows'] = len(combined_tmpl)
+            kp.process_report(report, combined_tmpl, out_dir, kp.load_rules(), opts)
+        with open(log, encoding='utf-8') as f: records = [json.loads(line) for line in f]
+    # Stages repeat per chunk in streaming mode: summed time, highest peak
+    stages = {}
+    for r in records:
+        st = stages.setdefault(r['stage'], {'parent': r['parent'], 'wall_s': 0, 'peak_mb': None})
+        st['wall_s'] += r['wall_s']
+        if r['peak_mb'] is not None: st['peak_mb'] = max(st['peak_mb'] or 0, r['peak_mb'])
+    # Records are written as stages finish, children first: list every stage right before its sub-stages
+    ordered = {}
+    def add(parent):
+        for name, st in stages.items():
+            if st['parent'] == parent and name not in ordered: ordered[name] = st; add(name)
+    add(None)
+    return ordered
+
+def run_case(case, data_dir, options, repeat, memory):
+    """Runs in its own process, so peak RSS and warm caches don't leak from one case into the next."""
+    t0 = time.perf_counter()
+    report, templates = make_dataset(data_dir, case['rows'], case['templates'], case['categories'], case['controls'], case['seed'])
+    generate = time.perf_counter() - t0
+    measure(*make_dataset(data_dir, 100, 1, case['categories'], case['controls'], case['seed']), options, trace=False)  # warm-up: lazy imports
+    passes = [measure(report, templates, options, trace=False) for _ in range(repeat)]
+    peaks = measure(report, templates, options, trace=True) if memory else {}
+    stages = {name: {'parent': rec['parent'], 'seconds': round(statistics.median(p[name]['wall_s'] for p in passes), 4),
+                     'min_seconds': round(min(p[name]['wall_s'] for p in passes), 4),
+                     'peak_mb': peaks[name]['peak_mb'] if name in peaks else None} for name, rec in passes[0].items()}
+    total = sum(s['seconds'] for s in stages.values() if s['parent'] is None)  # nested stages are part of their parent's time
+    return {**case, 'report_mb': round(os.path.getsize(report) / 2 ** 20, 2), 'generate_seconds': round(generate, 2),
+            'stages': stages, 'total_seconds': round(total, 4), 'peak_rss_mb': peak_rss_mb()}
+
+def environment():
+    with open(kp.__file__, 'rb') as f: code = hashlib.sha256(f.read()).hexdigest()[:12]
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(kp.__file__)),
+                                capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError): commit = None
+    return {'code_sha256': code, 'git_commit': commit, 'python': platform.python_version(), 'pandas': kp.pd.__version__,
+            'numpy': kp.np.__version__, 'xlsxwriter': kp.xlsxwriter.__version__, 'pyarrow': kp.HAS_PYARROW,
+            'platform': platform.platform(), 'cpu_count': os.cpu_count()}
+
+def case_key(case):
+    return (case['rows'], case['templates'], case['categories'], case['controls'], case['seed'])
+
+def compare(baseline, current, threshold, min_seconds=0.05):
+    """Prints stage-by-stage ratios against a previous result file; returns the regressions (slower than 1 + threshold)."""
+    old = {case_key(c): c for c in baseline['cases']}
+    if baseline.get('options') != current['options']: print("⚠️ Options differ from the baseline run, ratios are not like for like.")
+    regressions = []
+    print(f"\n{'Case':<34} {'Stage':<22} {'Base(s)':>9} {'Now(s)':>9} {'Ratio':>7}")
+    for case in current['cases']:
+        prev = old.get(case_key(case))
+        if not prev: continue
+        label = f"{case['rows']} rows/{case['templates']} tmpl/{case['categories']} cat"
+        for name, st in case['stages'].items():
+            if name not in prev['stages']: continue
+            before, now = prev['stages'][name]['seconds'], st['seconds']
+            ratio = now / before if before else float('inf')
+            slow = max(before, now) >= min_seconds and ratio > 1 + threshold  # tiny stages are mostly noise
+            if slow: regressions.append((label, name, before, now))
+            print(f"{label:<34} {name:<22} {before:>9.3f} {now:>9.3f} {ratio:>6.2f}x{'  ❌' if slow else ''}")
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="KittyPorter benchmark on synthetic HardeningKitty data")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000], help="Report sizes (rows)")
+    parser.add_argument('--templates', type=int, nargs='+', default=[20], help="Number of template CSVs")
+    parser.add_argument('--categories', type=int, nargs='+', default=[50], help="Number of distinct categories")
+    parser.add_argument('--controls', type=int, default=2000, help="Distinct controls in the template catalog")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed (same seed = same data)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed passes per case (the median is reported)")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the extra tracemalloc pass (peak memory per stage)")
+    parser.add_argument('--data-dir', help="Keep / reuse the generated CSVs here (default: a temp dir, removed)")
+    parser.add_argument('-o', '--output', help="Result JSON (default: bench_<date>.json)")
+    parser.add_argument('--compare', help="Previous result JSON; exit code 1 if a stage got slower than --threshold")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Allowed slowdown ratio for --compare (0.2 = 20%%)")
+    parser.add_argument('--formula-mode', choices=['classic', 'lean'], default=kp.DEFAULT_OPTIONS['formula_mode'])
+    parser.add_argument('--streaming', action='store_true', help="Benchmark the chunked pipeline (stream_report)")
+    parser.add_argument('--chunk-size', type=int, default=kp.DEFAULT_OPTIONS['chunk_size'])
+    parser.add_argument('--offline', action='store_true')
+    parser.add_argument('--compress-html', action='store_true')
+    parser.add_argument('--check-startup', action='store_true', help="Only check the startup budget (exit code 1 when over it)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = {'formula_mode': args.formula_mode, 'streaming': args.streaming, 'chunk_size': args.chunk_size,
+               'offline': args.offline, 'compress_html': args.compress_html}
+    cases = [{'rows': r, 'templates': t, 'categories': c, 'controls': max(args.controls, t), 'seed': args.seed}
+             for r, t, c in itertools.product(args.rows, args.templates, args.categories)]
+    startup = check_startup()
+    startup_ok = not startup['eager_imports'] and startup['help_seconds'] <= STARTUP_BUDGET
+    print(f"{'🎉' if startup_ok else '❌'} Startup: --help in {startup['help_seconds']:.3f}s (budget {STARTUP_BUDGET:.2f}s), "
+          f"eager imports: {', '.join(startup['eager_imports']) or 'none'}")
+    if args.check_startup: return 0 if startup_ok else 1
+    result = {'version': BENCH_VERSION, 'created': datetime.now().isoformat(timespec='seconds'),
+              'environment': environment(), 'options': options, 'repeat': args.repeat, 'startup': startup, 'cases': []}
+
+    with contextlib.ExitStack() as stack:
+        data_dir = args.data_dir or stack.enter_context(tempfile.TemporaryDirectory(prefix='kp_bench_data_'))
+        os.makedirs(data_dir, exist_ok=True)
+        for i, case in enumerate(cases, 1):
+            print(f"⏱️ [{i}/{len(cases)}] {case['rows']} rows, {case['templates']} templates, {case['categories']} categories...")
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn')) as pool:
+                res = pool.submit(run_case, case, data_dir, options, args.repeat, not args.no_memory).result()
+            result['cases'].append(res)
+            for name, st in res['stages'].items():
+                peak = f"{st['peak_mb']:>8.1f} MB" if st['peak_mb'] is not None else ''
+                print(f"    {('  ' if st['parent'] else '') + name:<22} {st['seconds']:>8.3f}s {peak}")
+            print(f"    {'total':<22} {res['total_seconds']:>8.3f}s   (peak RSS {res['peak_rss_mb']} MB)")
+
+    output = args.output or f"bench_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
+    with open(output, 'w', encoding='utf-8') as f: json.dump(result, f, indent=2)
+    print(f"✅ Benchmark results: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f: baseline = json.load(f)
+        regressions = compare(baseline, result, args.threshold)
+        print(f"\n{'❌' if regressions else '🎉'} {len(regressions)} stage(s) slower than {args.threshold:.0%} over the baseline.")
+        return 1 if regressions or not startup_ok else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())